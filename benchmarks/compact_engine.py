@@ -0,0 +1,69 @@
+"""
+This module compares the object based and the array-backed (compact) Dijkstra engine in terms of
+runtime and memory on a graph read from a .gra-file.
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+from oellrich_graph import GraphReader
+
+from dijkstra.compact import CompactGraph
+from dijkstra.core import Dijkstra
+
+
+def measure_memory(build) -> tuple:
+    """
+    This function calls build() and returns its result together with the number of bytes that
+    were allocated by it and are still alive afterwards.
+    """
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = build()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, after - before
+
+
+def time_queries(dijkstra: Dijkstra, queries: list[tuple[int, int]]) -> tuple[float, float]:
+    """
+    This function returns the seconds needed to run dijkstra_dist() for all targets and dijkstra()
+    for all source and target pairs of the queries.
+    """
+    start = time.perf_counter()
+    for _, target in queries:
+        dijkstra.dijkstra_dist(target)
+    dist_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for source, target in queries:
+        dijkstra.dijkstra(source, target)
+    query_time = time.perf_counter() - start
+    return dist_time, query_time
+
+
+def main(graph_string: str, query_count: int = 20, seed: int = 0):
+    """
+    This function is the main function of this module. It reads the graph, builds the compact
+    graph and prints memory usage and runtimes of both engines for random queries.
+    """
+    graph, graph_bytes = measure_memory(lambda: GraphReader(graph_string, True).read())
+    compact, compact_bytes = measure_memory(lambda: CompactGraph.from_graph(graph))
+    rng = random.Random(seed)
+    queries = [
+        (rng.randrange(graph.node_count), rng.randrange(graph.node_count))
+        for _ in range(query_count)
+    ]
+    object_times = time_queries(Dijkstra(graph), queries)
+    compact_times = time_queries(Dijkstra(compact), queries)
+    print(f"graph: {graph_string} ({graph.node_count} nodes, {compact.arc_count} arcs)")
+    print(f"memory graph objects: {graph_bytes / 1024:.1f} KiB")
+    print(f"memory compact graph: {compact_bytes / 1024:.1f} KiB")
+    print(f"dijkstra_dist() x{query_count}: {object_times[0]:.3f} s -> {compact_times[0]:.3f} s")
+    print(f"dijkstra() x{query_count}: {object_times[1]:.3f} s -> {compact_times[1]:.3f} s")
+
+
+if __name__ == "__main__":
+    # run from the repository root, e.g. python -m benchmarks.compact_engine
+    GRAPH = sys.argv[1] if len(sys.argv) > 1 else "./test/test-graphs/berlin.gra"
+    main(GRAPH)
@@ -0,0 +1,61 @@
+"""
+This module compares the throughput of full distance vectors computed by Dijkstra.dijkstra_dist(),
+by the delta-stepping engine and, if SciPy is installed, by the vectorized backend, on a graph read
+from a .gra-file or on random grids.
+"""
+import random
+import sys
+import time
+
+from benchmarks.suite import grid_graph
+from dijkstra.cache import CachedGraphReader
+from dijkstra.core import Dijkstra
+from dijkstra.delta import DeltaStepping, auto_delta
+from dijkstra.vectorized import VectorizedDijkstra
+
+
+def vectors_per_second(function, targets: list[int]) -> float:
+    """
+    This function returns the number of distance vectors per second of a function of the target.
+    """
+    start = time.perf_counter()
+    for target in targets:
+        function(target)
+    return len(targets) / (time.perf_counter() - start)
+
+
+def main(graph_string: str, target_count: int = 10, seed: int = 0):
+    """
+    This function is the main function of this module. It prints the distance vectors per second of
+    the engines for random targets, for delta-stepping with several multiples of the mean weight.
+    Given a number instead of a path, a random grid of that side length is used.
+    """
+    if graph_string.isdigit():
+        graph = grid_graph(int(graph_string), seed)
+    else:
+        graph = CachedGraphReader(graph_string).read()
+    rng = random.Random(seed)
+    targets = [rng.randrange(graph.node_count) for _ in range(target_count)]
+    print(f"graph: {graph_string} ({graph.node_count} nodes, {graph.arc_count} arcs)")
+    base = vectors_per_second(Dijkstra(graph, compact=True).dijkstra_dist, targets)
+    print(f"dijkstra_dist(): {base:.1f} vectors/s")
+    for factor in (1, 2, 4, 8, 16, 32):
+        engine = DeltaStepping(graph, auto_delta(graph.f_weights, factor))
+        rate = vectors_per_second(engine.dijkstra_dist, targets)
+        print(
+            f"delta-stepping, delta = {factor} * mean weight: {rate:.1f} vectors/s "
+            f"({rate / base:.2f}x, {engine.buckets} buckets, {engine.phases} phases)"
+        )
+    try:
+        # SciPy is imported when the backend is built
+        vectorized = VectorizedDijkstra(graph)
+    except ImportError:
+        return
+    rate = vectors_per_second(vectorized.dijkstra_dist, targets)
+    print(f"vectorized (SciPy): {rate:.1f} vectors/s ({rate / base:.2f}x)")
+
+
+if __name__ == "__main__":
+    # run from the repository root, e.g. python -m benchmarks.delta or with a grid side: ... 300
+    GRAPH = sys.argv[1] if len(sys.argv) > 1 else "./test/test-graphs/berlin.gra"
+    main(GRAPH)
@@ -0,0 +1,67 @@
+"""
+This module compares the incremental repair of distance vectors after edge weight changes with
+their full recomputation on a graph read from a .gra-file.
+"""
+import random
+import sys
+import time
+
+from dijkstra.cache import CachedGraphReader
+from dijkstra.dynamic import DynamicDistances
+from dijkstra.landmarks import full_search
+
+
+def random_changes(graph, rng: random.Random, count: int) -> list[tuple[int, int, float]]:
+    """
+    This function returns weight changes of random arcs, like closures (ten times heavier),
+    congestion (twice as heavy) and its end (half as heavy).
+    """
+    changes = []
+    while len(changes) < count:
+        i_tail = rng.randrange(graph.node_count)
+        start, end = graph.f_offsets[i_tail], graph.f_offsets[i_tail + 1]
+        if start < end:
+            pos = rng.randrange(start, end)
+            factor = rng.choice((0.5, 2, 10))
+            weight = max(1, int(graph.f_weights[pos] * factor))
+            changes.append((i_tail, graph.f_targets[pos], weight))
+    return changes
+
+
+def main(graph_string: str, root_count: int = 10, rounds: int = 5, seed: int = 0):
+    """
+    This function is the main function of this module. It tracks the backward distances of random
+    targets and prints, for batches of different size, the time to repair them and to compute
+    them again from scratch.
+    """
+    graph = CachedGraphReader(graph_string, use_cache=False).read()
+    rng = random.Random(seed)
+    roots = [rng.randrange(graph.node_count) for _ in range(root_count)]
+    dynamic = DynamicDistances(graph)
+    for i_root in roots:
+        dynamic.add(i_root)
+    print(f"graph: {graph_string} ({graph.node_count} nodes, {graph.arc_count} arcs)")
+    print(f"{root_count} tracked targets, mean of {rounds} batches")
+    for batch_size in (1, 10, 100, 1000):
+        repair_time = full_time = 0.0
+        changed = 0
+        for _ in range(rounds):
+            changes = random_changes(graph, rng, batch_size)
+            start = time.perf_counter()
+            changed += sum(dynamic.update(changes).values())
+            repair_time += time.perf_counter() - start
+            start = time.perf_counter()
+            for i_root in roots:
+                full_search(graph, i_root, backward=True)
+            full_time += time.perf_counter() - start
+        print(
+            f"{batch_size:>5} changes: repair {1000 * repair_time / rounds:8.2f} ms, "
+            f"recompute {1000 * full_time / rounds:8.2f} ms, "
+            f"{changed / rounds / root_count:.0f} nodes changed per target"
+        )
+
+
+if __name__ == "__main__":
+    # run from the repository root, e.g. python -m benchmarks.dynamic
+    GRAPH = sys.argv[1] if len(sys.argv) > 1 else "./test/test-graphs/berlin.gra"
+    main(GRAPH)
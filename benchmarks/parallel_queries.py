@@ -0,0 +1,45 @@
+"""
+This module measures how the throughput of the ParallelExecutor scales with the number of worker
+processes for random path queries.
+"""
+import os
+import random
+import sys
+import time
+
+from dijkstra.cache import CachedGraphReader
+from dijkstra.parallel import ParallelExecutor
+
+
+def main(graph_string: str, query_count: int = 256, seed: int = 0):
+    """
+    This function is the main function of this module. It runs the same random path queries with
+    1, 2, 4, ... workers up to the number of cores and prints runtime, speed-up and the throughput
+    of every worker.
+    """
+    graph = CachedGraphReader(graph_string).read()
+    rng = random.Random(seed)
+    queries = [
+        ("path", rng.randrange(graph.node_count), rng.randrange(graph.node_count))
+        for _ in range(query_count)
+    ]
+    workers = 1
+    base_time = None
+    while workers <= os.cpu_count():
+        with ParallelExecutor(graph_string, workers) as executor:
+            start = time.perf_counter()
+            executor.map(queries)
+            elapsed = time.perf_counter() - start
+            throughput = sorted(executor.throughput().values())
+        base_time = base_time or elapsed
+        print(
+            f"{workers:3d} workers: {elapsed:.3f} s, speed-up {base_time / elapsed:.2f}, "
+            f"queries/s per worker {min(throughput):.0f}-{max(throughput):.0f}"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    # run from the repository root, e.g. python -m benchmarks.parallel_queries
+    GRAPH = sys.argv[1] if len(sys.argv) > 1 else "./test/test-graphs/berlin.gra"
+    main(GRAPH)
@@ -0,0 +1,70 @@
+"""
+This module compares the priority queues of the Dijkstra class on graphs read from .gra-files and
+picks the fastest one per graph.
+"""
+import random
+import sys
+import time
+
+from prettytable import PrettyTable
+
+from dijkstra.cache import CachedGraphReader
+from dijkstra.core import Dijkstra
+from dijkstra.queues import QUEUES, integral
+
+
+def time_queue(graph, queue: str, queries: list[tuple[int, int]]) -> float:
+    """
+    This function returns the seconds needed to run dijkstra_dist() and dijkstra() with modified
+    weights for all queries on the given queue.
+    """
+    dijkstra = Dijkstra(graph, queue=queue)
+    start = time.perf_counter()
+    for source, target in queries:
+        back_dist = dijkstra.dijkstra_dist(target)
+        dijkstra.dijkstra(source, target, back_dist)
+    return time.perf_counter() - start
+
+
+def fastest_queue(graph, query_count: int = 10, seed: int = 0) -> tuple[str, dict[str, float]]:
+    """
+    This function times all queues usable for the graph on random queries and returns the name of
+    the fastest one together with all timings.
+    """
+    rng = random.Random(seed)
+    queries = [
+        (rng.randrange(graph.node_count), rng.randrange(graph.node_count))
+        for _ in range(query_count)
+    ]
+    names = QUEUES if integral(graph.f_weights) else ("binary", "dary")
+    timings = {name: time_queue(graph, name, queries) for name in names}
+    return min(timings, key=timings.get), timings
+
+
+def main(graph_strings: list[str], query_count: int = 10):
+    """
+    This function is the main function of this module. It prints the timings of all queues and the
+    fastest queue for every graph.
+    """
+    table = PrettyTable(["Graph"] + list(QUEUES) + ["fastest"])
+    for graph_string in graph_strings:
+        graph = CachedGraphReader(graph_string).read()
+        best, timings = fastest_queue(graph, query_count)
+        table.add_row(
+            [graph_string]
+            + [f"{timings[name]:.3f} s" if name in timings else "-" for name in QUEUES]
+            + [best]
+        )
+    print(f"{query_count} queries with modified weights per graph")
+    print(table)
+
+
+if __name__ == "__main__":
+    # run from the repository root, e.g. python -m benchmarks.queues
+    GRAPHS = sys.argv[1:] or [
+        "./test/test-graphs/test10.gra",
+        "./test/test-graphs/deutschland1.gra",
+        "./test/test-graphs/deutschland2.gra",
+        "./test/test-graphs/berlin.gra",
+    ]
+    main(GRAPHS)
@@ -0,0 +1,101 @@
+"""
+This module measures the query times of the search engines on a graph read from a .gra-file (or
+a random grid with shuffled node indices) in its original node order and after renumbering the
+nodes with each order of dijkstra.reorder.
+"""
+import random
+import sys
+import time
+
+from benchmarks.suite import grid_graph
+from dijkstra.cache import CachedGraphReader
+from dijkstra.core import Dijkstra
+from dijkstra.delta import DeltaStepping
+from dijkstra.reorder import ORDERS, inverse, node_order, reorder
+
+
+def index_gap(graph) -> float:
+    """
+    This function returns the mean difference of the indices of the end nodes of all arcs.
+    """
+    total = 0
+    for i_node in range(graph.node_count):
+        for pos in range(graph.f_offsets[i_node], graph.f_offsets[i_node + 1]):
+            total += abs(graph.f_targets[pos] - i_node)
+    return total / graph.arc_count if graph.arc_count else 0.0
+
+
+def query_times(graph, pairs: list[tuple[int, int]], repeat: int = 5) -> dict[str, float]:
+    """
+    This function returns the mean time in milliseconds of dijkstra(), dijkstra_dist() and the
+    delta-stepping dijkstra_dist() over the pairs of source and target index, the best of repeat
+    runs to suppress the noise of other processes.
+    """
+    dijkstra = Dijkstra(graph, compact=True)
+    delta = DeltaStepping(graph)
+    times = {}
+    for name, run in (
+        ("dijkstra", dijkstra.dijkstra),
+        ("dijkstra_dist", lambda _, i_target: dijkstra.dijkstra_dist(i_target)),
+        ("delta", lambda _, i_target: delta.dijkstra_dist(i_target)),
+    ):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for i_source, i_target in pairs:
+                run(i_source, i_target)
+            best = min(best, time.perf_counter() - start)
+        times[name] = 1000 * best / len(pairs)
+    return times
+
+
+def main(graph_string: str, query_count: int = 20, seed: int = 0):
+    """
+    This function is the main function of this module. It prints the order time, the mean index
+    gap of the arcs and the query times of every order relative to the original one. The same
+    queries are run on every order by mapping their node indices.
+    """
+    rng = random.Random(seed)
+    if graph_string.isdigit():
+        # a generated grid is numbered row by row, so shuffle it like the lines of a file
+        graph = grid_graph(int(graph_string), seed)
+        shuffled = list(range(graph.node_count))
+        rng.shuffle(shuffled)
+        graph = reorder(graph, shuffled)
+    else:
+        graph = CachedGraphReader(graph_string).read()
+    pairs = [
+        (rng.randrange(graph.node_count), rng.randrange(graph.node_count))
+        for _ in range(query_count)
+    ]
+    print(f"graph: {graph_string} ({graph.node_count} nodes, {graph.arc_count} arcs)")
+    base = query_times(graph, pairs)
+    print(f"original: index gap {index_gap(graph):.0f}, " + ", ".join(
+        f"{name} {value:.2f} ms" for name, value in base.items()
+    ))
+    for method in ORDERS:
+        start = time.perf_counter()
+        try:
+            order = node_order(graph, method)
+        except ValueError as error:
+            print(f"{method}: {error}")
+            continue
+        reordered = reorder(graph, order)
+        order_time = time.perf_counter() - start
+        rank = inverse(order)
+        times = query_times(
+            reordered, [(rank[i_source], rank[i_target]) for i_source, i_target in pairs]
+        )
+        print(
+            f"{method}: order {order_time:.2f} s, index gap {index_gap(reordered):.0f}, "
+            + ", ".join(
+                f"{name} {value:.2f} ms ({base[name] / value:.2f}x)"
+                for name, value in times.items()
+            )
+        )
+
+
+if __name__ == "__main__":
+    # run from the repository root, e.g. python -m benchmarks.reorder or with a grid side: ... 300
+    GRAPH = sys.argv[1] if len(sys.argv) > 1 else "./test/test-graphs/berlin.gra"
+    main(GRAPH)
@@ -0,0 +1,321 @@
+"""
+This module runs seeded random query sets with every search mode over the bundled test graphs and
+synthetic grid graphs. It records latency percentiles, settled nodes, relaxations, peak memory,
+load and preprocessing time, writes the results as JSON and compares two result files to flag
+regressions.
+"""
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from array import array
+
+from dijkstra.compact import CompactGraph
+from dijkstra.core import Dijkstra
+from dijkstra.hierarchy import ContractionHierarchy
+from dijkstra.instrumentation import SearchProfile
+from dijkstra.labels import HubLabels
+from dijkstra.landmarks import Landmarks
+from dijkstra.reader import CompactGraphReader, build_csr
+from dijkstra.server import percentile
+
+
+GRAPHS = ("test10", "deutschland1", "deutschland2", "berlin")
+GRID_SIDES = (32, 64)
+MODES = ("backward", "unmodified", "modified", "bidirectional", "astar", "alt", "ch", "hl")
+# relative increase of a metric that counts as regression
+THRESHOLD = 0.2
+
+
+def grid_graph(side: int, seed: int = 0) -> CompactGraph:
+    """
+    This function returns an undirected side x side grid graph with random integer edge weights
+    between the euclidean length 10 of an edge and 100 and the grid positions as coordinates.
+    """
+    rng = random.Random(seed)
+    node_count = side * side
+    tails, heads, weights = array("q"), array("q"), array("d")
+    for i_node in range(node_count):
+        row, column = divmod(i_node, side)
+        for i_next, exists in ((i_node + 1, column + 1 < side), (i_node + side, row + 1 < side)):
+            if exists:
+                # both directions of the undirected edge, as the reader stores them
+                weight = rng.randint(10, 100)
+                tails.extend((i_node, i_next))
+                heads.extend((i_next, i_node))
+                weights.extend((weight, weight))
+    edge_count = len(weights) // 2
+    xs = array("d", (10.0 * (i_node % side) for i_node in range(node_count)))
+    ys = array("d", (10.0 * (i_node // side) for i_node in range(node_count)))
+    return CompactGraph(
+        node_count, edge_count,
+        build_csr(node_count, tails, heads, weights),
+        build_csr(node_count, heads, tails, weights),
+        [str(i_node) for i_node in range(node_count)],
+        (xs, ys)
+    )
+
+
+def load_graphs(names: list[str], sides: list[int], seed: int) -> dict:
+    """
+    This function returns the graphs to benchmark by name together with their load time and peak
+    memory. The test graphs are parsed from their .gra-files, the grids are generated.
+    """
+    graphs = {}
+    for name in names:
+        reader = CompactGraphReader(f"./test/test-graphs/{name}.gra", trace_memory=True)
+        graphs[name] = (reader.read(), reader.load_time, reader.peak_memory)
+    for side in sides:
+        tracemalloc.start()
+        start = time.perf_counter()
+        graph = grid_graph(side, seed)
+        load_time = time.perf_counter() - start
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        graphs[f"grid{side}"] = (graph, load_time, peak_memory)
+    return graphs
+
+
+def prepare(graph: CompactGraph, mode: str):
+    """
+    This function returns the query function of a mode for the graph, which maps a source and a
+    target index to the settled nodes, the relaxation function, which runs the query again and adds
+    its counters to a given SearchProfile, and the preprocessing time. Only dijkstra() and
+    dijkstra_dist() can be profiled, so the modes backward, unmodified and modified have a
+    relaxation function and bidirectional, astar, alt, ch and hl have None.
+    """
+    dijkstra = Dijkstra(graph)
+    start = time.perf_counter()
+    if mode == "backward":
+        def run(_, i_target):
+            return dijkstra.dijkstra_dist(i_target, count=True)[1]["settled"]
+
+        def relax(_, i_target, profile):
+            dijkstra.dijkstra_dist(i_target, profile=profile)
+    elif mode == "unmodified":
+        def run(i_source, i_target):
+            return dijkstra.dijkstra(i_source, i_target, count=True)[2]
+
+        def relax(i_source, i_target, profile):
+            dijkstra.dijkstra(i_source, i_target, profile=profile)
+    elif mode == "modified":
+        def run(i_source, i_target):
+            back_dist, stats = dijkstra.dijkstra_dist(i_target, settle=[i_source], count=True)
+            settled = dijkstra.dijkstra(i_source, i_target, back_dist, count=True)[2]
+            return stats["settled"] + settled
+
+        def relax(i_source, i_target, profile):
+            back_dist = dijkstra.dijkstra_dist(i_target, settle=[i_source], profile=profile)
+            dijkstra.dijkstra(i_source, i_target, back_dist, profile=profile)
+    elif mode == "bidirectional":
+        def run(i_source, i_target):
+            return dijkstra.bidirectional(i_source, i_target, count=True)[2]
+
+        relax = None
+    elif mode == "astar":
+        if graph.coords is None:
+            return None, None, 0.0
+        dijkstra.astar(0, 0)
+
+        def run(i_source, i_target):
+            return dijkstra.astar(i_source, i_target, count=True)[2]
+
+        relax = None
+    elif mode == "alt":
+        landmarks = Landmarks.select(graph, 8)
+
+        def run(i_source, i_target):
+            return dijkstra.astar(i_source, i_target, landmarks, count=True)[2]
+
+        relax = None
+    elif mode == "ch":
+        hierarchy = ContractionHierarchy.build(graph)
+
+        def run(i_source, i_target):
+            return hierarchy.query(i_source, i_target, count=True)[2]
+
+        relax = None
+    elif mode == "hl":
+        labels = HubLabels.build(graph)
+
+        def run(i_source, i_target):
+            # the label entries scanned take the place of settled nodes
+            return labels.query(i_source, i_target, count=True)[2]
+
+        relax = None
+    else:
+        raise ValueError(f"Unknown mode {mode}, use one of {MODES}")
+    return run, relax, time.perf_counter() - start
+
+
+def measure(run, relax, queries: list[tuple[int, int]], memory_queries: int = 3) -> dict:
+    """
+    This function runs the queries and returns latency percentiles in milliseconds, throughput,
+    mean settled nodes, the mean relaxations counted by running the queries again with the
+    relaxation function (None without one), and the peak memory of a few queries run again under
+    tracemalloc. Relaxations and memory are measured apart, as both would distort the latencies.
+    """
+    latencies, settled = [], []
+    start = time.perf_counter()
+    for i_source, i_target in queries:
+        query_start = time.perf_counter()
+        settled.append(run(i_source, i_target))
+        latencies.append(time.perf_counter() - query_start)
+    total = time.perf_counter() - start
+    relaxations = None
+    if relax is not None:
+        profile = SearchProfile()
+        for i_source, i_target in queries:
+            relax(i_source, i_target, profile)
+        relaxations = profile.relaxations / len(queries)
+    tracemalloc.start()
+    for i_source, i_target in queries[:memory_queries]:
+        run(i_source, i_target)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    latencies.sort()
+    return {
+        "p50_ms": 1000 * percentile(latencies, 0.5),
+        "p90_ms": 1000 * percentile(latencies, 0.9),
+        "p99_ms": 1000 * percentile(latencies, 0.99),
+        "mean_ms": 1000 * total / len(queries),
+        "throughput": len(queries) / total if total else None,
+        "settled": sum(settled) / len(settled),
+        "relaxations": relaxations,
+        "peak_memory": peak_memory,
+    }
+
+
+def commit() -> str:
+    """
+    This function returns the current git commit or None outside a repository.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(
+    names: list[str] = GRAPHS,
+    sides: list[int] = GRID_SIDES,
+    modes: list[str] = MODES,
+    query_count: int = 50,
+    seed: int = 0
+) -> dict:
+    """
+    This function runs the suite and returns the results as a dict that can be written as JSON.
+    """
+    results = {
+        "meta": {
+            "commit": commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "queries": query_count,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "graphs": {},
+    }
+    for name, (graph, load_time, peak_memory) in load_graphs(names, sides, seed).items():
+        rng = random.Random(seed)
+        queries = [
+            (rng.randrange(graph.node_count), rng.randrange(graph.node_count))
+            for _ in range(query_count)
+        ]
+        entry = {
+            "nodes": graph.node_count,
+            "arcs": graph.arc_count,
+            "load_time": load_time,
+            "load_peak_memory": peak_memory,
+            "modes": {},
+        }
+        for mode in modes:
+            run, relax, preprocessing = prepare(graph, mode)
+            if run is None:
+                continue
+            entry["modes"][mode] = {
+                "preprocessing": preprocessing, **measure(run, relax, queries)
+            }
+            print(f"{name} {mode}: p50 {entry['modes'][mode]['p50_ms']:.3f} ms", file=sys.stderr)
+        results["graphs"][name] = entry
+    return results
+
+
+def compare(base: dict, new: dict, threshold: float = THRESHOLD) -> list[str]:
+    """
+    This function returns a message for every latency percentile, settled node count, relaxation
+    count, peak memory or load time of the new results that is more than threshold higher than in
+    the base results.
+    """
+    regressions = []
+    metrics = ("p50_ms", "p99_ms", "settled", "relaxations", "peak_memory", "preprocessing")
+    for name, graph in new["graphs"].items():
+        base_graph = base["graphs"].get(name)
+        if base_graph is None:
+            continue
+        pairs = [("load_time", base_graph["load_time"], graph["load_time"])]
+        for mode, values in graph["modes"].items():
+            base_values = base_graph["modes"].get(mode, {})
+            pairs += [
+                (f"{mode} {metric}", base_values.get(metric), values.get(metric))
+                for metric in metrics
+            ]
+        for label, old, value in pairs:
+            if old and value is not None and value > old * (1 + threshold):
+                regressions.append(
+                    f"{name} {label}: {old:.4g} -> {value:.4g} (+{value / old - 1:.0%})"
+                )
+    return regressions
+
+
+def main():
+    """
+    This function is the main function of this module. It runs the suite and writes the results,
+    or compares two result files, and exits with status 1 if regressions were found.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark suite of the Dijkstra searches")
+    parser.add_argument("-o", "--output", help="write the results to this JSON file")
+    parser.add_argument("-b", "--baseline", help="compare the results with this JSON file")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "NEW"), help="compare two files")
+    parser.add_argument("-q", "--queries", type=int, default=50, help="queries per graph and mode")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--graphs", nargs="*", choices=GRAPHS, default=list(GRAPHS))
+    parser.add_argument("--grids", nargs="*", type=int, default=list(GRID_SIDES))
+    parser.add_argument("--modes", nargs="*", choices=MODES, default=list(MODES))
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    args = parser.parse_args()
+    if args.compare:
+        with open(args.compare[0], encoding="utf-8") as file:
+            base = json.load(file)
+        with open(args.compare[1], encoding="utf-8") as file:
+            new = json.load(file)
+    else:
+        new = run_suite(args.graphs, args.grids, args.modes, args.queries, args.seed)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as file:
+                json.dump(new, file, indent=2)
+        else:
+            print(json.dumps(new, indent=2))
+        base = None
+        if args.baseline:
+            with open(args.baseline, encoding="utf-8") as file:
+                base = json.load(file)
+    if base is not None:
+        regressions = compare(base, new, args.threshold)
+        for message in regressions:
+            print(f"regression: {message}")
+        if regressions:
+            sys.exit(1)
+        print("no regressions")
+
+
+if __name__ == "__main__":
+    # run from the repository root, e.g. python -m benchmarks.suite -o results.json
+    main()
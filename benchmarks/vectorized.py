@@ -0,0 +1,48 @@
+"""
+This module compares the throughput of full distance vectors computed by Dijkstra.dijkstra_dist()
+and by the vectorized SciPy backend on a graph read from a .gra-file.
+"""
+import random
+import sys
+import time
+
+from dijkstra.cache import CachedGraphReader
+from dijkstra.core import Dijkstra
+from dijkstra.vectorized import VectorizedDijkstra
+
+
+def main(graph_string: str, target_count: int = 50, seed: int = 0):
+    """
+    This function is the main function of this module. It prints the distance vectors per second of
+    both backends for random targets, computed one by one and, for the vectorized backend, also in
+    one batch.
+    """
+    graph = CachedGraphReader(graph_string).read()
+    rng = random.Random(seed)
+    targets = [rng.randrange(graph.node_count) for _ in range(target_count)]
+    dijkstra = Dijkstra(graph)
+    start = time.perf_counter()
+    for target in targets:
+        dijkstra.dijkstra_dist(target)
+    python_time = time.perf_counter() - start
+    start = time.perf_counter()
+    vectorized = VectorizedDijkstra(graph)
+    setup_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for target in targets:
+        vectorized.dijkstra_dist(target)
+    single_time = time.perf_counter() - start
+    start = time.perf_counter()
+    vectorized.many_dist(targets)
+    batch_time = time.perf_counter() - start
+    print(f"graph: {graph_string} ({graph.node_count} nodes, {graph.arc_count} arcs)")
+    print(f"sparse matrix setup: {setup_time:.3f} s")
+    print(f"dijkstra_dist(): {target_count / python_time:.1f} vectors/s")
+    print(f"vectorized, one by one: {target_count / single_time:.1f} vectors/s")
+    print(f"vectorized, batch: {target_count / batch_time:.1f} vectors/s")
+
+
+if __name__ == "__main__":
+    # run from the repository root, e.g. python -m benchmarks.vectorized
+    GRAPH = sys.argv[1] if len(sys.argv) > 1 else "./test/test-graphs/berlin.gra"
+    main(GRAPH)
@@ -0,0 +1,59 @@
+"""
+This module compares the latency of short shortest path queries with and without a reusable search
+workspace on a graph read from a .gra-file.
+"""
+import random
+import sys
+import time
+
+from dijkstra.cache import CachedGraphReader
+from dijkstra.core import Dijkstra
+
+
+def local_queries(graph, query_count: int, hops: int, seed: int) -> list[tuple[int, int]]:
+    """
+    This function returns random queries whose target is reached from the source by a random walk
+    of a few arcs, so each query explores only a small part of the graph.
+    """
+    rng = random.Random(seed)
+    queries = []
+    while len(queries) < query_count:
+        i_source = i_node = rng.randrange(graph.node_count)
+        for _ in range(hops):
+            start, end = graph.f_offsets[i_node], graph.f_offsets[i_node + 1]
+            if start == end:
+                break
+            i_node = graph.f_targets[rng.randrange(start, end)]
+        queries.append((i_source, i_node))
+    return queries
+
+
+def time_queries(dijkstra: Dijkstra, queries: list[tuple[int, int]]) -> float:
+    """
+    This function returns the mean seconds per dijkstra() query.
+    """
+    start = time.perf_counter()
+    for source, target in queries:
+        dijkstra.dijkstra(source, target)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def main(graph_string: str, query_count: int = 1000, hops: int = 5, seed: int = 0):
+    """
+    This function is the main function of this module. It prints the mean latency of local queries
+    with fresh vectors per query and with a reused workspace.
+    """
+    graph = CachedGraphReader(graph_string).read()
+    queries = local_queries(graph, query_count, hops, seed)
+    fresh = time_queries(Dijkstra(graph), queries)
+    reused = time_queries(Dijkstra(graph, workspace=True), queries)
+    print(f"graph: {graph_string} ({graph.node_count} nodes, {graph.arc_count} arcs)")
+    print(f"{query_count} queries over up to {hops} arcs")
+    print(f"fresh vectors: {fresh * 1e6:.1f} us/query")
+    print(f"workspace: {reused * 1e6:.1f} us/query ({fresh / reused:.1f}x)")
+
+
+if __name__ == "__main__":
+    # run from the repository root, e.g. python -m benchmarks.workspace
+    GRAPH = sys.argv[1] if len(sys.argv) > 1 else "./test/test-graphs/berlin.gra"
+    main(GRAPH, int(sys.argv[2]) if len(sys.argv) > 2 else 1000)
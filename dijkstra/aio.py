@@ -0,0 +1,106 @@
+"""
+This module contains an asyncio interface to the Dijkstra class. Searches run in an executor, so
+they do not block the event loop, and identical requests in flight share one search.
+"""
+import asyncio
+import threading
+
+try:
+    from .core import Dijkstra
+    from .parallel import MODES, shortest_path
+    from .potentials import PotentialCache
+except ImportError:
+    from core import Dijkstra
+    from parallel import MODES, shortest_path
+    from potentials import PotentialCache
+
+
+class Overloaded(RuntimeError):
+    """
+    This exception is raised when a request arrives while max_pending searches are in flight.
+    """
+
+
+class AsyncDijkstra:
+    """
+    This class answers shortest path queries as awaitables with the (dist, pred, iter) results of
+    the Dijkstra method of the query's mode (one of MODES). Concurrent queries with the same source,
+    target and mode are coalesced into one search whose result all of them receive, so the
+    predecessors must not be modified by the caller.
+
+    At most max_concurrent searches run in the executor at the same time (the default executor of
+    the event loop if none is given), further ones wait. If max_pending distinct searches are
+    running or waiting, new ones are refused with Overloaded. The Dijkstra object must not use a
+    workspace, as its searches run in several threads.
+    """
+    def __init__(
+        self,
+        dijkstra: Dijkstra,
+        executor=None,
+        max_concurrent: int = 4,
+        max_pending: int = 1024,
+        potentials: PotentialCache = None
+    ):
+        if dijkstra.workspace is not None:
+            raise ValueError("A Dijkstra object with workspace cannot search in several threads")
+        self.dijkstra = dijkstra
+        self.executor = executor
+        self.max_pending = max_pending
+        self.potentials = potentials if potentials is not None else PotentialCache()
+        self.in_flight = {}
+        self.searches = 0
+        self.coalesced = 0
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._potential_lock = threading.Lock()
+
+    async def query(self, i_source: int, i_target: int, mode: str = "unmodified") -> tuple:
+        """
+        This method returns the distance, predecessors and iteration count of a shortest path from
+        source to target index. If the same query is already in flight, its result is awaited
+        instead of starting another search.
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode {mode}, use one of {MODES}")
+        key = (i_source, i_target, mode)
+        future = self.in_flight.get(key)
+        if future is None:
+            if len(self.in_flight) >= self.max_pending:
+                raise Overloaded(f"{len(self.in_flight)} searches are pending")
+            future = asyncio.ensure_future(self._search(key))
+            self.in_flight[key] = future
+            future.add_done_callback(lambda _: self.in_flight.pop(key, None))
+        else:
+            self.coalesced += 1
+        # a cancelled caller must not cancel the search the other callers wait for
+        return await asyncio.shield(future)
+
+    async def _search(self, key: tuple[int, int, str]) -> tuple:
+        """
+        This method runs one search in the executor once a slot is free.
+        """
+        async with self._semaphore:
+            self.searches += 1
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, self._run, *key)
+
+    def _run(self, i_source: int, i_target: int, mode: str) -> tuple:
+        """
+        This method runs a search in an executor thread. The potential cache is not thread-safe, so
+        the potential is fetched under a lock.
+        """
+        if mode == "modified":
+            with self._potential_lock:
+                back_dist = self.potentials.get(self.dijkstra, i_target)
+            return self.dijkstra.dijkstra(i_source, i_target, back_dist, count=True)
+        return shortest_path(self.dijkstra, i_source, i_target, mode, count=True)
+
+    def stats(self) -> dict:
+        """
+        This method returns the number of searches run, of queries coalesced into a running search
+        and of searches in flight.
+        """
+        return {
+            "searches": self.searches,
+            "coalesced": self.coalesced,
+            "pending": len(self.in_flight),
+        }
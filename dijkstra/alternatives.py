@@ -0,0 +1,206 @@
+"""
+This module contains Yen's algorithm for the k shortest loopless paths. The backward distances to
+the target are an exact potential for the spur searches: a search ends as soon as it settles a node
+whose path in the shortest path tree to the target is not blocked, so most spur searches only
+settle the nodes of a few arcs.
+"""
+import heapq
+
+try:
+    from .core import Dijkstra
+except ImportError:
+    from core import Dijkstra
+
+
+def k_shortest_paths(
+    dijkstra: Dijkstra,
+    i_source: int,
+    i_target: int,
+    back_dist: list[float] = None,
+    avoid_nodes=(),
+    avoid_arcs=(),
+    count: bool = False
+):
+    """
+    This generator yields the distance and the node indices of the shortest loopless paths from
+    source to target index in increasing order of their distance, and with count=True also the
+    number of nodes settled since the previous path. The paths are computed lazily, the next one
+    when it is requested. Nodes in avoid_nodes and arcs (tail, head) in avoid_arcs are masked
+    without copying the graph. back_dist are the backward distances to the target, e.g. cached
+    potentials, which dijkstra_dist() computes if not given; distances of the unmasked graph are
+    fine, as they never overestimate the masked distances.
+    """
+    graph = dijkstra._compact_graph()  # pylint: disable=protected-access
+    if back_dist is None:
+        back_dist = dijkstra.dijkstra_dist(i_target)
+    avoid_nodes = set(avoid_nodes)
+    if i_source in avoid_nodes or i_target in avoid_nodes:
+        return
+    search = _SpurSearch(graph, i_target, back_dist, avoid_nodes, set(avoid_arcs))
+    first = search.run(i_source, set(), set())
+    if first is None:
+        return
+    found = []
+    candidates = [(first[0], first[1])]
+    seen = {first[1]}
+    settled = search.settled
+    while candidates:
+        dist, path = heapq.heappop(candidates)
+        found.append(path)
+        if count:
+            yield (dist, list(path), settled)
+        else:
+            yield (dist, list(path))
+        settled = 0
+        root_dist = 0.0
+        for pos in range(len(path) - 1):
+            root = path[:pos + 1]
+            # arcs leaving the spur node on found paths with the same root are blocked
+            blocked_heads = {other[pos + 1] for other in found if other[:pos + 1] == root}
+            spur = search.run(path[pos], set(root[:-1]), blocked_heads)
+            settled += search.settled
+            if spur is not None:
+                candidate = root[:-1] + spur[1]
+                if candidate not in seen:
+                    seen.add(candidate)
+                    heapq.heappush(candidates, (root_dist + spur[0], candidate))
+            root_dist += search.arc_weight(path[pos], path[pos + 1])
+
+
+class _SpurSearch:
+    """
+    This class runs A* searches to the target of the k_shortest_paths() generator with the backward
+    distances as potential. The successor of every node in the backward shortest path tree is
+    derived from the distances on first use and kept for all searches.
+    """
+    def __init__(
+        self,
+        graph,
+        i_target: int,
+        back_dist: list[float],
+        avoid_nodes: set,
+        avoid_arcs: set
+    ):
+        self.graph = graph
+        self.i_target = i_target
+        self.back_dist = back_dist
+        self.avoid_nodes = avoid_nodes
+        self.avoid_arcs = avoid_arcs
+        self.successors = {}
+        self.settled = 0
+
+    def arc_weight(self, i_tail: int, i_head: int) -> float:
+        """
+        This method returns the weight of the shortest arc from tail to head.
+        """
+        return min(weight for i_next, weight in self.graph.forward(i_tail) if i_next == i_head)
+
+    def successor(self, i_node: int) -> int:
+        """
+        This method returns the next node on a shortest path from a node to the target.
+        """
+        i_next = self.successors.get(i_node)
+        if i_next is None:
+            back_dist = self.back_dist
+            graph = self.graph
+            i_next = min(
+                range(graph.f_offsets[i_node], graph.f_offsets[i_node + 1]),
+                key=lambda pos: graph.f_weights[pos] + back_dist[graph.f_targets[pos]]
+            )
+            i_next = graph.f_targets[i_next]
+            self.successors[i_node] = i_next
+        return i_next
+
+    def tree_path(self, i_node: int, blocked: set, memo: dict) -> bool:
+        """
+        This method checks whether the tree path from a node to the target avoids the blocked and
+        masked nodes and the masked arcs. The results of all nodes on the checked part of the path
+        are stored in memo.
+        """
+        walked = []
+        i_current = i_node
+        valid = True
+        while i_current != self.i_target:
+            if i_current in memo:
+                valid = memo[i_current]
+                break
+            walked.append(i_current)
+            if i_current in blocked or i_current in self.avoid_nodes:
+                valid = False
+                break
+            i_next = self.successor(i_current)
+            if (i_current, i_next) in self.avoid_arcs:
+                valid = False
+                break
+            i_current = i_next
+        for i_walked in walked:
+            memo[i_walked] = valid
+        return valid
+
+    def run(self, i_source: int, blocked: set, blocked_heads: set) -> tuple[float, tuple]:
+        """
+        This method returns the distance and the node indices of a shortest path from the source
+        to the target that avoids the blocked nodes and the arcs from the source to blocked_heads,
+        or None if there is none. The number of settled nodes is stored in settled.
+        """
+        graph = self.graph
+        offsets, heads, weights = graph.f_offsets, graph.f_targets, graph.f_weights
+        back_dist = self.back_dist
+        inf = float("inf")
+        self.settled = 0
+        if back_dist[i_source] == inf:
+            return None
+        # the source is blocked for the tree paths of all other nodes, which would revisit it
+        blocked = blocked | {i_source}
+        memo = {}
+        distances = {i_source: 0.0}
+        predecessors = {i_source: None}
+        done = set()
+        heap = [(back_dist[i_source], i_source)]
+        i_end = None
+        while heap:
+            _, i_node = heapq.heappop(heap)
+            if i_node in done:
+                continue
+            done.add(i_node)
+            self.settled += 1
+            if i_node == self.i_target:
+                i_end = i_node
+                break
+            if i_node == i_source:
+                i_next = self.successor(i_node)
+                if i_next not in blocked_heads and (i_node, i_next) not in self.avoid_arcs \
+                        and self.tree_path(i_next, blocked, memo):
+                    distances[i_next] = self.arc_weight(i_node, i_next)
+                    predecessors[i_next] = i_node
+                    i_end = i_next
+                    break
+            elif self.tree_path(i_node, blocked, memo):
+                i_end = i_node
+                break
+            dist_node = distances[i_node]
+            for pos in range(offsets[i_node], offsets[i_node + 1]):
+                i_head = heads[pos]
+                if i_head in blocked or i_head in self.avoid_nodes or back_dist[i_head] == inf:
+                    continue
+                if (i_node == i_source and i_head in blocked_heads) \
+                        or (i_node, i_head) in self.avoid_arcs:
+                    continue
+                new_dist = dist_node + weights[pos]
+                if new_dist < distances.get(i_head, inf):
+                    distances[i_head] = new_dist
+                    predecessors[i_head] = i_node
+                    heapq.heappush(heap, (new_dist + back_dist[i_head], i_head))
+        if i_end is None:
+            return None
+        path = []
+        i_node = i_end
+        while i_node is not None:
+            path.append(i_node)
+            i_node = predecessors[i_node]
+        path.reverse()
+        i_node = i_end
+        while i_node != self.i_target:
+            i_node = self.successor(i_node)
+            path.append(i_node)
+        return distances[i_end] + back_dist[i_end], tuple(path)
@@ -0,0 +1,209 @@
+"""
+This module contains a versioned binary cache for graphs read from .gra-files. The cache file is
+written next to the .gra-file and memory-mapped on later reads, so several processes share one
+physical copy of the graph.
+"""
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+import tracemalloc
+from array import array
+
+try:
+    from .compact import CompactGraph
+    from .reader import CompactGraphReader
+except ImportError:
+    from compact import CompactGraph
+    from reader import CompactGraphReader
+
+
+MAGIC = b"DJKG"
+VERSION = 2
+SUFFIX = ".bin"
+# magic, version, byte order, node count, edge count, arc count, source mtime, source size, sha256,
+# padded to 88 bytes so the arrays behind it are 8-byte aligned
+HEADER = struct.Struct("<4sII5q32s4x")
+LITTLE_ENDIAN = 1
+BIG_ENDIAN = 2
+
+
+def cache_path(path: str) -> str:
+    """
+    This function returns the path of the cache file of a .gra-file.
+    """
+    return path + SUFFIX
+
+
+def file_hash(path: str) -> bytes:
+    """
+    This function returns the SHA-256 digest of a file.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _byte_order() -> int:
+    return LITTLE_ENDIAN if sys.byteorder == "little" else BIG_ENDIAN
+
+
+def write_cache(graph: CompactGraph, path: str, source_path: str):
+    """
+    This function writes a CompactGraph to the cache file path. The header stores the modification
+    time, size and hash of the source file, followed by the forward and backward CSR arrays, the
+    coordinates and the node names. The file is replaced atomically.
+    """
+    stat = os.stat(source_path)
+    header = HEADER.pack(
+        MAGIC, VERSION, _byte_order(), graph.node_count, graph.edge_count, graph.arc_count,
+        stat.st_mtime_ns, stat.st_size, file_hash(source_path)
+    )
+    xs, ys = graph.coords if graph.coords is not None else ((0.0,) * graph.node_count,) * 2
+    names = "\n".join(graph.names).encode("utf-8")
+    sections = (
+        graph.f_offsets, graph.f_targets, graph.f_weights,
+        graph.b_offsets, graph.b_targets, graph.b_weights,
+        array("d", xs), array("d", ys), array("q", [len(names)])
+    )
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile("wb", dir=directory, delete=False) as file:
+        try:
+            file.write(header)
+            for section in sections:
+                file.write(memoryview(section).cast("B"))
+            file.write(names)
+        except BaseException:
+            file.close()
+            os.unlink(file.name)
+            raise
+    os.replace(file.name, path)
+
+
+def read_header(path: str) -> tuple:
+    """
+    This function returns the unpacked header of a cache file or None if the file is missing or
+    has another format, version or byte order.
+    """
+    try:
+        with open(path, "rb") as file:
+            header = HEADER.unpack(file.read(HEADER.size))
+    except (OSError, struct.error):
+        return None
+    if header[:3] != (MAGIC, VERSION, _byte_order()):
+        return None
+    return header
+
+
+def is_valid(path: str, source_path: str) -> bool:
+    """
+    This function checks whether the cache file belongs to the current version of the source file.
+    The modification time and size are compared first. If they differ, the file hash decides and a
+    matching hash refreshes the stored modification time. A cache that cannot be refreshed is
+    treated as outdated.
+    """
+    header = read_header(path)
+    if header is None:
+        return False
+    stat = os.stat(source_path)
+    if header[6:8] == (stat.st_mtime_ns, stat.st_size):
+        return True
+    if header[8] != file_hash(source_path):
+        return False
+    try:
+        with open(path, "r+b") as file:
+            file.write(HEADER.pack(*header[:6], stat.st_mtime_ns, stat.st_size, header[8]))
+    except OSError:
+        return False
+    return True
+
+
+def read_cache(path: str) -> CompactGraph:
+    """
+    This function memory-maps a cache file and returns a CompactGraph whose arrays are read-only
+    views into the mapping. Only the node names are copied into Python objects. A ValueError is
+    raised if the file length does not match the counts in the header, e.g. for a truncated file.
+    """
+    with open(path, "rb") as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    header = HEADER.unpack_from(buffer)
+    node_count, edge_count, arc_count = header[3:6]
+    # the arrays up to and including the length of the names
+    size = HEADER.size + 8 * (4 * node_count + 4 * arc_count + 3)
+    if len(buffer) < size or len(buffer) != size + struct.unpack_from("=q", buffer, size - 8)[0]:
+        buffer.close()
+        raise ValueError(f"The cache file {path} does not match the counts in its header")
+    view = memoryview(buffer)
+    position = HEADER.size
+    sections = []
+    for length, typecode in (
+        (node_count + 1, "q"), (arc_count, "q"), (arc_count, "d"),
+        (node_count + 1, "q"), (arc_count, "q"), (arc_count, "d"),
+        (node_count, "d"), (node_count, "d"), (1, "q")
+    ):
+        sections.append(view[position:position + 8 * length].cast(typecode))
+        position += 8 * length
+    names_length = sections.pop()[0]
+    names = bytes(view[position:position + names_length]).decode("utf-8").split("\n")
+    if node_count == 0:
+        names = []
+    return CompactGraph(
+        node_count, edge_count, tuple(sections[0:3]), tuple(sections[3:6]), names,
+        (sections[6], sections[7])
+    )
+
+
+class CachedGraphReader:
+    """
+    This class reads a .gra-file like the CompactGraphReader, but parses it only once into a binary
+    cache file next to it and memory-maps that file on every later read. The cache is rebuilt when
+    the .gra-file changes. After read() the attributes load_time, peak_memory (only if trace_memory
+    is set) and cache_hit are available.
+    """
+    def __init__(self, path: str, trace_memory: bool = False, use_cache: bool = True):
+        self.path = path
+        self.trace_memory = trace_memory
+        self.use_cache = use_cache
+        self.load_time = None
+        self.peak_memory = None
+        self.cache_hit = False
+
+    def read(self) -> CompactGraph:
+        """
+        This method returns the CompactGraph, read from the cache file if it is valid.
+        """
+        if self.trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            graph = self._read()
+        finally:
+            self.load_time = time.perf_counter() - start
+            if self.trace_memory:
+                self.peak_memory = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+        return graph
+
+    def _read(self) -> CompactGraph:
+        path = cache_path(self.path)
+        self.cache_hit = self.use_cache and is_valid(path, self.path)
+        if self.cache_hit:
+            try:
+                return read_cache(path)
+            except ValueError:
+                # a truncated cache file is parsed again like an outdated one
+                self.cache_hit = False
+        graph = CompactGraphReader(self.path).read()
+        if self.use_cache:
+            try:
+                write_cache(graph, path, self.path)
+            except OSError:
+                # a read-only directory only costs the speed-up of later runs
+                return graph
+            return read_cache(path)
+        return graph
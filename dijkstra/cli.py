@@ -3,10 +3,20 @@ This module contains the CLI for the Dijkstra algorithm implementation.
 """
 import argparse
 import os
+from itertools import islice
 
-from oellrich_graph import GraphReader
+from alternatives import k_shortest_paths
 from core import Dijkstra
 from helpers import track_path
+from cache import CachedGraphReader
+from hierarchy import ContractionHierarchy, hierarchy_path
+from labels import HubLabels, labels_path
+from landmarks import STRATEGIES, Landmarks, landmarks_path
+from instrumentation import SearchProfile
+from queues import QUEUES
+from reorder import ORDERS, node_order, reorder
+from result import SearchResult
+from server import QueryServer
 
 
 class Interface:
@@ -23,6 +33,7 @@ class Interface:
         self.dist = None
         self.pred = None
         self.iter = None
+        self.profile = None
 
     def parse_args(self):
         """
@@ -52,17 +63,66 @@ class Interface:
             type=str,
             help="target node name",
         )
-        parser.add_argument(
+        search_mode = parser.add_mutually_exclusive_group()
+        search_mode.add_argument(
             "-m",
             "--modified",
             help="use modified edge weigths",
             action="store_true"
         )
+        search_mode.add_argument(
+            "-a",
+            "--astar",
+            help="use A* with a heuristic on the node coordinates",
+            action="store_true"
+        )
+        search_mode.add_argument(
+            "-b",
+            "--bidirectional",
+            help="search from source and target at the same time",
+            action="store_true"
+        )
+        search_mode.add_argument(
+            "-c",
+            "--ch",
+            help="use a contraction hierarchy stored next to the input file",
+            action="store_true"
+        )
+        search_mode.add_argument(
+            "-H",
+            "--hub-labels",
+            help="use hub labels stored next to the input file",
+            action="store_true"
+        )
+        search_mode.add_argument(
+            "-L",
+            "--landmarks",
+            type=int,
+            help="use A* with lower bounds from the given number of landmarks (ALT)",
+            default=None
+        )
+        parser.add_argument(
+            "--strategy",
+            choices=STRATEGIES,
+            help="landmark selection strategy",
+            default="farthest"
+        )
+        parser.add_argument(
+            "--queue",
+            choices=QUEUES,
+            help="priority queue of the searches with unmodified and modified weights",
+            default="binary"
+        )
         parser.add_argument(
             "-i",
             "--iter",
             help="print the number of iterations",
-            action="store_true",
+            action="store_true"
+        )
+        parser.add_argument(
+            "--profile",
+            help="print the search profile of the searches in modes 0 to 2",
+            action="store_true"
         )
         parser.add_argument(
             "-pr",
@@ -76,6 +136,50 @@ class Interface:
             help="print the path",
             action="store_true",
         )
+        parser.add_argument(
+            "-pe",
+            "--edges",
+            help="print the edges of the path with their weights",
+            action="store_true",
+        )
+        parser.add_argument(
+            "-k",
+            "--alternatives",
+            type=int,
+            help="print the given number of shortest loopless paths",
+            default=None
+        )
+        parser.add_argument(
+            "-l",
+            "--load",
+            help="print the load time and peak memory of reading the graph",
+            action="store_true",
+        )
+        parser.add_argument(
+            "--reorder",
+            choices=ORDERS,
+            help="renumber the nodes for memory locality after reading the graph",
+            default=None
+        )
+        parser.add_argument(
+            "--serve",
+            nargs="?",
+            const="-",
+            metavar="SOCKET",
+            help="keep the graph loaded and answer JSON line requests on stdin or a Unix socket",
+            default=None
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="number of worker processes of the server (default: answer in the server process)",
+            default=0
+        )
+        parser.add_argument(
+            "--no-cache",
+            help="do not read or write the binary graph cache next to the input file",
+            action="store_true",
+        )
         self.args = vars(parser.parse_args())
 
     def check_input_path(self):
@@ -102,50 +206,201 @@ class Interface:
         """
         This method initializes the Dijkstra class object with the graph.
         """
-        self.graph = GraphReader(self.args["input_file"], True).read()
-        self.dijkstra = Dijkstra(self.graph)
-        self.target_idx = self.graph.node_by_name(self.args["target"]).index
+        reader = CachedGraphReader(
+            self.args["input_file"],
+            trace_memory=self.args["load"],
+            use_cache=not self.args["no_cache"]
+        )
+        self.graph = reader.read()
+        if self.args["load"]:
+            cache_state = "hit" if reader.cache_hit else "miss"
+            print(f"load time: {reader.load_time:.3f} s (cache {cache_state})")
+            print(f"peak memory: {reader.peak_memory / 1024 ** 2:.1f} MiB")
+        if self.args["reorder"] is not None:
+            # node names move with their nodes, so lookups and printed paths are unchanged
+            self.graph = reorder(self.graph, node_order(self.graph, self.args["reorder"]))
+        self.dijkstra = Dijkstra(self.graph, queue=self.args["queue"])
+        if self.args["target"] is not None:
+            self.target_idx = self.graph.node_index(self.args["target"])
+
+    def load_landmarks(self) -> Landmarks:
+        """
+        This method reads the landmarks stored next to the input file or selects and stores them if
+        there are none for the requested number and strategy.
+        """
+        path = landmarks_path(self.args["input_file"])
+        if os.path.exists(path):
+            try:
+                landmarks = Landmarks.load(path, self.graph)
+            except ValueError:
+                landmarks = None
+            if landmarks is not None and len(landmarks.landmarks) == self.args["landmarks"] \
+                    and landmarks.strategy == self.args["strategy"]:
+                return landmarks
+        landmarks = Landmarks.select(self.graph, self.args["landmarks"], self.args["strategy"])
+        landmarks.save(path)
+        return landmarks
+
+    def load_hierarchy(self) -> ContractionHierarchy:
+        """
+        This method reads the contraction hierarchy stored next to the input file or builds and
+        stores it if there is none for the graph.
+        """
+        path = hierarchy_path(self.args["input_file"])
+        if os.path.exists(path):
+            try:
+                return ContractionHierarchy.load(path, self.graph)
+            except ValueError:
+                pass
+        hierarchy = ContractionHierarchy.build(self.graph)
+        hierarchy.save(path)
+        return hierarchy
+
+    def load_labels(self) -> HubLabels:
+        """
+        This method reads the hub labels stored next to the input file or builds them from the
+        contraction hierarchy and stores them if there are none for the graph.
+        """
+        path = labels_path(self.args["input_file"])
+        if os.path.exists(path):
+            try:
+                return HubLabels.load(path, self.graph)
+            except ValueError:
+                pass
+        labels = HubLabels.build(self.graph, self.load_hierarchy())
+        labels.save(path)
+        return labels
 
     def print_path(self):
         """
         This method prints a path if nodes and its distance.
         """
         index_path = track_path(self.pred, self.source_idx, self.target_idx)
-        path_strings = [self.graph.nodes[index].name for index in index_path]
+        path_strings = [self.graph.names[index] for index in index_path]
         print(f"path: {' -> '.join(path_strings)}")
 
+    def serve(self):
+        """
+        This method keeps the graph loaded and answers requests until stdin is closed or the socket
+        server is interrupted.
+        """
+        # workers map the graph file in its original order, so a reordered graph is forked instead
+        path = self.args["input_file"] if self.args["reorder"] is None else None
+        server = QueryServer(self.graph, path, self.args["workers"])
+        try:
+            if self.args["serve"] == "-":
+                server.serve_lines()
+            else:
+                server.serve_socket(self.args["serve"])
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
+
+    def print_edges(self):
+        """
+        This method prints the edges of the path with their weights.
+        """
+        result = SearchResult.from_predecessors(
+            self.graph, self.source_idx, self.target_idx, self.dist, self.pred
+        )
+        names = self.graph.names
+        for i_tail, i_head, weight in result.edges():
+            print(f"{names[i_tail]} -> {names[i_head]}: {weight}")
+
+    def print_alternatives(self):
+        """
+        This method prints the shortest loopless paths with their distances.
+        """
+        paths = k_shortest_paths(self.dijkstra, self.source_idx, self.target_idx)
+        for number, (dist, path) in enumerate(islice(paths, self.args["alternatives"]), 1):
+            path_strings = [self.graph.names[index] for index in path]
+            print(f"{number}. {dist}: {' -> '.join(path_strings)}")
+
     def run(self):
         """
         This method runs the program.
         """
         self.parse_args()
+        if self.args["serve"] is not None:
+            self.init_dijkstra()
+            self.serve()
+            return
         self.check_t()
         self.init_dijkstra()
+        if self.args["profile"]:
+            self.profile = SearchProfile()
         if self.args["source"] is None:
             print("\nUsing mode 0: only backward distances")
-            back_dist = self.dijkstra.dijkstra_dist(self.target_idx)
+            back_dist = self.dijkstra.dijkstra_dist(self.target_idx, profile=self.profile)
             print(f"backward distances: {back_dist}")
+            if self.profile is not None:
+                print(f"profile: {self.profile}")
         else:
-            self.source_idx = self.graph.node_by_name(self.args["source"]).index
+            self.source_idx = self.graph.node_index(self.args["source"])
             if self.args["modified"]:
                 print("\nUsing mode 1: modified edge weights")
-                back_dist = self.dijkstra.dijkstra_dist(self.target_idx)
+                back_profile = SearchProfile() if self.profile is not None else None
+                # the backward search can stop once the source is settled
+                back_dist = self.dijkstra.dijkstra_dist(
+                    self.target_idx, settle=[self.source_idx], profile=back_profile
+                )
+                if back_profile is not None:
+                    print(f"backward profile: {back_profile}")
                 self.dist, self.pred, self.iter = self.dijkstra.dijkstra(
-                    self.source_idx, self.target_idx, back_dist, count=True
+                    self.source_idx, self.target_idx, back_dist, count=True, profile=self.profile
+                )
+            elif self.args["astar"]:
+                print("\nUsing mode 3: A* with node coordinates")
+                self.dist, self.pred, self.iter = self.dijkstra.astar(
+                    self.source_idx, self.target_idx, count=True
+                )
+            elif self.args["landmarks"] is not None:
+                print(f"\nUsing mode 4: A* with {self.args['landmarks']} landmarks")
+                self.dist, self.pred, self.iter = self.dijkstra.astar(
+                    self.source_idx, self.target_idx, self.load_landmarks(), count=True
                 )
+            elif self.args["bidirectional"]:
+                print("\nUsing mode 5: bidirectional search")
+                self.dist, self.pred, self.iter = self.dijkstra.bidirectional(
+                    self.source_idx, self.target_idx, count=True
+                )
+            elif self.args["ch"]:
+                print("\nUsing mode 6: contraction hierarchy")
+                self.dist, path, self.iter = self.load_hierarchy().query(
+                    self.source_idx, self.target_idx, count=True
+                )
+                self.pred = [None] * self.graph.node_count
+                for i_node, i_next in zip([self.source_idx] + (path or []), path or []):
+                    self.pred[i_next] = i_node
+            elif self.args["hub_labels"]:
+                print("\nUsing mode 7: hub labels")
+                self.dist, path, self.iter = self.load_labels().query(
+                    self.source_idx, self.target_idx, count=True
+                )
+                self.pred = [None] * self.graph.node_count
+                for i_node, i_next in zip([self.source_idx] + (path or []), path or []):
+                    self.pred[i_next] = i_node
             else:
                 print("\nUsing mode 2: unmodified edge weights")
                 self.dist, self.pred, self.iter = self.dijkstra.dijkstra(
-                    self.source_idx, self.target_idx, count=True
+                    self.source_idx, self.target_idx, count=True, profile=self.profile
                 )
-            if self.dist is not float("inf"):
+            if self.dist != float("inf"):
                 print(f"s -> t shortest path: {self.dist}")
                 if self.args["iter"]:
                     print(f"iterations: {self.iter}")
+                # only the searches of modes 1 and 2 fill the profile
+                if self.profile is not None and self.profile.pops:
+                    print(f"profile: {self.profile}")
                 if self.args["predecessors"]:
                     print(f"predecessors: {self.pred}")
                 if self.args["path"]:
                     self.print_path()
+                if self.args["edges"]:
+                    self.print_edges()
+                if self.args["alternatives"]:
+                    self.print_alternatives()
             else:
                 print("No path found")
 
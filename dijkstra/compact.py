@@ -0,0 +1,108 @@
+"""
+This module contains a compact, array-backed representation of a graph that is used by the
+Dijkstra class to search without dereferencing Python node and edge objects.
+"""
+import hashlib
+from array import array
+
+
+class CompactGraph:
+    """
+    This class stores the forward and backward adjacency of a graph in compressed sparse row (CSR)
+    form. The arcs leaving node i in forward direction are found at the positions
+    f_offsets[i] to f_offsets[i + 1] - 1 of f_targets and f_weights, the backward arcs in the same
+    way at b_offsets, b_targets and b_weights. Node names and the (x, y) coordinate arrays are
+    optional. version counts the changes of the edge weights, so objects derived from the weights
+    can tell when they are outdated.
+    """
+    def __init__(
+        self,
+        node_count: int,
+        edge_count: int,
+        forward: tuple,
+        backward: tuple,
+        names: list[str] = None,
+        coords: tuple = None,
+        name_index: dict[str, int] = None
+    ):
+        self.node_count = node_count
+        self.edge_count = edge_count
+        self.f_offsets, self.f_targets, self.f_weights = forward
+        self.b_offsets, self.b_targets, self.b_weights = backward
+        self.names = names
+        self.coords = coords
+        self._name_index = name_index
+        self.version = 0
+
+    @classmethod
+    def from_graph(cls, graph) -> "CompactGraph":
+        """
+        This method builds the compact representation of a graph read by the GraphReader. The arc
+        order of every node's f_edges and b_edges list is kept, so searches on the compact graph
+        visit the nodes in the same order as searches on the graph objects.
+        """
+        forward = (array("q", [0]), array("q"), array("d"))
+        backward = (array("q", [0]), array("q"), array("d"))
+        for node in graph.nodes:
+            for edge in node.f_edges:
+                forward[1].append(edge.tail.index)
+                forward[2].append(edge.weight)
+            forward[0].append(len(forward[1]))
+            for edge in node.b_edges:
+                backward[1].append(edge.head.index)
+                backward[2].append(edge.weight)
+            backward[0].append(len(backward[1]))
+        names = [node.name for node in graph.nodes]
+        return cls(graph.node_count, graph.edge_count, forward, backward, names)
+
+    @property
+    def arc_count(self) -> int:
+        """
+        This property returns the number of forward arcs, i.e. undirected edges count twice.
+        """
+        return len(self.f_targets)
+
+    def node_index(self, name: str) -> int:
+        """
+        This method returns the index of the node with the given name.
+        """
+        if self._name_index is None:
+            self._name_index = {node_name: index for index, node_name in enumerate(self.names)}
+        try:
+            return self._name_index[name]
+        except KeyError as error:
+            raise ValueError(f"Node {name} not found") from error
+
+    def forward(self, i_node: int):
+        """
+        This method yields (target index, weight) pairs of all forward arcs of a node.
+        """
+        for pos in range(self.f_offsets[i_node], self.f_offsets[i_node + 1]):
+            yield self.f_targets[pos], self.f_weights[pos]
+
+    def backward(self, i_node: int):
+        """
+        This method yields (target index, weight) pairs of all backward arcs of a node.
+        """
+        for pos in range(self.b_offsets[i_node], self.b_offsets[i_node + 1]):
+            yield self.b_targets[pos], self.b_weights[pos]
+
+    def nbytes(self) -> int:
+        """
+        This method returns the number of bytes occupied by the adjacency arrays.
+        """
+        arrays = (
+            self.f_offsets, self.f_targets, self.f_weights,
+            self.b_offsets, self.b_targets, self.b_weights
+        )
+        return sum(len(values) * values.itemsize for values in arrays)
+
+    def fingerprint(self) -> bytes:
+        """
+        This method returns a SHA-256 digest of the forward adjacency, which identifies the graph
+        for files derived from it.
+        """
+        digest = hashlib.sha256()
+        for values in (self.f_offsets, self.f_targets, self.f_weights):
+            digest.update(memoryview(values).cast("B"))
+        return digest.digest()
@@ -3,39 +3,178 @@
 This module contains the core functionality for the graph_explorations package
 """
 import heapq
+from typing import TYPE_CHECKING
 
-from oellrich_graph import Graph
+import numpy as np
+
+try:
+    from .compact import CompactGraph
+    from .heuristics import CoordinateHeuristic
+    from .instrumentation import ProfiledQueue, SearchProfile
+    from .queues import QUEUES, integral, make_queue
+    from .result import SearchResult
+    from .workspace import SearchWorkspace
+except ImportError:
+    from compact import CompactGraph
+    from heuristics import CoordinateHeuristic
+    from instrumentation import ProfiledQueue, SearchProfile
+    from queues import QUEUES, integral, make_queue
+    from result import SearchResult
+    from workspace import SearchWorkspace
+
+if TYPE_CHECKING:
+    from oellrich_graph import Graph
 
 
 class Dijkstra:
     """
     This class implements naive and modified Dijkstra's algorithms to find shortest paths in a
-    graph.
+    graph. With compact=True the searches run on a CompactGraph built once from the graph instead
+    of the node and edge objects. A CompactGraph read by the CompactGraphReader can be passed
+    directly.
+
+    With workspace=True the compact searches of dijkstra() and dijkstra_dist() reuse one
+    SearchWorkspace instead of allocating vectors of the graph's size per query. They then return
+    sparse Distances and Predecessors mappings of the nodes reached by the search.
+
+    The queue of the compact searches of dijkstra() and dijkstra_dist() is one of QUEUES: "binary"
+    (heapq), "dary" (indexed 4-ary heap with decrease-key), "bucket" (Dial's bucket queue) or
+    "radix" (radix heap). The last two need non-negative integer edge weights. Searches with
+    another queue than "binary" skip outdated queue entries, so their iteration count is the number
+    of settled nodes.
     """
-    def __init__(self, graph: Graph = None):
+    def __init__(
+        self,
+        graph: "Graph | CompactGraph" = None,
+        compact: bool = False,
+        workspace: bool = False,
+        queue: str = "binary"
+    ):
+        if queue not in QUEUES:
+            raise ValueError(f"Unknown queue {queue}, use one of {QUEUES}")
         self.graph = graph
+        self.compact = None
+        self.heuristic = None
+        self.workspace = None
+        self.queue = queue
+        self._span = 1
+        self._version = None
+        self._built_compact = None
+        if isinstance(graph, CompactGraph):
+            self.compact = graph
+        elif compact or workspace or queue != "binary":
+            self.compact = CompactGraph.from_graph(graph)
+        if workspace:
+            self.workspace = SearchWorkspace(self.compact.node_count)
+        self._refresh()
+
+    def _refresh(self):
+        """
+        This method derives the span of the integer queues from the edge weights and drops the
+        calibrated heuristic, once initially and again whenever set_arc_weights() changed the
+        weights of the compact graph.
+        """
+        graph = self.compact if self.compact is not None else self._built_compact
+        version = graph.version if graph is not None else None
+        if version == self._version:
+            return
+        self._version = version
+        self.heuristic = None
+        if self.queue in ("bucket", "radix"):
+            if not integral(self.compact.f_weights):
+                raise ValueError(f"The {self.queue} queue needs non-negative integer edge weights")
+            self._span = int(max(self.compact.f_weights, default=1))
 
-    def dijkstra_dist(self, i_target: int = None) -> list[float]:
+    def _check_seeds(self, seed_dist: list[float]):
+        """
+        This method raises a ValueError if the bucket queue or the radix heap is used with seed
+        distances that are not non-negative integers, as they would be truncated to integer keys.
+        """
+        if self.queue in ("bucket", "radix") and seed_dist is not None and not integral(seed_dist):
+            raise ValueError(f"The {self.queue} queue needs non-negative integer seed distances")
+
+    def dijkstra_dist(
+        self,
+        i_target: int = None,
+        radius: float = None,
+        settle: list[int] = None,
+        max_settled: int = None,
+        count: bool = False,
+        seed_dist: list[float] = None,
+        profile: SearchProfile = None
+    ) -> list[float]:
         """
         This method finds the shortest paths between a target node and all other nodes in the graph
         using the backward difference.
+
+        Given a list of target nodes, one search finds the distance of every node to the nearest of
+        them, starting each target at its distance in seed_dist (zero if not given).
+
+        The search stops early once a node farther than radius is reached, all nodes in settle
+        are settled or max_settled nodes are settled. The distances of settled nodes are exact,
+        all other nodes get the distance at which the search stopped, a lower bound of their true
+        distance. This keeps the distances a feasible potential for the modified weights of
+        dijkstra(). If count is set, a dict with the numbers of pops, stale pops, settled nodes and
+        relaxed edges is returned as well.
+
+        Given a SearchProfile, the search runs on the selected queue of the compact graph, which
+        records its counters and timers.
         """
+        self._refresh()
+        self._check_seeds(seed_dist)
+        if profile is not None or self.queue != "binary":
+            return self._dijkstra_dist_queue(
+                i_target, radius, settle, max_settled, count, seed_dist, profile
+            )
+        if self.compact is not None:
+            return self._dijkstra_dist_compact(
+                i_target, radius, settle, max_settled, count, seed_dist
+            )
         # initialize the distances vector with infinity
         distances = [float("inf") for _ in range(self.graph.node_count)]
-        # set the distance of the target node to zero
-        distances[i_target] = 0
-        # initialize the heap with the target node's zero distance and index
-        heap = [(distances[i_target], i_target)]
+        seeds = _seeds(i_target, seed_dist)
+        # set the distance of the target nodes to zero or their seed distance
+        for start, i_seed in seeds:
+            distances[i_seed] = start
+        # initialize the heap with the target nodes' distances and indices
+        heap = list(seeds)
+        remaining = set(settle) if settle is not None else None
+        stats = {"pops": 0, "stale": 0, "settled": 0, "relaxations": 0}
+        bound = None
         while heap:
             # get the node with the smallest distance
-            _, i_node = heapq.heappop(heap)
+            dist_node, i_node = heapq.heappop(heap)
+            stats["pops"] += 1
+            # skip outdated heap entries of nodes that are already settled
+            if dist_node > distances[i_node]:
+                stats["stale"] += 1
+                continue
+            # stop before settling a node beyond the radius
+            if radius is not None and dist_node > radius:
+                bound = dist_node
+                break
+            stats["settled"] += 1
             # iterate over all backward edges of the node
             for edge in self.graph.nodes[i_node].b_edges:
+                stats["relaxations"] += 1
                 # update the distance if a shorter distance is found
                 if distances[edge.head.index] > distances[i_node] + edge.weight:
                     distances[edge.head.index] = distances[i_node] + edge.weight
                     # add the shorter distance and node index to the heap
                     heapq.heappush(heap, (distances[edge.head.index], edge.head.index))
+            # stop if all requested nodes or the maximum number of nodes are settled
+            if remaining is not None:
+                remaining.discard(i_node)
+                if not remaining:
+                    bound = dist_node
+                    break
+            if max_settled is not None and stats["settled"] >= max_settled:
+                bound = dist_node
+                break
+        if bound is not None:
+            distances = [min(dist, bound) for dist in distances]
+        if count:
+            return (distances, stats)
         return distances
 
     def dijkstra(
@@ -43,21 +182,39 @@ class Dijkstra:
         i_source: int = None,
         i_target: int = None,
         dist: list = None,
-        count: bool = False
+        count: bool = False,
+        seed_dist: list[float] = None,
+        profile: SearchProfile = None
     ) -> tuple[float, list[int], int]:
         """
         This method finds a shortest path between source and and target node using Dijkstra's
         algorithm.
+
+        Given a list of source nodes, one search finds the shortest path from the nearest of them,
+        starting each source at its distance in seed_dist (zero if not given). Every source is its
+        own predecessor, so the path ends at the first node that is its own predecessor, where
+        track_path() stops as well.
+
+        Given a SearchProfile, the search runs on the selected queue of the compact graph, which
+        records its counters and timers. It returns the same results.
         """
+        self._refresh()
+        self._check_seeds(seed_dist)
+        if profile is not None or self.queue != "binary":
+            return self._dijkstra_queue(i_source, i_target, dist, count, seed_dist, profile)
+        if self.compact is not None:
+            return self._dijkstra_compact(i_source, i_target, dist, count, seed_dist)
         # initialize the distances vector with infinity and the predecessor vector with None
         distances = [float("inf") for _ in range(self.graph.node_count)]
         predecessors = [None for _ in range(self.graph.node_count)]
-        # initilize the distance of the source node with 0 or backward difference if given
-        distances[i_source] = 0 if dist is None else dist[i_source]
-        # mark the source node as its own predecessor
-        predecessors[i_source] = i_source
-        # initialize the heap with the source node and its distance
-        heap = [(distances[i_source], i_source)]
+        seeds = _seeds(i_source, seed_dist, dist)
+        for start, i_seed in seeds:
+            # initilize the distance of the source node with 0 or backward difference if given
+            distances[i_seed] = start
+            # mark the source node as its own predecessor
+            predecessors[i_seed] = i_seed
+        # initialize the heap with the source nodes and their distances
+        heap = list(seeds)
         # set iteration counter if requested
         if count:
             counter = 0
@@ -86,3 +243,602 @@ class Dijkstra:
         if count:
             return (distances[i_target], predecessors, counter)
         return (distances[i_target], predecessors)
+
+    def search(
+        self,
+        i_source: int,
+        i_target: int,
+        dist: list = None,
+        seed_dist: list[float] = None
+    ) -> SearchResult:
+        """
+        This method runs dijkstra() and returns a SearchResult, which keeps only the predecessors
+        of the reached nodes and rebuilds the path on demand. With workspace=True the search itself
+        does not touch vectors of the graph's size either.
+        """
+        dist_target, predecessors, counter = self.dijkstra(
+            i_source, i_target, dist, count=True, seed_dist=seed_dist
+        )
+        return SearchResult.from_predecessors(
+            self._compact_graph(), i_source, i_target, dist_target, predecessors, counter
+        )
+
+    def _compact_graph(self) -> CompactGraph:
+        """
+        This method returns the CompactGraph the searches without an object based counterpart run
+        on. For a graph of node and edge objects it is built on first use.
+        """
+        if self.compact is not None:
+            return self.compact
+        if self._built_compact is None:
+            self._built_compact = CompactGraph.from_graph(self.graph)
+        return self._built_compact
+
+    def bidirectional(
+        self,
+        i_source: int = None,
+        i_target: int = None,
+        count: bool = False
+    ) -> tuple[float, list[int], int]:
+        """
+        This method finds a shortest path between source and target node with a forward search from
+        the source along f_edges and a backward search from the target along b_edges. The side with
+        the smaller heap minimum is advanced next and the search stops as soon as the sum of both
+        minima reaches the shortest source-target distance found so far. The predecessors of the
+        backward part of the path are filled in, so track_path() works as for dijkstra(). The
+        iteration counter counts the settled nodes of both searches.
+        """
+        graph = self._compact_graph()
+        inf = float("inf")
+        sides = (
+            (graph.f_offsets, graph.f_targets, graph.f_weights),
+            (graph.b_offsets, graph.b_targets, graph.b_weights)
+        )
+        heappop = heapq.heappop
+        heappush = heapq.heappush
+        # distances and parents of the forward (0) and backward (1) search
+        distances = ([inf] * graph.node_count, [inf] * graph.node_count)
+        parents = ([None] * graph.node_count, [None] * graph.node_count)
+        heaps = ([(0, i_source)], [(0, i_target)])
+        distances[0][i_source] = 0
+        distances[1][i_target] = 0
+        parents[0][i_source] = i_source
+        parents[1][i_target] = i_target
+        best = 0 if i_source == i_target else inf
+        i_meet = i_source if i_source == i_target else None
+        counter = 0
+        while heaps[0] and heaps[1]:
+            if heaps[0][0][0] + heaps[1][0][0] >= best:
+                break
+            side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+            dist_node, i_node = heappop(heaps[side])
+            own = distances[side]
+            if dist_node > own[i_node]:
+                continue
+            counter += 1
+            other = distances[1 - side]
+            parent = parents[side]
+            offsets, heads, weights = sides[side]
+            for pos in range(offsets[i_node], offsets[i_node + 1]):
+                i_head = heads[pos]
+                new_dist = dist_node + weights[pos]
+                if own[i_head] > new_dist:
+                    own[i_head] = new_dist
+                    parent[i_head] = i_node
+                    heappush(heaps[side], (new_dist, i_head))
+                    if new_dist + other[i_head] < best:
+                        best = new_dist + other[i_head]
+                        i_meet = i_head
+        predecessors = parents[0]
+        if i_meet is not None:
+            # link the backward part of the path from the meeting node to the target
+            i_node = i_meet
+            while i_node != i_target:
+                i_next = parents[1][i_node]
+                predecessors[i_next] = i_node
+                i_node = i_next
+        if count:
+            return (best, predecessors, counter)
+        return (best, predecessors)
+
+    def one_to_many(
+        self,
+        i_source: int,
+        i_targets: list[int],
+        predecessors: bool = False
+    ) -> np.ndarray:
+        """
+        This method finds the shortest distances from a source node to several target nodes with a
+        single search that stops as soon as all targets are settled. It returns the distances in the
+        order of i_targets (inf if unreachable) and with predecessors=True also the predecessor
+        array of the search (-1 for nodes not reached, the source is its own predecessor).
+        """
+        graph = self._compact_graph()
+        distances, parents = _settle(
+            (graph.f_offsets, graph.f_targets, graph.f_weights),
+            graph.node_count, i_source, i_targets
+        )
+        result = np.array([distances[i_target] for i_target in i_targets], dtype=np.float64)
+        if predecessors:
+            return result, np.array(parents, dtype=np.int64)
+        return result
+
+    def many_to_many(
+        self,
+        i_sources: list[int],
+        i_targets: list[int],
+        predecessors: bool = False,
+        hierarchy=None
+    ) -> np.ndarray:
+        """
+        This method returns the matrix of shortest distances from every source node (rows) to every
+        target node (columns). With a ContractionHierarchy the bucket-based algorithm is used, i.e.
+        one upward search per source and per target. Otherwise one search is run per source, or, if
+        there are fewer targets than sources, one backward search per target. With
+        predecessors=True the forward searches are used and also the predecessor arrays of all
+        sources are returned as matrix with one row per source.
+        """
+        if hierarchy is not None:
+            if predecessors:
+                raise ValueError("Predecessors are not available with a contraction hierarchy")
+            return hierarchy.many_to_many(i_sources, i_targets)
+        graph = self._compact_graph()
+        matrix = np.full((len(i_sources), len(i_targets)), np.inf)
+        if len(i_targets) < len(i_sources) and not predecessors:
+            backward = (graph.b_offsets, graph.b_targets, graph.b_weights)
+            for column, i_target in enumerate(i_targets):
+                distances, _ = _settle(backward, graph.node_count, i_target, i_sources)
+                matrix[:, column] = [distances[i_source] for i_source in i_sources]
+            return matrix
+        forward = (graph.f_offsets, graph.f_targets, graph.f_weights)
+        parent_rows = None
+        if predecessors:
+            parent_rows = np.full((len(i_sources), graph.node_count), -1, dtype=np.int64)
+        for row, i_source in enumerate(i_sources):
+            distances, parents = _settle(forward, graph.node_count, i_source, i_targets)
+            matrix[row] = [distances[i_target] for i_target in i_targets]
+            if predecessors:
+                parent_rows[row] = parents
+        if predecessors:
+            return matrix, parent_rows
+        return matrix
+
+    def multi_source(
+        self,
+        i_seeds: list[int],
+        seed_dist: list[float] = None,
+        backward: bool = False
+    ) -> tuple[list[float], list[int], list[int]]:
+        """
+        This method runs one search from several seed nodes, each starting at its distance in
+        seed_dist (zero if not given). It returns for every node the distance from the nearest seed
+        (to the nearest seed if backward is set), that seed as owner (-1 if not reached), which
+        partitions the graph into Voronoi cells, and the predecessor towards it (None if not
+        reached). Every seed is its own owner and predecessor.
+        """
+        graph = self._compact_graph()
+        if backward:
+            offsets, heads, weights = graph.b_offsets, graph.b_targets, graph.b_weights
+        else:
+            offsets, heads, weights = graph.f_offsets, graph.f_targets, graph.f_weights
+        distances = [float("inf")] * graph.node_count
+        owners = [-1] * graph.node_count
+        predecessors = [None] * graph.node_count
+        heap = _seeds(i_seeds, seed_dist)
+        for start, i_seed in heap:
+            distances[i_seed] = start
+            owners[i_seed] = i_seed
+            predecessors[i_seed] = i_seed
+        while heap:
+            dist_node, i_node = heapq.heappop(heap)
+            if dist_node > distances[i_node]:
+                continue
+            owner = owners[i_node]
+            for pos in range(offsets[i_node], offsets[i_node + 1]):
+                i_head = heads[pos]
+                new_dist = dist_node + weights[pos]
+                if distances[i_head] > new_dist:
+                    distances[i_head] = new_dist
+                    owners[i_head] = owner
+                    predecessors[i_head] = i_node
+                    heapq.heappush(heap, (new_dist, i_head))
+        return distances, owners, predecessors
+
+    def astar(
+        self,
+        i_source: int = None,
+        i_target: int = None,
+        heuristic=None,
+        count: bool = False
+    ) -> tuple[float, list[int], int]:
+        """
+        This method finds a shortest path between source and target node using the A* algorithm.
+        The heuristic must provide bind(i_target), which returns a function estimating the distance
+        of a node to the target without overestimating it. By default a CoordinateHeuristic on the
+        node coordinates of a CompactGraph read from a file is used. The iteration counter counts
+        settled nodes.
+        """
+        graph = self._compact_graph()
+        self._refresh()
+        if heuristic is None:
+            if self.heuristic is None:
+                self.heuristic = CoordinateHeuristic(graph)
+            heuristic = self.heuristic
+        estimate = heuristic.bind(i_target)
+        offsets = graph.f_offsets
+        tails = graph.f_targets
+        weights = graph.f_weights
+        heappop = heapq.heappop
+        heappush = heapq.heappush
+        distances = [float("inf")] * graph.node_count
+        predecessors = [None] * graph.node_count
+        # estimates of the nodes reached so far, computed once per node
+        estimates = {i_source: estimate(i_source)}
+        distances[i_source] = 0
+        predecessors[i_source] = i_source
+        heap = [(estimates[i_source], i_source)]
+        counter = 0
+        while heap:
+            key, i_node = heappop(heap)
+            dist_node = distances[i_node]
+            # skip entries that were pushed before a shorter distance was found
+            if key > dist_node + estimates[i_node]:
+                continue
+            if i_node == i_target:
+                break
+            counter += 1
+            for pos in range(offsets[i_node], offsets[i_node + 1]):
+                i_tail = tails[pos]
+                new_dist = dist_node + weights[pos]
+                if distances[i_tail] > new_dist:
+                    if i_tail not in estimates:
+                        estimates[i_tail] = estimate(i_tail)
+                    distances[i_tail] = new_dist
+                    predecessors[i_tail] = i_node
+                    if estimates[i_tail] != float("inf"):
+                        heappush(heap, (new_dist + estimates[i_tail], i_tail))
+        if count:
+            return (distances[i_target], predecessors, counter)
+        return (distances[i_target], predecessors)
+
+    def _dijkstra_dist_compact(
+        self,
+        i_target: int,
+        radius: float = None,
+        settle: list[int] = None,
+        max_settled: int = None,
+        count: bool = False,
+        seed_dist: list[float] = None
+    ) -> list[float]:
+        """
+        This method is the array-backed counterpart of dijkstra_dist().
+        """
+        offsets = self.compact.b_offsets
+        heads = self.compact.b_targets
+        weights = self.compact.b_weights
+        heappop = heapq.heappop
+        heappush = heapq.heappush
+        workspace = self._workspace()
+        distances = workspace.distances
+        touched = workspace.touched
+        inf = float("inf")
+        if radius is None:
+            radius = inf
+        if max_settled is None:
+            max_settled = inf
+        remaining = set(settle) if settle is not None else None
+        heap = _seeds(i_target, seed_dist)
+        for start, i_seed in heap:
+            distances[i_seed] = start
+            touched.append(i_seed)
+        pops = stale = settled = relaxations = 0
+        bound = None
+        while heap:
+            dist_node, i_node = heappop(heap)
+            pops += 1
+            if dist_node > distances[i_node]:
+                stale += 1
+                continue
+            if dist_node > radius:
+                bound = dist_node
+                break
+            settled += 1
+            start, end = offsets[i_node], offsets[i_node + 1]
+            relaxations += end - start
+            for pos in range(start, end):
+                i_head = heads[pos]
+                new_dist = dist_node + weights[pos]
+                if distances[i_head] > new_dist:
+                    if distances[i_head] == inf:
+                        touched.append(i_head)
+                    distances[i_head] = new_dist
+                    heappush(heap, (new_dist, i_head))
+            if remaining is not None:
+                remaining.discard(i_node)
+                if not remaining:
+                    bound = dist_node
+                    break
+            if settled >= max_settled:
+                bound = dist_node
+                break
+        if self.workspace is None:
+            if bound is not None:
+                distances = [min(dist, bound) for dist in distances]
+        else:
+            distances = workspace.touched_distances(bound)
+        if count:
+            return (distances, {
+                "pops": pops, "stale": stale, "settled": settled, "relaxations": relaxations
+            })
+        return distances
+
+    def _dijkstra_compact(
+        self,
+        i_source: int,
+        i_target: int,
+        dist: list = None,
+        count: bool = False,
+        seed_dist: list[float] = None
+    ) -> tuple[float, list[int], int]:
+        """
+        This method is the array-backed counterpart of dijkstra(). It visits the nodes in the same
+        order, so distances, predecessors and iteration counts are identical.
+        """
+        offsets = self.compact.f_offsets
+        tails = self.compact.f_targets
+        weights = self.compact.f_weights
+        heappop = heapq.heappop
+        heappush = heapq.heappush
+        workspace = self._workspace()
+        distances = workspace.distances
+        predecessors = workspace.predecessors
+        touched = workspace.touched
+        inf = float("inf")
+        heap = _seeds(i_source, seed_dist, dist)
+        for start, i_seed in heap:
+            distances[i_seed] = start
+            predecessors[i_seed] = i_seed
+            touched.append(i_seed)
+        counter = 0
+        while heap:
+            _, i_node = heappop(heap)
+            if i_node == i_target:
+                break
+            counter += 1
+            dist_node = distances[i_node]
+            for pos in range(offsets[i_node], offsets[i_node + 1]):
+                i_tail = tails[pos]
+                if dist is not None:
+                    # same evaluation order as dijkstra() to get bit-identical distances
+                    new_dist = dist_node + (weights[pos] - dist[i_node] + dist[i_tail])
+                else:
+                    new_dist = dist_node + weights[pos]
+                if distances[i_tail] > new_dist:
+                    if distances[i_tail] == inf:
+                        touched.append(i_tail)
+                    distances[i_tail] = new_dist
+                    predecessors[i_tail] = i_node
+                    heappush(heap, (new_dist, i_tail))
+        if self.workspace is not None:
+            predecessors = workspace.touched_predecessors()
+        if count:
+            return (distances[i_target], predecessors, counter)
+        return (distances[i_target], predecessors)
+
+    def _dijkstra_dist_queue(
+        self,
+        i_target: int,
+        radius: float = None,
+        settle: list[int] = None,
+        max_settled: int = None,
+        count: bool = False,
+        seed_dist: list[float] = None,
+        profile: SearchProfile = None
+    ) -> list[float]:
+        """
+        This method is the counterpart of _dijkstra_dist_compact() on the selected queue. Given a
+        SearchProfile, the queue is wrapped in a ProfiledQueue and the phases are timed.
+        """
+        if profile is not None:
+            profile.start()
+        graph = self._compact_graph()
+        offsets = graph.b_offsets
+        heads = graph.b_targets
+        weights = graph.b_weights
+        workspace = self._workspace()
+        distances = workspace.distances
+        touched = workspace.touched
+        inf = float("inf")
+        if radius is None:
+            radius = inf
+        if max_settled is None:
+            max_settled = inf
+        remaining = set(settle) if settle is not None else None
+        queue = make_queue(self.queue, graph.node_count, self._span)
+        if profile is not None:
+            queue = ProfiledQueue(queue, profile, distances)
+        push, pop = queue.push, queue.pop
+        for start, i_seed in _seeds(i_target, seed_dist):
+            distances[i_seed] = start
+            touched.append(i_seed)
+            # the integer queues cannot take infinite keys, and such seeds reach nothing
+            if start < inf:
+                push(start, i_seed)
+        pops = stale = settled = relaxations = 0
+        bound = None
+        if profile is not None:
+            profile.phase("init")
+        while queue:
+            dist_node, i_node = pop()
+            pops += 1
+            if dist_node > distances[i_node]:
+                stale += 1
+                continue
+            if dist_node > radius:
+                bound = dist_node
+                break
+            settled += 1
+            start, end = offsets[i_node], offsets[i_node + 1]
+            relaxations += end - start
+            for pos in range(start, end):
+                i_head = heads[pos]
+                new_dist = dist_node + weights[pos]
+                if distances[i_head] > new_dist:
+                    if distances[i_head] == inf:
+                        touched.append(i_head)
+                    distances[i_head] = new_dist
+                    push(new_dist, i_head)
+            if remaining is not None:
+                remaining.discard(i_node)
+                if not remaining:
+                    bound = dist_node
+                    break
+            if settled >= max_settled:
+                bound = dist_node
+                break
+        if profile is not None:
+            profile.phase("search")
+            profile.relaxations += relaxations
+        if self.workspace is None:
+            if bound is not None:
+                distances = [min(dist, bound) for dist in distances]
+        else:
+            distances = workspace.touched_distances(bound)
+        if profile is not None:
+            profile.phase("finish")
+        if count:
+            return (distances, {
+                "pops": pops, "stale": stale, "settled": settled, "relaxations": relaxations
+            })
+        return distances
+
+    def _dijkstra_queue(
+        self,
+        i_source: int,
+        i_target: int,
+        dist: list = None,
+        count: bool = False,
+        seed_dist: list[float] = None,
+        profile: SearchProfile = None
+    ) -> tuple[float, list[int], int]:
+        """
+        This method is the counterpart of _dijkstra_compact() on the selected queue. It skips
+        outdated queue entries and counts the settled nodes, except on the binary heap, which it
+        only runs on for a SearchProfile: like _dijkstra_compact() it then processes outdated
+        entries again (they improve no distance) and counts them. Given a SearchProfile, the queue
+        is wrapped in a ProfiledQueue and the phases are timed.
+        """
+        if profile is not None:
+            profile.start()
+        graph = self._compact_graph()
+        offsets = graph.f_offsets
+        tails = graph.f_targets
+        weights = graph.f_weights
+        workspace = self._workspace()
+        distances = workspace.distances
+        predecessors = workspace.predecessors
+        touched = workspace.touched
+        inf = float("inf")
+        skip_stale = self.queue != "binary"
+        queue = make_queue(self.queue, graph.node_count, self._span)
+        if profile is not None:
+            queue = ProfiledQueue(queue, profile, distances)
+        push, pop = queue.push, queue.pop
+        for start, i_seed in _seeds(i_source, seed_dist, dist):
+            distances[i_seed] = start
+            predecessors[i_seed] = i_seed
+            touched.append(i_seed)
+            # a source that cannot reach the target has an infinite modified key
+            if start < inf:
+                push(start, i_seed)
+        counter = relaxations = 0
+        if profile is not None:
+            profile.phase("init")
+        while queue:
+            dist_node, i_node = pop()
+            if dist_node > distances[i_node] and skip_stale:
+                continue
+            if i_node == i_target:
+                break
+            counter += 1
+            start, end = offsets[i_node], offsets[i_node + 1]
+            relaxations += end - start
+            for pos in range(start, end):
+                i_tail = tails[pos]
+                if dist is not None:
+                    new_dist = dist_node + (weights[pos] - dist[i_node] + dist[i_tail])
+                else:
+                    new_dist = dist_node + weights[pos]
+                if distances[i_tail] > new_dist:
+                    if distances[i_tail] == inf:
+                        touched.append(i_tail)
+                    distances[i_tail] = new_dist
+                    predecessors[i_tail] = i_node
+                    push(new_dist, i_tail)
+        if profile is not None:
+            profile.phase("search")
+            profile.relaxations += relaxations
+        if self.workspace is not None:
+            predecessors = workspace.touched_predecessors()
+        if profile is not None:
+            profile.phase("finish")
+        if count:
+            return (distances[i_target], predecessors, counter)
+        return (distances[i_target], predecessors)
+
+    def _workspace(self) -> SearchWorkspace:
+        """
+        This method returns the reset workspace for a compact search, or a new one that is not kept
+        if workspace reuse is disabled.
+        """
+        if self.workspace is None:
+            return SearchWorkspace(self._compact_graph().node_count)
+        self.workspace.reset()
+        return self.workspace
+
+
+def _seeds(i_nodes, seed_dist: list[float] = None, dist: list = None) -> list[tuple]:
+    """
+    This function returns the (start distance, index) pairs of one or several seed nodes sorted by
+    distance, which makes the list a valid heap. A seed starts at its distance in seed_dist (zero
+    if not given) plus its backward difference if dist is given. Repeated seeds keep their smallest
+    start distance.
+    """
+    if isinstance(i_nodes, (int, np.integer)):
+        i_nodes = [i_nodes]
+    starts = {}
+    for position, i_node in enumerate(i_nodes):
+        if seed_dist is None:
+            start = 0 if dist is None else dist[i_node]
+        else:
+            start = seed_dist[position] if dist is None else seed_dist[position] + dist[i_node]
+        if i_node not in starts or start < starts[i_node]:
+            starts[i_node] = start
+    return sorted((start, i_node) for i_node, start in starts.items())
+
+
+def _settle(adjacency: tuple, node_count: int, i_root: int, i_wanted: list[int]) -> tuple:
+    """
+    This function runs Dijkstra's algorithm on CSR adjacency from a root node until all wanted nodes
+    are settled and returns the distances and parents (-1 if not reached) of all nodes.
+    """
+    offsets, heads, weights = adjacency
+    distances = [float("inf")] * node_count
+    parents = [-1] * node_count
+    distances[i_root] = 0
+    parents[i_root] = i_root
+    remaining = set(i_wanted)
+    heap = [(0, i_root)]
+    while heap and remaining:
+        dist_node, i_node = heapq.heappop(heap)
+        if dist_node > distances[i_node]:
+            continue
+        remaining.discard(i_node)
+        for pos in range(offsets[i_node], offsets[i_node + 1]):
+            i_head = heads[pos]
+            new_dist = dist_node + weights[pos]
+            if distances[i_head] > new_dist:
+                distances[i_head] = new_dist
+                parents[i_head] = i_node
+                heapq.heappush(heap, (new_dist, i_head))
+    return distances, parents
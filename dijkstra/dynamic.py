@@ -0,0 +1,203 @@
+"""
+This module contains shortest path trees that are repaired incrementally when edge weights of the
+graph change, instead of being computed again from scratch.
+"""
+import heapq
+from array import array
+
+try:
+    from .compact import CompactGraph
+    from .landmarks import full_search
+    from .potentials import PotentialCache
+except ImportError:
+    from compact import CompactGraph
+    from landmarks import full_search
+    from potentials import PotentialCache
+
+
+def set_arc_weights(graph: CompactGraph, changes: list[tuple[int, int, float]]) -> list[tuple]:
+    """
+    This function sets the weight of all arcs from tail to head to the new weight for every
+    (tail, head, weight) change, in the forward and the backward arrays of the graph. An undirected
+    edge consists of two arcs, so both directions have to be changed. Read-only arrays, like those
+    of a memory-mapped graph cache, are replaced by writable copies first. The version of the graph
+    is increased. It returns (tail, head, old weight, new weight) with the weight of the lightest
+    arc before and after.
+    """
+    for name in ("f_weights", "b_weights"):
+        weights = getattr(graph, name)
+        if not isinstance(weights, array):
+            setattr(graph, name, array("d", weights))
+    applied = []
+    for i_tail, i_head, weight in changes:
+        old = float("inf")
+        found = False
+        for pos in range(graph.f_offsets[i_tail], graph.f_offsets[i_tail + 1]):
+            if graph.f_targets[pos] == i_head:
+                old = min(old, graph.f_weights[pos])
+                graph.f_weights[pos] = weight
+                found = True
+        if not found:
+            raise ValueError(f"There is no arc from node {i_tail} to node {i_head}")
+        for pos in range(graph.b_offsets[i_head], graph.b_offsets[i_head + 1]):
+            if graph.b_targets[pos] == i_tail:
+                graph.b_weights[pos] = weight
+        applied.append((i_tail, i_head, old, weight))
+    graph.version += 1
+    return applied
+
+
+class DynamicDistances:
+    """
+    This class keeps the shortest path trees of tracked root nodes, with the distances of all nodes
+    to the root (backward, like Dijkstra.dijkstra_dist()) or from the root, and repairs them when
+    update() changes edge weights. The repair works like the dynamic algorithm of Ramalingam and
+    Reps: the subtrees hanging below arcs that became heavier lose their distances and get new
+    estimates from the unaffected nodes around them, the heads of arcs that became lighter get the
+    shorter distance, and one Dijkstra pass from these nodes settles exactly the nodes whose
+    distance changes.
+
+    If the subtrees below heavier arcs hold more than rebuild_fraction of the nodes, the tree is
+    computed again from scratch, which is faster for large batches.
+
+    If a PotentialCache is given as potentials, the repaired backward distances of all roots are
+    stored in it after every update, so dijkstra() gets current potentials for them without a new
+    backward search. A PotentialCache drops the vectors of the old weights by itself and Dijkstra
+    objects adapt their queue and heuristic to the new weights, but other structures derived from
+    the old weights, like landmarks, contraction hierarchies, hub labels and the binary graph
+    cache, are not updated.
+    """
+    def __init__(
+        self,
+        graph: CompactGraph,
+        backward: bool = True,
+        rebuild_fraction: float = 0.25,
+        potentials: PotentialCache = None
+    ):
+        self.graph = graph
+        self.backward = backward
+        self.rebuild_fraction = rebuild_fraction
+        self.potentials = potentials
+        self.trees = {}
+
+    def add(self, i_root: int) -> array:
+        """
+        This method tracks a root node and returns its distance vector.
+        """
+        distances, predecessors = full_search(self.graph, i_root, self.backward)
+        parents = array("q", (-1 if i_parent is None else i_parent for i_parent in predecessors))
+        self.trees[i_root] = (distances, parents)
+        return distances
+
+    def distances(self, i_root: int) -> array:
+        """
+        This method returns the distance vector of a tracked root node.
+        """
+        return self.trees[i_root][0]
+
+    def parents(self, i_root: int) -> array:
+        """
+        This method returns the parent of every node in the shortest path tree of a tracked root
+        node, -1 if the node is not reached.
+        """
+        return self.trees[i_root][1]
+
+    def update(self, changes: list[tuple[int, int, float]]) -> dict[int, int]:
+        """
+        This method applies (tail, head, weight) changes like set_arc_weights(), repairs the trees
+        of all tracked roots and stores their distances in potentials if given. It returns the
+        number of nodes whose distance changed for every root.
+        """
+        applied = set_arc_weights(self.graph, changes)
+        # arcs in the direction the searches of the trees run
+        if self.backward:
+            arcs = [(i_head, i_tail, old, new) for i_tail, i_head, old, new in applied]
+        else:
+            arcs = applied
+        changed = {i_root: self._repair(i_root, arcs) for i_root in self.trees}
+        if self.potentials is not None and self.backward:
+            for i_root, (distances, _) in self.trees.items():
+                # a copy, as the tree is repaired in place by the next update
+                self.potentials.put(self.potentials.key(self.graph, i_root), array("d", distances))
+        return changed
+
+    def _rebuild(self, i_root: int) -> int:
+        """
+        This method computes the tree of a root again and returns the number of nodes whose
+        distance changed.
+        """
+        old_distances = self.trees[i_root][0]
+        distances = self.add(i_root)
+        return sum(new != old for new, old in zip(distances, old_distances))
+
+    def _adjacency(self) -> tuple:
+        """
+        This method returns the CSR arrays of the search direction and of the opposite one.
+        """
+        graph = self.graph
+        forward = (graph.f_offsets, graph.f_targets, graph.f_weights)
+        backward = (graph.b_offsets, graph.b_targets, graph.b_weights)
+        return (backward, forward) if self.backward else (forward, backward)
+
+    def _repair(self, i_root: int, arcs: list[tuple]) -> int:
+        """
+        This method repairs the tree of a root after the weights of arcs (u, x, old, new) in search
+        direction changed and returns the number of nodes whose distance changed.
+        """
+        distances, parents = self.trees[i_root]
+        (offsets, targets, weights), (r_offsets, r_targets, r_weights) = self._adjacency()
+        inf = float("inf")
+        old_distances = {}
+        # collect the subtrees below tree arcs that became heavier
+        affected = set()
+        stack = [
+            i_node for i_parent, i_node, old, new in arcs
+            if new > old and parents[i_node] == i_parent and i_node != i_root
+        ]
+        while stack:
+            i_node = stack.pop()
+            if i_node in affected:
+                continue
+            affected.add(i_node)
+            for pos in range(offsets[i_node], offsets[i_node + 1]):
+                i_child = targets[pos]
+                if parents[i_child] == i_node and i_child != i_node:
+                    stack.append(i_child)
+        if len(affected) > self.rebuild_fraction * self.graph.node_count:
+            return self._rebuild(i_root)
+        for i_node in affected:
+            old_distances[i_node] = distances[i_node]
+            distances[i_node] = inf
+            parents[i_node] = -1
+        heap = []
+        # estimate the affected nodes from their unaffected neighbours
+        for i_node in affected:
+            best, best_parent = inf, -1
+            for pos in range(r_offsets[i_node], r_offsets[i_node + 1]):
+                i_parent = r_targets[pos]
+                if i_parent not in affected and distances[i_parent] + r_weights[pos] < best:
+                    best, best_parent = distances[i_parent] + r_weights[pos], i_parent
+            if best < inf:
+                distances[i_node], parents[i_node] = best, best_parent
+                heap.append((best, i_node))
+        # arcs that became lighter may shorten the distance of their head
+        for i_parent, i_node, old, new in arcs:
+            if new < old and distances[i_parent] + new < distances[i_node]:
+                old_distances.setdefault(i_node, distances[i_node])
+                distances[i_node] = distances[i_parent] + new
+                parents[i_node] = i_parent
+                heap.append((distances[i_node], i_node))
+        heapq.heapify(heap)
+        while heap:
+            dist_node, i_node = heapq.heappop(heap)
+            if dist_node > distances[i_node]:
+                continue
+            for pos in range(offsets[i_node], offsets[i_node + 1]):
+                i_next = targets[pos]
+                new_dist = dist_node + weights[pos]
+                if distances[i_next] > new_dist:
+                    old_distances.setdefault(i_next, distances[i_next])
+                    distances[i_next] = new_dist
+                    parents[i_next] = i_node
+                    heapq.heappush(heap, (new_dist, i_next))
+        return sum(distances[i_node] != old for i_node, old in old_distances.items())
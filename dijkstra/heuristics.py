@@ -0,0 +1,81 @@
+"""
+This module contains admissible heuristics for the A* search based on the node coordinates of a
+CompactGraph.
+"""
+import math
+
+
+EARTH_RADIUS = 6371.0088
+
+
+def euclidean(x_1: float, y_1: float, x_2: float, y_2: float) -> float:
+    """
+    This function returns the euclidean distance of two points with projected coordinates.
+    """
+    return math.hypot(x_1 - x_2, y_1 - y_2)
+
+
+def haversine(lon_1: float, lat_1: float, lon_2: float, lat_2: float) -> float:
+    """
+    This function returns the great-circle distance in kilometers of two points given by longitude
+    and latitude in degrees.
+    """
+    lon_1, lat_1, lon_2, lat_2 = map(math.radians, (lon_1, lat_1, lon_2, lat_2))
+    root = math.sin((lat_2 - lat_1) / 2) ** 2 \
+        + math.cos(lat_1) * math.cos(lat_2) * math.sin((lon_2 - lon_1) / 2) ** 2
+    return 2 * EARTH_RADIUS * math.asin(min(1.0, math.sqrt(root)))
+
+
+def is_geographic(coords: tuple) -> bool:
+    """
+    This function guesses whether coordinates are longitude and latitude in degrees.
+    """
+    xs, ys = coords
+    return all(-180 <= x <= 180 for x in xs) and all(-90 <= y <= 90 for y in ys)
+
+
+class CoordinateHeuristic:
+    """
+    This class estimates the distance of two nodes by a metric on their coordinates multiplied by a
+    scale. The scale is calibrated to the largest value for which no arc is shorter than the scaled
+    metric of its end nodes, so the heuristic is consistent and thus admissible. The metric defaults
+    to haversine for longitude/latitude coordinates and to euclidean otherwise.
+    """
+    def __init__(self, graph, metric=None, scale: float = None):
+        if graph.coords is None:
+            raise ValueError("The graph has no node coordinates")
+        self.graph = graph
+        if metric is None:
+            metric = haversine if is_geographic(graph.coords) else euclidean
+        self.metric = metric
+        self.scale = self.calibrate() if scale is None else scale
+
+    def calibrate(self) -> float:
+        """
+        This method returns the minimum ratio of arc weight to metric distance over all arcs,
+        slightly reduced to absorb floating point rounding.
+        """
+        xs, ys = self.graph.coords
+        offsets = self.graph.f_offsets
+        targets = self.graph.f_targets
+        weights = self.graph.f_weights
+        scale = float("inf")
+        for i_node in range(self.graph.node_count):
+            for pos in range(offsets[i_node], offsets[i_node + 1]):
+                i_target = targets[pos]
+                length = self.metric(xs[i_node], ys[i_node], xs[i_target], ys[i_target])
+                if length > 0:
+                    scale = min(scale, weights[pos] / length)
+        if scale == float("inf"):
+            return 0.0
+        return max(0.0, scale * (1 - 1e-9))
+
+    def bind(self, i_target: int):
+        """
+        This method returns a function that estimates the distance from a node index to the target.
+        """
+        xs, ys = self.graph.coords
+        x_target, y_target = xs[i_target], ys[i_target]
+        metric = self.metric
+        scale = self.scale
+        return lambda i_node: scale * metric(xs[i_node], ys[i_node], x_target, y_target)
@@ -0,0 +1,429 @@
+"""
+This module contains the preprocessing and the query of contraction hierarchies. The nodes are
+contracted one by one and shortcut arcs keep the distances of the remaining nodes. A query then
+only searches upward in the hierarchy from source and target.
+"""
+import heapq
+import struct
+import time
+from array import array
+
+import numpy as np
+
+try:
+    from .compact import CompactGraph
+except ImportError:
+    from compact import CompactGraph
+
+
+MAGIC = b"DJKC"
+VERSION = 1
+SUFFIX = ".ch"
+# magic, version, node count, upward arc count, downward arc count, graph fingerprint
+HEADER = struct.Struct("<4sI3q32s")
+
+
+def hierarchy_path(path: str) -> str:
+    """
+    This function returns the path of the contraction hierarchy file of a .gra-file.
+    """
+    return path + SUFFIX
+
+
+class ContractionHierarchy:
+    """
+    This class stores a contraction hierarchy in CSR form. The upward arrays hold for every node
+    the arcs to nodes of higher rank, the downward arrays the arcs coming from nodes of higher rank
+    (stored at the lower end). A middle value of -1 marks an arc of the graph, any other value the
+    node that was contracted when the shortcut was added, so a shortcut u -> x stands for the arcs
+    u -> middle and middle -> x.
+    """
+    def __init__(self, graph: CompactGraph, rank: array, upward: tuple, downward: tuple):
+        self.graph = graph
+        self.rank = rank
+        self.up_offsets, self.up_targets, self.up_weights, self.up_middles = upward
+        self.down_offsets, self.down_targets, self.down_weights, self.down_middles = downward
+        self.build_time = None
+
+    @classmethod
+    def build(cls, graph, witness_limit: int = 100) -> "ContractionHierarchy":
+        """
+        This method contracts the nodes of a CompactGraph (or a Graph read by the GraphReader) in
+        the order of their edge difference, i.e. shortcuts added minus arcs removed plus already
+        contracted neighbors, with lazy updates of the priorities. A shortcut u -> x is only added
+        if a witness search from u that avoids the contracted node and settles at most
+        witness_limit nodes finds no path that is at most as long.
+        """
+        start = time.perf_counter()
+        if not isinstance(graph, CompactGraph):
+            graph = CompactGraph.from_graph(graph)
+        contraction = _Contraction(graph, witness_limit)
+        hierarchy = cls(graph, *contraction.run())
+        hierarchy.build_time = time.perf_counter() - start
+        return hierarchy
+
+    @property
+    def shortcut_count(self) -> int:
+        """
+        This property returns the number of shortcut arcs in the hierarchy.
+        """
+        return sum(1 for middle in self.up_middles if middle >= 0) \
+            + sum(1 for middle in self.down_middles if middle >= 0)
+
+    def query(self, i_source: int, i_target: int, count: bool = False) -> tuple:
+        """
+        This method finds a shortest path between source and target node with an upward search
+        from both sides. Nodes reached on a suboptimal distance are not expanded (stall-on-demand).
+        It returns the distance and the unpacked path as list of node indices (None if there is no
+        path), and with count=True also the number of settled nodes.
+        """
+        dist, i_meet, parents, counter = self._search(i_source, i_target)
+        path = None
+        if i_meet is not None:
+            path = self._unpack_path(i_meet, parents)
+        if count:
+            return (dist, path, counter)
+        return (dist, path)
+
+    def distance(self, i_source: int, i_target: int) -> float:
+        """
+        This method returns the shortest distance between source and target node.
+        """
+        return self._search(i_source, i_target)[0]
+
+    def many_to_many(self, i_sources: list[int], i_targets: list[int]) -> np.ndarray:
+        """
+        This method returns the matrix of shortest distances from every source (rows) to every
+        target (columns) with the bucket-based algorithm. An upward search from every target stores
+        (column, distance) in a bucket at each settled node, then an upward search from every source
+        combines its distances with the buckets of the settled nodes.
+        """
+        buckets = {}
+        for column, i_target in enumerate(i_targets):
+            for i_node, dist in self._upward(i_target, 1).items():
+                buckets.setdefault(i_node, []).append((column, dist))
+        matrix = np.full((len(i_sources), len(i_targets)), np.inf)
+        for row, i_source in enumerate(i_sources):
+            values = matrix[row]
+            best = [float("inf")] * len(i_targets)
+            for i_node, dist in self._upward(i_source, 0).items():
+                for column, dist_target in buckets.get(i_node, ()):
+                    if dist + dist_target < best[column]:
+                        best[column] = dist + dist_target
+            values[:] = best
+        return matrix
+
+    def _upward(self, i_root: int, side: int) -> dict:
+        """
+        This method runs a complete upward search from a node, forward (side 0) or backward
+        (side 1), and returns the distances of the settled nodes that were not stalled.
+        """
+        inf = float("inf")
+        if side == 0:
+            offsets, heads, weights = self.up_offsets, self.up_targets, self.up_weights
+            stall = (self.down_offsets, self.down_targets, self.down_weights)
+        else:
+            offsets, heads, weights = self.down_offsets, self.down_targets, self.down_weights
+            stall = (self.up_offsets, self.up_targets, self.up_weights)
+        distances = {i_root: 0}
+        settled = {}
+        heap = [(0, i_root)]
+        while heap:
+            dist_node, i_node = heapq.heappop(heap)
+            if dist_node > distances[i_node]:
+                continue
+            if any(
+                distances.get(stall[1][pos], inf) + stall[2][pos] < dist_node
+                for pos in range(stall[0][i_node], stall[0][i_node + 1])
+            ):
+                continue
+            settled[i_node] = dist_node
+            for pos in range(offsets[i_node], offsets[i_node + 1]):
+                i_head = heads[pos]
+                new_dist = dist_node + weights[pos]
+                if new_dist < distances.get(i_head, inf):
+                    distances[i_head] = new_dist
+                    heapq.heappush(heap, (new_dist, i_head))
+        return settled
+
+    def _search(self, i_source: int, i_target: int) -> tuple:
+        inf = float("inf")
+        sides = (
+            (self.up_offsets, self.up_targets, self.up_weights),
+            (self.down_offsets, self.down_targets, self.down_weights)
+        )
+        distances = ({i_source: 0}, {i_target: 0})
+        # parent node and arc position of every reached node
+        parents = ({i_source: None}, {i_target: None})
+        heaps = ([(0, i_source)], [(0, i_target)])
+        best = inf
+        i_meet = None
+        counter = 0
+        side = 1
+        while heaps[0] or heaps[1]:
+            if heaps[1 - side]:
+                side = 1 - side
+            dist_node, i_node = heapq.heappop(heaps[side])
+            own = distances[side]
+            if dist_node > own[i_node]:
+                continue
+            if dist_node >= best:
+                # this side can not improve the result anymore
+                heaps[side].clear()
+                continue
+            counter += 1
+            other = distances[1 - side]
+            if i_node in other and dist_node + other[i_node] < best:
+                best = dist_node + other[i_node]
+                i_meet = i_node
+            # stall-on-demand: an arc from a higher node proves dist_node is not optimal
+            offsets, heads, weights = sides[1 - side]
+            if any(
+                own.get(heads[pos], inf) + weights[pos] < dist_node
+                for pos in range(offsets[i_node], offsets[i_node + 1])
+            ):
+                continue
+            offsets, heads, weights = sides[side]
+            for pos in range(offsets[i_node], offsets[i_node + 1]):
+                i_head = heads[pos]
+                new_dist = dist_node + weights[pos]
+                if new_dist < own.get(i_head, inf):
+                    own[i_head] = new_dist
+                    parents[side][i_head] = (i_node, pos)
+                    heapq.heappush(heaps[side], (new_dist, i_head))
+        return best, i_meet, parents, counter
+
+    def _unpack_path(self, i_meet: int, parents: tuple) -> list[int]:
+        """
+        This method builds the node sequence of the path through the meeting node from the parents
+        of both searches and unpacks all shortcuts.
+        """
+        path = [i_meet]
+        step = parents[0][i_meet]
+        while step is not None:
+            i_node, pos = step
+            path[:0] = [i_node] + self._unpack(i_node, self.up_middles[pos], path[0])
+            step = parents[0][i_node]
+        step = parents[1][i_meet]
+        i_tail = i_meet
+        while step is not None:
+            i_node, pos = step
+            path.extend(self._unpack(i_tail, self.down_middles[pos], i_node) + [i_node])
+            i_tail = i_node
+            step = parents[1][i_node]
+        return path
+
+    def _unpack(self, i_tail: int, i_middle: int, i_head: int) -> list[int]:
+        """
+        This method returns the inner nodes of the arc i_tail -> i_head with the given middle node.
+        """
+        inner = []
+        stack = [(i_tail, i_middle, i_head)]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, int):
+                inner.append(item)
+                continue
+            i_tail, i_middle, i_head = item
+            if i_middle < 0:
+                continue
+            # the arcs of the middle node were fixed when it was contracted
+            first = self._middle_of(
+                self.down_offsets, self.down_targets, self.down_middles, i_middle, i_tail
+            )
+            second = self._middle_of(
+                self.up_offsets, self.up_targets, self.up_middles, i_middle, i_head
+            )
+            # pushed in reverse order, so the first half is unpacked first
+            stack.append((i_middle, second, i_head))
+            stack.append(i_middle)
+            stack.append((i_tail, first, i_middle))
+        return inner
+
+    @staticmethod
+    def _middle_of(offsets, targets, middles, i_node: int, i_other: int) -> int:
+        for pos in range(offsets[i_node], offsets[i_node + 1]):
+            if targets[pos] == i_other:
+                return middles[pos]
+        raise ValueError(f"Missing arc between {i_node} and {i_other} in the hierarchy")
+
+    def save(self, path: str):
+        """
+        This method writes the hierarchy to a binary file.
+        """
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(
+                MAGIC, VERSION, self.graph.node_count, len(self.up_targets),
+                len(self.down_targets), self.graph.fingerprint()
+            ))
+            for values in (
+                self.rank,
+                self.up_offsets, self.up_targets, self.up_weights, self.up_middles,
+                self.down_offsets, self.down_targets, self.down_weights, self.down_middles
+            ):
+                file.write(memoryview(values).cast("B"))
+
+    @classmethod
+    def load(cls, path: str, graph: CompactGraph) -> "ContractionHierarchy":
+        """
+        This method reads a hierarchy written by save() for the given graph. A ValueError is raised
+        for a file of another format, version or graph and for a truncated file.
+        """
+        with open(path, "rb") as file:
+            header = file.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise ValueError(f"{path} is truncated")
+            magic, version, node_count, up_count, down_count, fingerprint = HEADER.unpack(header)
+            if (magic, version) != (MAGIC, VERSION):
+                raise ValueError(f"{path} is not a contraction hierarchy file of version {VERSION}")
+            if fingerprint != graph.fingerprint():
+                raise ValueError(f"{path} belongs to another graph")
+            sections = []
+            for typecode, length in (
+                ("q", node_count),
+                ("q", node_count + 1), ("q", up_count), ("d", up_count), ("q", up_count),
+                ("q", node_count + 1), ("q", down_count), ("d", down_count), ("q", down_count)
+            ):
+                values = array(typecode)
+                try:
+                    values.fromfile(file, length)
+                except EOFError as error:
+                    raise ValueError(f"{path} is truncated") from error
+                sections.append(values)
+        return cls(graph, sections[0], tuple(sections[1:5]), tuple(sections[5:9]))
+
+
+class _Contraction:
+    """
+    This class holds the remaining graph while the nodes are contracted. out_arcs[u][x] and
+    in_arcs[x][u] are (weight, middle) of the arc u -> x.
+    """
+    def __init__(self, graph: CompactGraph, witness_limit: int):
+        self.node_count = graph.node_count
+        self.witness_limit = witness_limit
+        self.out_arcs = [{} for _ in range(graph.node_count)]
+        self.in_arcs = [{} for _ in range(graph.node_count)]
+        for i_node in range(graph.node_count):
+            for i_head, weight in graph.forward(i_node):
+                if i_head == i_node:
+                    continue
+                if i_head not in self.out_arcs[i_node] \
+                        or weight < self.out_arcs[i_node][i_head][0]:
+                    self.out_arcs[i_node][i_head] = (weight, -1)
+                    self.in_arcs[i_head][i_node] = (weight, -1)
+        self.contracted_neighbors = [0] * graph.node_count
+
+    def run(self) -> tuple:
+        """
+        This method contracts all nodes and returns rank, upward and downward arrays.
+        """
+        heap = [(self.priority(i_node), i_node) for i_node in range(self.node_count)]
+        heapq.heapify(heap)
+        rank = array("q", bytes(8 * self.node_count))
+        upward = [None] * self.node_count
+        downward = [None] * self.node_count
+        level = 0
+        while heap:
+            _, i_node = heapq.heappop(heap)
+            priority = self.priority(i_node)
+            if heap and priority > heap[0][0]:
+                heapq.heappush(heap, (priority, i_node))
+                continue
+            rank[i_node] = level
+            level += 1
+            upward[i_node] = [(i_head, *arc) for i_head, arc in self.out_arcs[i_node].items()]
+            downward[i_node] = [(i_tail, *arc) for i_tail, arc in self.in_arcs[i_node].items()]
+            self.contract(i_node)
+        return rank, _to_csr(upward), _to_csr(downward)
+
+    def priority(self, i_node: int) -> int:
+        """
+        This method returns the edge difference of a node plus its contracted neighbors.
+        """
+        return len(self.shortcuts(i_node)) - len(self.out_arcs[i_node]) \
+            - len(self.in_arcs[i_node]) + self.contracted_neighbors[i_node]
+
+    def shortcuts(self, i_node: int) -> list[tuple]:
+        """
+        This method returns the shortcuts (tail, head, weight) needed to contract a node.
+        """
+        result = []
+        if not self.out_arcs[i_node]:
+            return result
+        max_out = max(weight for weight, _ in self.out_arcs[i_node].values())
+        for i_tail, (weight_in, _) in self.in_arcs[i_node].items():
+            via = {
+                i_head: weight_in + weight_out
+                for i_head, (weight_out, _) in self.out_arcs[i_node].items()
+                if i_head != i_tail
+            }
+            if not via:
+                continue
+            witness = self.witness_search(i_tail, i_node, weight_in + max_out, via)
+            for i_head, weight in via.items():
+                if witness.get(i_head, float("inf")) > weight:
+                    result.append((i_tail, i_head, weight))
+        return result
+
+    def witness_search(self, i_source: int, i_avoid: int, max_dist: float, targets: dict) -> dict:
+        """
+        This method returns tentative distances from a node in the remaining graph without i_avoid,
+        stopping at max_dist, when all targets are settled or after witness_limit settled nodes.
+        """
+        distances = {i_source: 0}
+        heap = [(0, i_source)]
+        remaining = len(targets)
+        settled = 0
+        while heap:
+            dist_node, i_node = heapq.heappop(heap)
+            if dist_node > distances[i_node]:
+                continue
+            if dist_node > max_dist or settled >= self.witness_limit:
+                break
+            settled += 1
+            if i_node in targets:
+                remaining -= 1
+                if remaining == 0:
+                    break
+            for i_head, (weight, _) in self.out_arcs[i_node].items():
+                if i_head == i_avoid:
+                    continue
+                new_dist = dist_node + weight
+                if new_dist < distances.get(i_head, float("inf")):
+                    distances[i_head] = new_dist
+                    heapq.heappush(heap, (new_dist, i_head))
+        return distances
+
+    def contract(self, i_node: int):
+        """
+        This method removes a node from the remaining graph and adds the needed shortcuts.
+        """
+        shortcuts = self.shortcuts(i_node)
+        for i_head in self.out_arcs[i_node]:
+            del self.in_arcs[i_head][i_node]
+            self.contracted_neighbors[i_head] += 1
+        for i_tail in self.in_arcs[i_node]:
+            del self.out_arcs[i_tail][i_node]
+            self.contracted_neighbors[i_tail] += 1
+        for i_tail, i_head, weight in shortcuts:
+            arc = self.out_arcs[i_tail].get(i_head)
+            if arc is None or weight < arc[0]:
+                self.out_arcs[i_tail][i_head] = (weight, i_node)
+                self.in_arcs[i_head][i_tail] = (weight, i_node)
+
+
+def _to_csr(arcs: list[list[tuple]]) -> tuple:
+    """
+    This function converts per-node lists of (node, weight, middle) into CSR arrays.
+    """
+    offsets = array("q", [0])
+    targets = array("q")
+    weights = array("d")
+    middles = array("q")
+    for node_arcs in arcs:
+        for i_other, weight, i_middle in node_arcs:
+            targets.append(i_other)
+            weights.append(weight)
+            middles.append(i_middle)
+        offsets.append(len(targets))
+    return offsets, targets, weights, middles
@@ -0,0 +1,105 @@
+"""
+This module contains the opt-in instrumentation of the searches of the Dijkstra class.
+"""
+import time
+
+
+COUNTERS = ("pushes", "pops", "stale", "relaxations", "improved", "max_heap")
+PHASES = ("init", "search", "finish")
+
+
+class SearchProfile:
+    """
+    This class collects what happens inside the search loops of dijkstra() and dijkstra_dist() when
+    it is passed as profile: the numbers of queue pushes, pops, stale pops (entries whose node
+    already has a smaller distance), relaxed arcs and relaxations that improved a distance, the
+    largest queue size, and the seconds spent initializing the vectors, searching and building the
+    result. Counters and timers add up over all searches the profile is passed to. If a hook is
+    given, it is called as hook(event, i_node, dist) for the events "push", "pop" and "stale".
+    """
+    def __init__(self, hook=None):
+        self.hook = hook
+        self.pushes = 0
+        self.pops = 0
+        self.stale = 0
+        self.relaxations = 0
+        self.improved = 0
+        self.max_heap = 0
+        self.timers = dict.fromkeys(PHASES, 0.0)
+        self._clock = None
+
+    def start(self):
+        """
+        This method starts timing the init phase.
+        """
+        self._clock = time.perf_counter()
+
+    def phase(self, name: str):
+        """
+        This method ends the timing of the phase with the given name and starts the next one.
+        """
+        now = time.perf_counter()
+        self.timers[name] += now - self._clock
+        self._clock = now
+
+    def as_dict(self) -> dict:
+        """
+        This method returns the counters and the timers of all phases in seconds.
+        """
+        result = {counter: getattr(self, counter) for counter in COUNTERS}
+        result.update({f"{name}_time": self.timers[name] for name in PHASES})
+        return result
+
+    def __str__(self) -> str:
+        counters = ", ".join(f"{counter} {getattr(self, counter)}" for counter in COUNTERS)
+        timers = ", ".join(f"{name} {1000 * self.timers[name]:.3f} ms" for name in PHASES)
+        return f"{counters}; {timers}"
+
+
+class ProfiledQueue:
+    """
+    This class wraps a queue of the queues module for a search with a SearchProfile. It counts the
+    pushes, pops and stale pops (pairs whose key is larger than the distance of their item in
+    distances), tracks the largest queue size and calls the hook of the profile for every event.
+    The seeds are pushed before the first pop, so every later push counts as improved relaxation.
+    """
+    def __init__(self, queue, profile: SearchProfile, distances):
+        self.queue = queue
+        self.profile = profile
+        self.distances = distances
+        self.hook = profile.hook
+        self.searching = False
+
+    def push(self, key: float, item: int):
+        """
+        This method inserts an item with a key and records the push.
+        """
+        queue = self.queue
+        profile = self.profile
+        queue.push(key, item)
+        profile.pushes += 1
+        if self.searching:
+            profile.improved += 1
+        if len(queue) > profile.max_heap:
+            profile.max_heap = len(queue)
+        if self.hook is not None:
+            self.hook("push", item, key)
+
+    def pop(self) -> tuple[float, int]:
+        """
+        This method removes and returns the pair with the smallest key and records the pop.
+        """
+        self.searching = True
+        key, item = self.queue.pop()
+        profile = self.profile
+        profile.pops += 1
+        if self.hook is not None:
+            self.hook("pop", item, key)
+        if key > self.distances[item]:
+            profile.stale += 1
+            if self.hook is not None:
+                self.hook("stale", item, key)
+        return key, item
+
+    def __len__(self) -> int:
+        return len(self.queue)
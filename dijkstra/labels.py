@@ -0,0 +1,301 @@
+"""
+This module contains a distance oracle based on pruned hub labels. Every node gets a forward label
+of hubs it reaches and a backward label of hubs reaching it, each with the distance, such that
+every shortest path passes a hub common to the labels of its end nodes. A distance query is a
+merge of two sorted labels.
+"""
+import heapq
+import struct
+import time
+from array import array
+from bisect import bisect_left
+
+try:
+    from .compact import CompactGraph
+    from .hierarchy import ContractionHierarchy
+except ImportError:
+    from compact import CompactGraph
+    from hierarchy import ContractionHierarchy
+
+
+MAGIC = b"DJKH"
+VERSION = 1
+SUFFIX = ".hl"
+# magic, version, node count, forward label entries, backward label entries, graph fingerprint
+HEADER = struct.Struct("<4sI3q32s")
+
+
+def labels_path(path: str) -> str:
+    """
+    This function returns the path of the hub label file of a .gra-file.
+    """
+    return path + SUFFIX
+
+
+def hierarchy_order(hierarchy: ContractionHierarchy) -> list[int]:
+    """
+    This function returns the node indices by decreasing rank in a contraction hierarchy.
+    """
+    return sorted(range(len(hierarchy.rank)), key=lambda i_node: -hierarchy.rank[i_node])
+
+
+def degree_order(graph: CompactGraph) -> list[int]:
+    """
+    This function returns the node indices by decreasing number of forward and backward arcs.
+    """
+    return sorted(
+        range(graph.node_count),
+        key=lambda i_node: (
+            graph.f_offsets[i_node] - graph.f_offsets[i_node + 1]
+            + graph.b_offsets[i_node] - graph.b_offsets[i_node + 1],
+            i_node
+        )
+    )
+
+
+class HubLabels:
+    """
+    This class stores the labels in CSR form. The entries of the forward label of node u are found
+    at the positions out_offsets[u] to out_offsets[u + 1] - 1 of out_hubs, out_dists and out_next:
+    the rank of the hub h, d(u, h) and the next node on the path from u to h. The backward labels
+    in_* hold the rank of the hub h, d(h, u) and the node before u on the path from h to u. The
+    entries of every label are sorted by hub rank, and order[rank] is the node of a rank.
+    """
+    def __init__(self, graph: CompactGraph, order: array, outgoing: tuple, incoming: tuple):
+        self.graph = graph
+        self.order = order
+        self.out_offsets, self.out_hubs, self.out_dists, self.out_next = outgoing
+        self.in_offsets, self.in_hubs, self.in_dists, self.in_next = incoming
+        self.build_time = None
+
+    @classmethod
+    def build(cls, graph, order=None) -> "HubLabels":
+        """
+        This method computes the labels of a CompactGraph (or a Graph read by the GraphReader) with
+        pruned Dijkstra searches from every node in the given order. The forward search from the
+        k-th node adds it as hub to the backward labels of the nodes it settles, the backward
+        search to their forward labels, except at nodes whose distance the labels of the first
+        k - 1 hubs already give; the searches are not continued there. The order is a list of node
+        indices or a ContractionHierarchy, whose ranks are used from the top. By default a
+        hierarchy is built, which gives much smaller labels than degree_order() on road networks.
+        """
+        start = time.perf_counter()
+        if not isinstance(graph, CompactGraph):
+            graph = CompactGraph.from_graph(graph)
+        if order is None:
+            order = ContractionHierarchy.build(graph)
+        if isinstance(order, ContractionHierarchy):
+            order = hierarchy_order(order)
+        node_count = graph.node_count
+        out_labels = [([], [], []) for _ in range(node_count)]
+        in_labels = [([], [], []) for _ in range(node_count)]
+        # distances of the current hub to and from the hubs of its own labels
+        hub_dist = [float("inf")] * node_count
+        forward = (graph.f_offsets, graph.f_targets, graph.f_weights)
+        backward = (graph.b_offsets, graph.b_targets, graph.b_weights)
+        for rank, i_hub in enumerate(order):
+            # the forward search is pruned by the forward label of the hub and fills backward labels
+            _pruned_search(forward, rank, i_hub, out_labels[i_hub], in_labels, hub_dist)
+            _pruned_search(backward, rank, i_hub, in_labels[i_hub], out_labels, hub_dist)
+        labels = cls(graph, array("q", order), _to_csr(out_labels), _to_csr(in_labels))
+        labels.build_time = time.perf_counter() - start
+        return labels
+
+    def distance(self, i_source: int, i_target: int) -> float:
+        """
+        This method returns the distance from source to target index, inf if there is no path.
+        """
+        return self._meet(i_source, i_target)[0]
+
+    def query(self, i_source: int, i_target: int, count: bool = False) -> tuple:
+        """
+        This method returns the distance and the node indices of a shortest path from source to
+        target index (inf and None if there is no path), and with count=True also the number of
+        label entries of both nodes.
+        """
+        dist, rank = self._meet(i_source, i_target)
+        path = None if rank is None else self._path(i_source, i_target, rank)
+        if count:
+            entries = self.out_offsets[i_source + 1] - self.out_offsets[i_source] \
+                + self.in_offsets[i_target + 1] - self.in_offsets[i_target]
+            return (dist, path, entries)
+        return (dist, path)
+
+    def _path(self, i_source: int, i_target: int, rank: int) -> list[int]:
+        """
+        This method follows the next nodes stored with the hub of the given rank from the source
+        up to the hub and from the target back to the hub. Every node on these paths has the hub in
+        its label, as the pruned search only continued from labeled nodes.
+        """
+        i_hub = self.order[rank]
+        path = []
+        i_node = i_source
+        while i_node != i_hub:
+            path.append(i_node)
+            i_node = self._entry(self.out_offsets, self.out_hubs, self.out_next, i_node, rank)
+        tail = []
+        i_node = i_target
+        while i_node != i_hub:
+            tail.append(i_node)
+            i_node = self._entry(self.in_offsets, self.in_hubs, self.in_next, i_node, rank)
+        return path + [i_hub] + tail[::-1]
+
+    def _meet(self, i_source: int, i_target: int) -> tuple[float, int]:
+        """
+        This method merges the forward label of the source with the backward label of the target
+        and returns the shortest distance over their common hubs and the rank of its hub.
+        """
+        out_hubs, out_dists = self.out_hubs, self.out_dists
+        in_hubs, in_dists = self.in_hubs, self.in_dists
+        pos_out, end_out = self.out_offsets[i_source], self.out_offsets[i_source + 1]
+        pos_in, end_in = self.in_offsets[i_target], self.in_offsets[i_target + 1]
+        best, best_rank = float("inf"), None
+        while pos_out < end_out and pos_in < end_in:
+            hub_out, hub_in = out_hubs[pos_out], in_hubs[pos_in]
+            if hub_out < hub_in:
+                pos_out += 1
+            elif hub_out > hub_in:
+                pos_in += 1
+            else:
+                dist = out_dists[pos_out] + in_dists[pos_in]
+                if dist < best:
+                    best, best_rank = dist, hub_out
+                pos_out += 1
+                pos_in += 1
+        return best, best_rank
+
+    @staticmethod
+    def _entry(offsets, hubs, nexts, i_node: int, rank: int) -> int:
+        """
+        This method returns the next node stored with a hub rank in the label of a node.
+        """
+        pos = bisect_left(hubs, rank, offsets[i_node], offsets[i_node + 1])
+        return nexts[pos]
+
+    def stats(self) -> dict:
+        """
+        This method returns the build time, the total, mean and maximum label sizes and the bytes
+        of the label arrays.
+        """
+        node_count = self.graph.node_count
+        sizes = [
+            self.out_offsets[i_node + 1] - self.out_offsets[i_node]
+            + self.in_offsets[i_node + 1] - self.in_offsets[i_node]
+            for i_node in range(node_count)
+        ]
+        entries = len(self.out_hubs) + len(self.in_hubs)
+        return {
+            "build_time": self.build_time,
+            "entries": entries,
+            "mean_label": entries / (2 * node_count) if node_count else 0.0,
+            "max_label": max(sizes, default=0),
+            "bytes": 8 * (2 * (node_count + 1) + 3 * entries),
+        }
+
+    def save(self, path: str):
+        """
+        This method writes the labels to a binary file.
+        """
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(
+                MAGIC, VERSION, self.graph.node_count, len(self.out_hubs), len(self.in_hubs),
+                self.graph.fingerprint()
+            ))
+            for values in (
+                self.order,
+                self.out_offsets, self.out_hubs, self.out_dists, self.out_next,
+                self.in_offsets, self.in_hubs, self.in_dists, self.in_next
+            ):
+                file.write(memoryview(values).cast("B"))
+
+    @classmethod
+    def load(cls, path: str, graph: CompactGraph) -> "HubLabels":
+        """
+        This method reads labels written by save() for the given graph. A ValueError is raised
+        for a file of another format, version or graph and for a truncated file.
+        """
+        with open(path, "rb") as file:
+            header = file.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise ValueError(f"{path} is truncated")
+            magic, version, node_count, out_count, in_count, fingerprint = HEADER.unpack(header)
+            if (magic, version) != (MAGIC, VERSION):
+                raise ValueError(f"{path} is not a hub label file of version {VERSION}")
+            if fingerprint != graph.fingerprint():
+                raise ValueError(f"{path} belongs to another graph")
+            sections = []
+            for typecode, length in (
+                ("q", node_count),
+                ("q", node_count + 1), ("q", out_count), ("d", out_count), ("q", out_count),
+                ("q", node_count + 1), ("q", in_count), ("d", in_count), ("q", in_count)
+            ):
+                values = array(typecode)
+                try:
+                    values.fromfile(file, length)
+                except EOFError as error:
+                    raise ValueError(f"{path} is truncated") from error
+                sections.append(values)
+        return cls(graph, sections[0], tuple(sections[1:5]), tuple(sections[5:9]))
+
+
+def _pruned_search(
+    adjacency: tuple,
+    rank: int,
+    i_hub: int,
+    hub_label: tuple,
+    labels: list[tuple],
+    hub_dist: list[float]
+):
+    """
+    This function runs the pruned Dijkstra search from a hub over the given arcs. hub_label is the
+    label of the hub on the side the search starts from, labels are the labels on the other side,
+    which get the hub with its distance and the previous node at every settled node that is not
+    pruned. hub_dist is a vector of infinities, restored on return.
+    """
+    offsets, targets, weights = adjacency
+    hubs, dists, _ = hub_label
+    for hub, dist in zip(hubs, dists):
+        hub_dist[hub] = dist
+    inf = float("inf")
+    distances = {i_hub: 0.0}
+    previous = {i_hub: i_hub}
+    settled = set()
+    heap = [(0.0, i_hub)]
+    while heap:
+        dist_node, i_node = heapq.heappop(heap)
+        if i_node in settled:
+            continue
+        settled.add(i_node)
+        # prune if a hub of higher rank already gives this distance
+        node_hubs, node_dists, node_next = labels[i_node]
+        known = min(
+            (hub_dist[hub] + dist for hub, dist in zip(node_hubs, node_dists)), default=inf
+        )
+        if known <= dist_node:
+            continue
+        node_hubs.append(rank)
+        node_dists.append(dist_node)
+        node_next.append(previous[i_node])
+        for pos in range(offsets[i_node], offsets[i_node + 1]):
+            i_next = targets[pos]
+            new_dist = dist_node + weights[pos]
+            if i_next not in settled and new_dist < distances.get(i_next, inf):
+                distances[i_next] = new_dist
+                previous[i_next] = i_node
+                heapq.heappush(heap, (new_dist, i_next))
+    for hub in hubs:
+        hub_dist[hub] = inf
+
+
+def _to_csr(labels: list[tuple]) -> tuple:
+    """
+    This function converts the labels of all nodes into (offsets, hubs, dists, next) arrays.
+    """
+    offsets = array("q", [0])
+    hubs, dists, nexts = array("q"), array("d"), array("q")
+    for node_hubs, node_dists, node_next in labels:
+        hubs.extend(node_hubs)
+        dists.extend(node_dists)
+        nexts.extend(node_next)
+        offsets.append(len(hubs))
+    return offsets, hubs, dists, nexts
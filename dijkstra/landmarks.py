@@ -0,0 +1,272 @@
+"""
+This module contains the landmark preprocessing of the ALT algorithm (A*, landmarks and triangle
+inequality). The distances from and to a few landmarks give lower bounds for the distance of any
+node to any target, which are used as potential by Dijkstra.astar().
+"""
+import heapq
+import math
+import random
+import struct
+from array import array
+
+
+MAGIC = b"DJKL"
+VERSION = 1
+SUFFIX = ".alt"
+# magic, version, strategy, landmark count, graph fingerprint
+HEADER = struct.Struct("<4sIiq32s")
+STRATEGIES = ("farthest", "avoid", "planar")
+
+
+def landmarks_path(path: str) -> str:
+    """
+    This function returns the path of the landmark file of a .gra-file.
+    """
+    return path + SUFFIX
+
+
+def full_search(graph, i_source: int, backward: bool = False) -> tuple[array, list]:
+    """
+    This function returns the distances from a node to all nodes (or from all nodes to it if
+    backward is set) and the predecessor of every node in the shortest path tree.
+    """
+    if backward:
+        offsets, targets, weights = graph.b_offsets, graph.b_targets, graph.b_weights
+    else:
+        offsets, targets, weights = graph.f_offsets, graph.f_targets, graph.f_weights
+    distances = array("d", [math.inf]) * graph.node_count
+    predecessors = [None] * graph.node_count
+    distances[i_source] = 0
+    predecessors[i_source] = i_source
+    heap = [(0.0, i_source)]
+    while heap:
+        dist_node, i_node = heapq.heappop(heap)
+        if dist_node > distances[i_node]:
+            continue
+        for pos in range(offsets[i_node], offsets[i_node + 1]):
+            i_next = targets[pos]
+            new_dist = dist_node + weights[pos]
+            if distances[i_next] > new_dist:
+                distances[i_next] = new_dist
+                predecessors[i_next] = i_node
+                heapq.heappush(heap, (new_dist, i_next))
+    return distances, predecessors
+
+
+class Landmarks:
+    """
+    This class stores the landmark indices and, for every landmark L, the distances d(L, v) in
+    forward[k * node_count + v] and d(v, L) in backward[k * node_count + v]. bind(i_target) returns
+    the potential max(d(L, t) - d(L, v), d(v, L) - d(t, L)) over all landmarks, a lower bound of
+    d(v, t) by the triangle inequality.
+    """
+    def __init__(
+        self,
+        graph,
+        landmarks: list[int],
+        forward: array = None,
+        backward: array = None,
+        strategy: str = None
+    ):
+        self.graph = graph
+        self.landmarks = list(landmarks)
+        self.strategy = strategy
+        if forward is None or backward is None:
+            forward = array("d")
+            backward = array("d")
+            for i_landmark in self.landmarks:
+                forward.extend(full_search(graph, i_landmark)[0])
+                backward.extend(full_search(graph, i_landmark, backward=True)[0])
+        self.forward = forward
+        self.backward = backward
+
+    @classmethod
+    def select(cls, graph, count: int, strategy: str = "farthest", seed: int = 0) -> "Landmarks":
+        """
+        This method selects count landmarks with one of the strategies "farthest" (each landmark is
+        the node farthest from the ones chosen so far), "avoid" (landmarks are placed in the region
+        of a shortest path tree where the current bounds are worst) or "planar" (the node farthest
+        from the center in each of count equal sectors around it, needs node coordinates) and
+        computes their distance tables.
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown landmark strategy {strategy}, use one of {STRATEGIES}")
+        count = min(count, graph.node_count)
+        rng = random.Random(seed)
+        if strategy == "planar":
+            return cls(graph, _select_planar(graph, count), strategy=strategy)
+        landmarks = cls(graph, [], strategy=strategy)
+        while len(landmarks.landmarks) < count:
+            if strategy == "farthest":
+                i_landmark = landmarks._farthest(rng)
+            else:
+                # a root whose tree is already covered by landmarks yields no candidate
+                for _ in range(10):
+                    i_landmark = landmarks._avoid(rng)
+                    if i_landmark is not None:
+                        break
+            if i_landmark is None or i_landmark in landmarks.landmarks:
+                break
+            landmarks.add(i_landmark)
+        return landmarks
+
+    def add(self, i_landmark: int):
+        """
+        This method adds a landmark and its distance tables.
+        """
+        self.landmarks.append(i_landmark)
+        self.forward.extend(full_search(self.graph, i_landmark)[0])
+        self.backward.extend(full_search(self.graph, i_landmark, backward=True)[0])
+
+    def _farthest(self, rng: random.Random) -> int:
+        """
+        This method returns the reachable node with the largest distance to its nearest landmark,
+        starting from the node farthest from a random node if there is no landmark yet.
+        """
+        node_count = self.graph.node_count
+        if not self.landmarks:
+            tables = [full_search(self.graph, rng.randrange(node_count))[0]]
+        else:
+            tables = [
+                self.forward[k * node_count:(k + 1) * node_count]
+                for k in range(len(self.landmarks))
+            ]
+        best, best_dist = None, -1.0
+        for i_node in range(node_count):
+            dist = min(table[i_node] for table in tables)
+            if best_dist < dist < math.inf:
+                best, best_dist = i_node, dist
+        return best
+
+    def _avoid(self, rng: random.Random) -> int:
+        """
+        This method grows a shortest path tree from a random root, weights every node by the gap
+        between its distance and the current lower bound, and walks from the root into the heaviest
+        subtree without landmark down to a leaf, which becomes the new landmark.
+        """
+        node_count = self.graph.node_count
+        i_root = rng.randrange(node_count)
+        distances, predecessors = full_search(self.graph, i_root)
+        bound = self.bind(i_root, backward=True) if self.landmarks else None
+        children = [[] for _ in range(node_count)]
+        order = sorted(
+            (i_node for i_node in range(node_count) if distances[i_node] < math.inf),
+            key=distances.__getitem__
+        )
+        for i_node in order:
+            if i_node != i_root:
+                children[predecessors[i_node]].append(i_node)
+        landmarks = set(self.landmarks)
+        sizes = [0.0] * node_count
+        for i_node in reversed(order):
+            gap = distances[i_node] - (bound(i_node) if bound else 0.0)
+            subtree = sum(sizes[i_child] for i_child in children[i_node])
+            has_landmark = i_node in landmarks or any(
+                sizes[i_child] < 0 for i_child in children[i_node]
+            )
+            # a negative size marks subtrees containing a landmark
+            sizes[i_node] = -1.0 if has_landmark else gap + subtree
+        i_node = i_root
+        while children[i_node]:
+            i_next = max(children[i_node], key=sizes.__getitem__)
+            if sizes[i_next] <= 0:
+                break
+            i_node = i_next
+        return i_node if i_node != i_root or not landmarks else None
+
+    def bind(self, i_target: int, backward: bool = False):
+        """
+        This method returns a function with the lower bound of d(v, t) for a node index v and the
+        target t (of d(t, v) if backward is set).
+        """
+        node_count = self.graph.node_count
+        bounds = []
+        for k in range(len(self.landmarks)):
+            start = k * node_count
+            if backward:
+                bounds.append((
+                    start, self.backward[start + i_target], self.forward[start + i_target]
+                ))
+            else:
+                bounds.append((
+                    start, self.forward[start + i_target], self.backward[start + i_target]
+                ))
+        first, second = (self.backward, self.forward) if backward else (self.forward, self.backward)
+        inf = math.inf
+
+        def estimate(i_node: int) -> float:
+            best = 0.0
+            for start, to_target, from_target in bounds:
+                to_node = first[start + i_node]
+                if to_node < inf:
+                    # d(L, t) - d(L, v), infinite if v cannot reach t
+                    if to_target - to_node > best:
+                        best = to_target - to_node
+                from_node = second[start + i_node]
+                if from_target < inf:
+                    # d(v, L) - d(t, L), infinite if v cannot reach t
+                    if from_node - from_target > best:
+                        best = from_node - from_target
+            return best
+        return estimate
+
+    def save(self, path: str):
+        """
+        This method writes the landmark indices and distance tables to a binary file.
+        """
+        strategy = STRATEGIES.index(self.strategy) if self.strategy in STRATEGIES else -1
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(
+                MAGIC, VERSION, strategy, len(self.landmarks), self.graph.fingerprint()
+            ))
+            array("q", self.landmarks).tofile(file)
+            self.forward.tofile(file)
+            self.backward.tofile(file)
+
+    @classmethod
+    def load(cls, path: str, graph) -> "Landmarks":
+        """
+        This method reads landmarks written by save() for the given graph. A ValueError is raised
+        for a file of another format, version or graph and for a truncated file.
+        """
+        with open(path, "rb") as file:
+            header = file.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise ValueError(f"{path} is truncated")
+            magic, version, strategy, count, fingerprint = HEADER.unpack(header)
+            if (magic, version) != (MAGIC, VERSION):
+                raise ValueError(f"{path} is not a landmark file of version {VERSION}")
+            if fingerprint != graph.fingerprint():
+                raise ValueError(f"{path} belongs to another graph")
+            landmarks, forward, backward = array("q"), array("d"), array("d")
+            try:
+                landmarks.fromfile(file, count)
+                forward.fromfile(file, count * graph.node_count)
+                backward.fromfile(file, count * graph.node_count)
+            except EOFError as error:
+                raise ValueError(f"{path} is truncated") from error
+        strategy = STRATEGIES[strategy] if strategy >= 0 else None
+        return cls(graph, landmarks, forward, backward, strategy)
+
+
+def _select_planar(graph, count: int) -> list[int]:
+    """
+    This function divides the plane around the center of the node coordinates into count sectors
+    with the same number of nodes and returns the node farthest from the center in each sector.
+    """
+    if graph.coords is None:
+        raise ValueError("The planar strategy needs node coordinates")
+    xs, ys = graph.coords
+    x_center = sum(xs) / graph.node_count
+    y_center = sum(ys) / graph.node_count
+    order = sorted(
+        range(graph.node_count),
+        key=lambda i_node: math.atan2(ys[i_node] - y_center, xs[i_node] - x_center)
+    )
+    landmarks = []
+    for k in range(count):
+        sector = order[k * len(order) // count:(k + 1) * len(order) // count]
+        landmarks.append(max(
+            sector, key=lambda i_node: math.hypot(xs[i_node] - x_center, ys[i_node] - y_center)
+        ))
+    return landmarks
@@ -0,0 +1,172 @@
+"""
+This module contains a process pool that runs batches of shortest path queries on several cores.
+The graph is shared with the worker processes instead of being pickled per task.
+"""
+import math
+import multiprocessing
+import os
+import time
+
+try:
+    from .cache import CachedGraphReader
+    from .core import Dijkstra
+    from .helpers import track_path
+    from .potentials import PotentialCache
+except ImportError:
+    from cache import CachedGraphReader
+    from core import Dijkstra
+    from helpers import track_path
+    from potentials import PotentialCache
+
+
+QUERY_TYPES = ("dijkstra", "dijkstra_dist", "path", "distance")
+MODES = ("unmodified", "modified", "bidirectional", "astar")
+
+# the Dijkstra object and potential cache of a worker process, set by _init_worker()
+_DIJKSTRA = None
+_POTENTIALS = None
+
+
+def _init_worker(graph):
+    """
+    This function prepares a worker process. Given a path, the worker memory-maps the graph cache,
+    so all workers share the physical pages of one copy of the graph. Given a Dijkstra object, the
+    worker was forked and already holds it, as forked processes receive their arguments unpickled.
+    """
+    global _DIJKSTRA, _POTENTIALS  # pylint: disable=global-statement
+    if isinstance(graph, str):
+        _DIJKSTRA = Dijkstra(CachedGraphReader(graph).read())
+    else:
+        _DIJKSTRA = graph
+    _POTENTIALS = PotentialCache()
+
+
+def shortest_path(
+    dijkstra: Dijkstra,
+    i_source: int,
+    i_target: int,
+    mode: str = "unmodified",
+    potentials: PotentialCache = None,
+    count: bool = False
+) -> tuple[float, list[int]]:
+    """
+    This function returns the distance and the predecessors of a shortest path found with one of
+    the search modes in MODES, and the iteration count if count is set. The modified weights take
+    their potential from the cache if one is given.
+    """
+    if mode == "unmodified":
+        return dijkstra.dijkstra(i_source, i_target, count=count)
+    if mode == "modified":
+        if potentials is None:
+            back_dist = dijkstra.dijkstra_dist(i_target)
+        else:
+            back_dist = potentials.get(dijkstra, i_target)
+        return dijkstra.dijkstra(i_source, i_target, back_dist, count=count)
+    if mode == "bidirectional":
+        return dijkstra.bidirectional(i_source, i_target, count=count)
+    if mode == "astar":
+        return dijkstra.astar(i_source, i_target, count=count)
+    raise ValueError(f"Unknown mode {mode}, use one of {MODES}")
+
+
+def _run_query(query: tuple):
+    """
+    This function runs one query on the worker's graph.
+    """
+    kind = query[0]
+    if kind == "dijkstra":
+        return _DIJKSTRA.dijkstra(*query[1:])
+    if kind == "dijkstra_dist":
+        return _DIJKSTRA.dijkstra_dist(*query[1:])
+    if kind in ("path", "distance"):
+        i_source, i_target = query[1:3]
+        mode = query[3] if len(query) > 3 else "unmodified"
+        dist, pred = shortest_path(_DIJKSTRA, i_source, i_target, mode, _POTENTIALS)
+        if kind == "distance":
+            return dist
+        return (dist, track_path(pred, i_source, i_target))
+    raise ValueError(f"Unknown query type {kind}, use one of {QUERY_TYPES}")
+
+
+def _run_chunk(chunk: list[tuple[int, tuple]]) -> tuple:
+    """
+    This function runs a chunk of numbered queries and returns the worker's process id, the time
+    spent and the numbered results.
+    """
+    start = time.perf_counter()
+    results = [(index, _run_query(query)) for index, query in chunk]
+    return os.getpid(), time.perf_counter() - start, results
+
+
+class ParallelExecutor:
+    """
+    This class distributes shortest path queries over a pool of worker processes. Queries are
+    tuples ("dijkstra", source, target[, dist, count]), ("dijkstra_dist", target),
+    ("path", source, target[, mode]) or ("distance", source, target[, mode]) of node indices and
+    give the results of the Dijkstra method of the same name, for "path" the distance and the node
+    indices of the path and for "distance" only the distance. The mode is one of MODES.
+
+    Given the path of a .gra-file, every worker memory-maps the binary graph cache. Given a graph,
+    the workers inherit it by forking, which is only available on POSIX systems.
+    """
+    def __init__(self, graph, workers: int = None):
+        self.workers = workers or os.cpu_count()
+        self.stats = {}
+        if isinstance(graph, str):
+            # write the cache once before the workers map it
+            CachedGraphReader(graph).read()
+            context = multiprocessing.get_context()
+        else:
+            if "fork" not in multiprocessing.get_all_start_methods():
+                raise ValueError("Sharing a graph object needs the fork start method")
+            if not isinstance(graph, Dijkstra):
+                graph = Dijkstra(graph, compact=True)
+            context = multiprocessing.get_context("fork")
+        self.pool = context.Pool(self.workers, _init_worker, (graph,))
+
+    def map(self, queries: list[tuple], chunk_size: int = None) -> list:
+        """
+        This method runs all queries and returns their results in the order of the queries. The
+        time each worker spent on its queries is collected in stats.
+        """
+        numbered = list(enumerate(queries))
+        if chunk_size is None:
+            chunk_size = max(1, math.ceil(len(numbered) / (4 * self.workers)))
+        chunks = [numbered[pos:pos + chunk_size] for pos in range(0, len(numbered), chunk_size)]
+        results = [None] * len(numbered)
+        for pid, elapsed, chunk_results in self.pool.imap_unordered(_run_chunk, chunks):
+            worker = self.stats.setdefault(pid, {"queries": 0, "busy": 0.0})
+            worker["queries"] += len(chunk_results)
+            worker["busy"] += elapsed
+            for index, result in chunk_results:
+                results[index] = result
+        return results
+
+    def submit(self, query: tuple):
+        """
+        This method runs a single query on the pool and returns an AsyncResult, whose get() waits
+        for the result.
+        """
+        return self.pool.apply_async(_run_query, (query,))
+
+    def throughput(self) -> dict[int, float]:
+        """
+        This method returns the queries per second of busy time for every worker process.
+        """
+        return {
+            pid: worker["queries"] / worker["busy"] if worker["busy"] else 0.0
+            for pid, worker in self.stats.items()
+        }
+
+    def close(self):
+        """
+        This method stops the worker processes.
+        """
+        self.pool.close()
+        self.pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
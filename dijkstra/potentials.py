@@ -0,0 +1,167 @@
+"""
+This module contains a bounded cache of backward distance vectors, which dijkstra() uses as
+potential for the modified edge weights. Repeated queries to the same target skip the backward
+search.
+"""
+import os
+import weakref
+from array import array
+from collections import OrderedDict
+
+try:
+    from .compact import CompactGraph
+except ImportError:
+    from compact import CompactGraph
+
+
+SUFFIX = ".pot"
+
+
+class PotentialCache:
+    """
+    This class keeps the backward distance vectors of the most recently used targets as arrays of
+    doubles, keyed by the fingerprint of the graph and the target index. When the vectors take more
+    than max_bytes, the least recently used ones are evicted. If spill_dir is given, evicted
+    vectors are written there as raw arrays and read back on a later miss. The counters hits,
+    misses, disk_hits and evictions describe the use of the cache.
+
+    When set_arc_weights() changes the weights of a graph, its version changes, the vectors of the
+    old weights are dropped from memory and the fingerprint is computed again. Spilled vectors are
+    kept, as they still belong to the old fingerprint.
+    """
+    def __init__(self, max_bytes: int = 64 * 1024 ** 2, spill_dir: str = None):
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+        self._fingerprints = weakref.WeakKeyDictionary()
+        if spill_dir is not None:
+            os.makedirs(spill_dir, exist_ok=True)
+
+    def get(self, dijkstra, i_target: int) -> array:
+        """
+        This method returns the distances of all nodes to the target, computed by the
+        dijkstra_dist() method of the given Dijkstra object if they are neither in memory nor
+        spilled to disk.
+        """
+        graph = dijkstra._compact_graph()  # pylint: disable=protected-access
+        key = self.key(graph, i_target)
+        vector = self.entries.get(key)
+        if vector is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return vector
+        self.misses += 1
+        vector = self._read_spilled(key, graph.node_count)
+        if vector is None:
+            distances = dijkstra.dijkstra_dist(i_target)
+            vector = array("d", (distances[i_node] for i_node in range(graph.node_count)))
+        else:
+            self.disk_hits += 1
+        self.put(key, vector)
+        return vector
+
+    def put(self, key: tuple[bytes, int], vector: array):
+        """
+        This method stores a vector and evicts the least recently used ones beyond max_bytes. A
+        vector larger than max_bytes is only spilled, the vectors in memory are kept.
+        """
+        if key in self.entries:
+            self.nbytes -= self._size(self.entries.pop(key))
+        size = self._size(vector)
+        if size > self.max_bytes:
+            self._spill(key, vector)
+            return
+        self.entries[key] = vector
+        self.nbytes += size
+        while self.nbytes > self.max_bytes and self.entries:
+            old_key, old_vector = self.entries.popitem(last=False)
+            self.nbytes -= self._size(old_vector)
+            self.evictions += 1
+            self._spill(old_key, old_vector)
+
+    def stats(self) -> dict:
+        """
+        This method returns the counters, the number of vectors and the bytes held in memory.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "bytes": self.nbytes,
+        }
+
+    def clear(self):
+        """
+        This method removes all vectors from memory, spilled files are kept.
+        """
+        self.entries.clear()
+        self.nbytes = 0
+
+    def key(self, graph: CompactGraph, i_target: int) -> tuple[bytes, int]:
+        """
+        This method returns the key of the vector of a target in the given graph.
+        """
+        return (self._fingerprint(graph), i_target)
+
+    def _fingerprint(self, graph: CompactGraph) -> bytes:
+        """
+        This method returns the fingerprint of a graph, which is computed once per graph object
+        and version. The vectors of an older version are removed from memory.
+        """
+        version, fingerprint = self._fingerprints.get(graph, (None, None))
+        if fingerprint is None or version != graph.version:
+            if fingerprint is not None:
+                self._drop(fingerprint)
+            fingerprint = graph.fingerprint()
+            self._fingerprints[graph] = (graph.version, fingerprint)
+        return fingerprint
+
+    def _drop(self, fingerprint: bytes):
+        """
+        This method removes the vectors of a fingerprint from memory without spilling them.
+        """
+        for key in [key for key in self.entries if key[0] == fingerprint]:
+            self.nbytes -= self._size(self.entries.pop(key))
+
+    def _path(self, key: tuple[bytes, int]) -> str:
+        fingerprint, i_target = key
+        return os.path.join(self.spill_dir, f"{fingerprint.hex()[:32]}-{i_target}{SUFFIX}")
+
+    def _spill(self, key: tuple[bytes, int], vector: array):
+        """
+        This method writes an evicted vector to the spill directory if there is one.
+        """
+        if self.spill_dir is None:
+            return
+        path = self._path(key)
+        if os.path.exists(path):
+            return
+        with open(path + ".tmp", "wb") as file:
+            vector.tofile(file)
+        os.replace(path + ".tmp", path)
+
+    def _read_spilled(self, key: tuple[bytes, int], node_count: int) -> array:
+        """
+        This method reads a spilled vector or returns None if there is none of the right size.
+        """
+        if self.spill_dir is None:
+            return None
+        path = self._path(key)
+        vector = array("d")
+        try:
+            with open(path, "rb") as file:
+                vector.fromfile(file, node_count)
+        except (OSError, EOFError):
+            return None
+        return vector
+
+    @staticmethod
+    def _size(vector: array) -> int:
+        return len(vector) * vector.itemsize
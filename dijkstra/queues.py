@@ -0,0 +1,237 @@
+"""
+This module contains the priority queues the searches of the Dijkstra class can run on. All queues
+offer push(key, item), pop() returning the pair with the smallest key, and len(). The binary heap,
+the bucket queue and the radix heap insert lazily, so pop() may return outdated pairs of items that
+were pushed again with a smaller key; the indexed d-ary heap decreases the key instead.
+"""
+import heapq
+
+
+QUEUES = ("binary", "dary", "bucket", "radix")
+
+
+class BinaryHeap:
+    """
+    This class is a binary heap of (key, item) tuples based on heapq.
+    """
+    def __init__(self):
+        self.heap = []
+
+    def push(self, key: float, item: int):
+        """
+        This method inserts an item with a key.
+        """
+        heapq.heappush(self.heap, (key, item))
+
+    def pop(self) -> tuple[float, int]:
+        """
+        This method removes and returns the pair with the smallest key.
+        """
+        return heapq.heappop(self.heap)
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+
+class DaryHeap:
+    """
+    This class is an indexed d-ary heap of node indices below node_count. Every node is in the heap
+    at most once, push() of a node already in the heap decreases its key.
+    """
+    def __init__(self, node_count: int, arity: int = 4):
+        self.arity = arity
+        self.items = []
+        self.keys = {}
+        # position of every node in items, -1 if not in the heap
+        self.positions = [-1] * node_count
+
+    def push(self, key: float, item: int):
+        """
+        This method inserts an item or decreases its key if the new key is smaller.
+        """
+        position = self.positions[item]
+        if position < 0:
+            position = len(self.items)
+            self.items.append(item)
+        elif key >= self.keys[item]:
+            return
+        self.keys[item] = key
+        self._sift_up(position)
+
+    def pop(self) -> tuple[float, int]:
+        """
+        This method removes and returns the pair with the smallest key.
+        """
+        items = self.items
+        item = items[0]
+        last = items.pop()
+        self.positions[item] = -1
+        if items:
+            items[0] = last
+            self.positions[last] = 0
+            self._sift_down(0)
+        return self.keys.pop(item), item
+
+    def _sift_up(self, position: int):
+        items, keys, positions, arity = self.items, self.keys, self.positions, self.arity
+        item = items[position]
+        key = keys[item]
+        while position > 0:
+            parent = (position - 1) // arity
+            if keys[items[parent]] <= key:
+                break
+            items[position] = items[parent]
+            positions[items[position]] = position
+            position = parent
+        items[position] = item
+        positions[item] = position
+
+    def _sift_down(self, position: int):
+        items, keys, positions, arity = self.items, self.keys, self.positions, self.arity
+        size = len(items)
+        item = items[position]
+        key = keys[item]
+        while True:
+            first = arity * position + 1
+            if first >= size:
+                break
+            child = first
+            child_key = keys[items[first]]
+            for index in range(first + 1, min(first + arity, size)):
+                if keys[items[index]] < child_key:
+                    child, child_key = index, keys[items[index]]
+            if child_key >= key:
+                break
+            items[position] = items[child]
+            positions[items[position]] = position
+            position = child
+        items[position] = item
+        positions[item] = position
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+class BucketQueue:
+    """
+    This class is Dial's bucket queue for integer keys that never fall below the last popped key.
+    The buckets form a ring with one bucket per key from the last popped key up to span above it,
+    which is grown if a larger key is pushed. The ring starts at the first pushed key, as the keys
+    of a search with modified weights start at the distance of the source, and is moved down if a
+    smaller key is pushed before the first pop. The lists of the buckets are created on their first
+    push, so a wide ring is cheap for a search that only settles a few keys.
+    """
+    def __init__(self, span: int = 1):
+        self.buckets = [None] * (int(span) + 1)
+        self.current = None
+        self.size = 0
+
+    def push(self, key: float, item: int):
+        """
+        This method inserts an item with a key.
+        """
+        key = int(key)
+        current = self.current
+        if current is None:
+            self.current = current = key
+        elif key < current:
+            self._grow(key, current + len(self.buckets) - 1)
+            current = key
+        if key - current >= len(self.buckets):
+            self._grow(current, key)
+        buckets = self.buckets
+        bucket = buckets[key % len(buckets)]
+        if bucket is None:
+            buckets[key % len(buckets)] = [item]
+        else:
+            bucket.append(item)
+        self.size += 1
+
+    def pop(self) -> tuple[int, int]:
+        """
+        This method removes and returns the pair with the smallest key.
+        """
+        buckets = self.buckets
+        count = len(buckets)
+        while not buckets[self.current % count]:
+            self.current += 1
+        self.size -= 1
+        return self.current, buckets[self.current % count].pop()
+
+    def _grow(self, low: int, high: int):
+        """
+        This method rebuilds the ring so that it starts at key low and holds at least the keys up
+        to high.
+        """
+        old = self.buckets
+        count = max(high - low + 1, 2 * len(old))
+        self.buckets = [None] * count
+        for offset in range(len(old)):
+            key = self.current + offset
+            self.buckets[key % count] = old[key % len(old)]
+        self.current = low
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class RadixHeap:
+    """
+    This class is a radix heap for non-negative integer keys that never fall below the last popped
+    key. Bucket i holds the pairs whose key first differs from the last popped key in bit i - 1.
+    """
+    def __init__(self):
+        self.buckets = [[] for _ in range(65)]
+        self.last = 0
+        self.size = 0
+
+    def push(self, key: float, item: int):
+        """
+        This method inserts an item with a key.
+        """
+        self.buckets[(int(key) ^ self.last).bit_length()].append((key, item))
+        self.size += 1
+
+    def pop(self) -> tuple[float, int]:
+        """
+        This method removes and returns the pair with the smallest key.
+        """
+        buckets = self.buckets
+        if not buckets[0]:
+            index = 1
+            while not buckets[index]:
+                index += 1
+            bucket = buckets[index]
+            buckets[index] = []
+            self.last = last = int(min(bucket)[0])
+            for key, item in bucket:
+                buckets[(int(key) ^ last).bit_length()].append((key, item))
+        self.size -= 1
+        return buckets[0].pop()
+
+    def __len__(self) -> int:
+        return self.size
+
+
+def integral(weights) -> bool:
+    """
+    This function checks whether all weights are non-negative integers, as the bucket queue and the
+    radix heap need.
+    """
+    return all(weight >= 0 and weight == int(weight) for weight in weights)
+
+
+def make_queue(name: str, node_count: int, span: int = 1):
+    """
+    This function returns a new empty queue of the given name for a search on node_count nodes
+    whose arc weights are at most span.
+    """
+    if name == "binary":
+        return BinaryHeap()
+    if name == "dary":
+        return DaryHeap(node_count)
+    if name == "bucket":
+        return BucketQueue(span)
+    if name == "radix":
+        return RadixHeap()
+    raise ValueError(f"Unknown queue {name}, use one of {QUEUES}")
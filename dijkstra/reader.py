@@ -0,0 +1,152 @@
+"""
+This module contains a streaming reader for .gra-files that builds a CompactGraph directly,
+without creating node and edge objects.
+"""
+import time
+import tracemalloc
+from array import array
+
+try:
+    from .compact import CompactGraph
+except ImportError:
+    from compact import CompactGraph
+
+
+DIRECTED = ("gerichtet", "directed")
+UNDIRECTED = ("ungerichtet", "undirected")
+
+
+class CompactGraphReader:
+    """
+    This class reads a .gra-file chunk by chunk and returns a CompactGraph. A .gra-file consists of
+    the node count, the edge count, the keyword "gerichtet" or "ungerichtet", one line per node
+    (name and coordinates) and one line per edge (name, first node, second node, weight and
+    optional further columns). Everything after a "#" is a comment. After read() the attributes
+    load_time (seconds) and peak_memory (bytes, only if trace_memory is set) are available.
+    """
+    def __init__(self, path: str, trace_memory: bool = False, chunk_size: int = 1 << 20):
+        self.path = path
+        self.trace_memory = trace_memory
+        self.chunk_size = chunk_size
+        self.load_time = None
+        self.peak_memory = None
+
+    def lines(self):
+        """
+        This method yields the token lists of all non-empty lines of the file with comments
+        removed. The file is read in chunks of chunk_size bytes.
+        """
+        rest = b""
+        with open(self.path, "rb") as file:
+            while True:
+                chunk = file.read(self.chunk_size)
+                if not chunk:
+                    break
+                chunk = rest + chunk
+                end = chunk.rfind(b"\n") + 1
+                rest = chunk[end:]
+                for line in chunk[:end].decode("utf-8").splitlines():
+                    tokens = line.partition("#")[0].split()
+                    if tokens:
+                        yield tokens
+        tokens = rest.decode("utf-8").partition("#")[0].split()
+        if tokens:
+            yield tokens
+
+    def read(self) -> CompactGraph:
+        """
+        This method reads the file and returns the CompactGraph.
+        """
+        if self.trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            graph = self._parse()
+        finally:
+            self.load_time = time.perf_counter() - start
+            if self.trace_memory:
+                self.peak_memory = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+        return graph
+
+    def _parse(self) -> CompactGraph:
+        """
+        This method parses the token lines into arc arrays and sorts them into CSR form.
+        """
+        lines = self.lines()
+        try:
+            node_count = int(next(lines)[0])
+            edge_count = int(next(lines)[0])
+            keyword = next(lines)[0].lower()
+        except (StopIteration, ValueError) as error:
+            raise ValueError(f"Invalid header in {self.path}") from error
+        if keyword not in DIRECTED + UNDIRECTED:
+            raise ValueError(f"Expected gerichtet or ungerichtet in {self.path}, got {keyword}")
+        directed = keyword in DIRECTED
+        names = []
+        name_index = {}
+        xs = array("d")
+        ys = array("d")
+        tails = array("q")
+        heads = array("q")
+        weights = array("d")
+        for tokens in lines:
+            try:
+                if len(names) < node_count:
+                    name_index[tokens[0]] = len(names)
+                    names.append(tokens[0])
+                    xs.append(float(tokens[1]) if len(tokens) > 1 else 0.0)
+                    ys.append(float(tokens[2]) if len(tokens) > 2 else 0.0)
+                elif len(weights) < edge_count:
+                    tails.append(name_index[tokens[1]])
+                    heads.append(name_index[tokens[2]])
+                    weights.append(float(tokens[3]) if len(tokens) > 3 else 1.0)
+                else:
+                    break
+            except (IndexError, KeyError, ValueError) as error:
+                raise ValueError(f"Invalid line in {self.path}: {' '.join(tokens)}") from error
+        if len(names) != node_count or len(weights) != edge_count:
+            raise ValueError(
+                f"Expected {node_count} nodes and {edge_count} edges in {self.path}, "
+                f"found {len(names)} nodes and {len(weights)} edges"
+            )
+        if not directed:
+            # every edge is an arc in both directions, in the order of the edge lines
+            tails, heads = _interleave(tails, heads), _interleave(heads, tails)
+            weights = _interleave(weights, weights)
+        forward = build_csr(node_count, tails, heads, weights)
+        backward = build_csr(node_count, heads, tails, weights)
+        return CompactGraph(
+            node_count, edge_count, forward, backward, names, (xs, ys), name_index
+        )
+
+
+def _interleave(first: array, second: array) -> array:
+    """
+    This function returns an array with the elements of first and second in alternating order.
+    """
+    result = array(first.typecode, bytes(2 * len(first) * first.itemsize))
+    result[0::2] = first
+    result[1::2] = second
+    return result
+
+
+def build_csr(node_count: int, sources: array, targets: array, weights: array) -> tuple:
+    """
+    This function sorts the arcs (sources[k], targets[k], weights[k]) by source node with a stable
+    counting sort and returns the (offsets, targets, weights) arrays of the CSR form.
+    """
+    offsets = array("q", bytes(8 * (node_count + 1)))
+    for i_node in sources:
+        offsets[i_node + 1] += 1
+    for i_node in range(node_count):
+        offsets[i_node + 1] += offsets[i_node]
+    position = offsets[:-1]
+    csr_targets = array("q", bytes(8 * len(targets)))
+    csr_weights = array("d", bytes(8 * len(weights)))
+    for i_node, i_target, weight in zip(sources, targets, weights):
+        pos = position[i_node]
+        csr_targets[pos] = i_target
+        csr_weights[pos] = weight
+        position[i_node] = pos + 1
+    return offsets, csr_targets, csr_weights
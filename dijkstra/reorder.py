@@ -0,0 +1,255 @@
+"""
+This module contains node orders that place nodes which are close in the graph at close indices,
+and the renumbering of a CompactGraph by such an order. Node indices of a graph read from a
+.gra-file follow the order of its lines, so the distances, predecessors and arcs of neighboring
+nodes are usually far apart in memory.
+"""
+from array import array
+from collections import deque
+
+try:
+    from .compact import CompactGraph
+except ImportError:
+    from compact import CompactGraph
+
+
+ORDERS = ("hilbert", "zorder", "bfs", "rcm", "partition")
+
+
+def _grid_coords(graph: CompactGraph, bits: int) -> tuple[list[int], list[int]]:
+    """
+    This function scales the node coordinates to integers from 0 to 2^bits - 1.
+    """
+    if graph.coords is None:
+        raise ValueError("Ordering along a space-filling curve needs node coordinates")
+    scaled = []
+    for values in graph.coords:
+        low, high = min(values, default=0.0), max(values, default=0.0)
+        scale = ((1 << bits) - 1) / (high - low) if high > low else 0.0
+        scaled.append([int((value - low) * scale) for value in values])
+    return scaled[0], scaled[1]
+
+
+def hilbert_index(x: int, y: int, bits: int) -> int:
+    """
+    This function returns the position of the point (x, y) on the Hilbert curve through the grid
+    of side 2^bits.
+    """
+    index = 0
+    full = (1 << bits) - 1
+    side = 1 << (bits - 1)
+    while side:
+        x_bit = 1 if x & side else 0
+        y_bit = 1 if y & side else 0
+        index += side * side * ((3 * x_bit) ^ y_bit)
+        # rotate the quadrant so the curve continues in the same orientation
+        if y_bit == 0:
+            if x_bit == 1:
+                x = full - x
+                y = full - y
+            x, y = y, x
+        side >>= 1
+    return index
+
+
+def zorder_index(x: int, y: int, bits: int) -> int:
+    """
+    This function returns the position of the point (x, y) on the Z-order (Morton) curve, which
+    interleaves the bits of both coordinates.
+    """
+    index = 0
+    for bit in range(bits):
+        index |= ((x >> bit) & 1) << (2 * bit) | ((y >> bit) & 1) << (2 * bit + 1)
+    return index
+
+
+def hilbert_order(graph: CompactGraph, bits: int = 16) -> list[int]:
+    """
+    This function returns the node indices sorted along the Hilbert curve over their coordinates.
+    """
+    xs, ys = _grid_coords(graph, bits)
+    return sorted(
+        range(graph.node_count), key=lambda i_node: hilbert_index(xs[i_node], ys[i_node], bits)
+    )
+
+
+def zorder_order(graph: CompactGraph, bits: int = 16) -> list[int]:
+    """
+    This function returns the node indices sorted along the Z-order curve over their coordinates.
+    """
+    xs, ys = _grid_coords(graph, bits)
+    return sorted(
+        range(graph.node_count), key=lambda i_node: zorder_index(xs[i_node], ys[i_node], bits)
+    )
+
+
+def _neighbors(graph: CompactGraph) -> list[list[int]]:
+    """
+    This function returns the neighbors of every node over forward and backward arcs without
+    duplicates.
+    """
+    neighbors = []
+    for i_node in range(graph.node_count):
+        adjacent = set(graph.f_targets[graph.f_offsets[i_node]:graph.f_offsets[i_node + 1]])
+        adjacent.update(graph.b_targets[graph.b_offsets[i_node]:graph.b_offsets[i_node + 1]])
+        adjacent.discard(i_node)
+        neighbors.append(sorted(adjacent))
+    return neighbors
+
+
+def _bfs(neighbors: list[list[int]], i_start: int, part: list[int], label: int) -> list[int]:
+    """
+    This function returns the nodes reached by a breadth-first search from the start node that
+    only visits nodes whose part is label.
+    """
+    seen = {i_start}
+    queue = deque([i_start])
+    visited = []
+    while queue:
+        i_node = queue.popleft()
+        visited.append(i_node)
+        for i_next in neighbors[i_node]:
+            if i_next not in seen and part[i_next] == label:
+                seen.add(i_next)
+                queue.append(i_next)
+    return visited
+
+
+def _peripheral(neighbors: list[list[int]], i_start: int, part: list[int], label: int) -> int:
+    """
+    This function returns a node far away from the start node in its component, the last node of
+    two breadth-first searches, each started from the last node of the one before.
+    """
+    for _ in range(2):
+        i_start = _bfs(neighbors, i_start, part, label)[-1]
+    return i_start
+
+
+def bfs_order(graph: CompactGraph) -> list[int]:
+    """
+    This function returns the node indices in the order of breadth-first searches over forward
+    and backward arcs, one per component, each started from a node at its periphery.
+    """
+    neighbors = _neighbors(graph)
+    part = [0] * graph.node_count
+    order = []
+    for i_node in range(graph.node_count):
+        if part[i_node] == 0:
+            visited = _bfs(neighbors, _peripheral(neighbors, i_node, part, 0), part, 0)
+            for i_visited in visited:
+                part[i_visited] = 1
+            order.extend(visited)
+    return order
+
+
+def rcm_order(graph: CompactGraph) -> list[int]:
+    """
+    This function returns the node indices in reverse Cuthill-McKee order: breadth-first searches
+    from a peripheral node of every component that visit the neighbors of a node by increasing
+    degree, reversed. It keeps the indices of adjacent nodes close, i.e. the bandwidth small.
+    """
+    neighbors = _neighbors(graph)
+    for adjacent in neighbors:
+        adjacent.sort(key=lambda i_next: len(neighbors[i_next]))
+    part = [0] * graph.node_count
+    order = []
+    for i_node in sorted(range(graph.node_count), key=lambda i_node: len(neighbors[i_node])):
+        if part[i_node] == 0:
+            visited = _bfs(neighbors, _peripheral(neighbors, i_node, part, 0), part, 0)
+            for i_visited in visited:
+                part[i_visited] = 1
+            order.extend(visited)
+    order.reverse()
+    return order
+
+
+def partition_order(graph: CompactGraph, leaf_size: int = 64) -> list[int]:
+    """
+    This function returns the node indices in the order of a recursive bisection: a part is split
+    into the first and the second half of a breadth-first search from a peripheral node (continued
+    from a new start in every further component), and each half is split again until it has at
+    most leaf_size nodes. Nodes of a part are thus close both in the order and in the graph.
+    """
+    neighbors = _neighbors(graph)
+    part = [0] * graph.node_count
+    order = []
+    labels = 1
+    stack = [(0, list(range(graph.node_count)))]
+    while stack:
+        label, members = stack.pop()
+        visited = []
+        for i_node in members:
+            if part[i_node] == label:
+                i_start = _peripheral(neighbors, i_node, part, label)
+                component = _bfs(neighbors, i_start, part, label)
+                for i_visited in component:
+                    part[i_visited] = -1
+                visited.extend(component)
+        if len(visited) <= leaf_size:
+            order.extend(visited)
+            continue
+        half = len(visited) // 2
+        # the first half is split before the second, so it is pushed last
+        for members in (visited[half:], visited[:half]):
+            for i_node in members:
+                part[i_node] = labels
+            stack.append((labels, members))
+            labels += 1
+    return order
+
+
+def node_order(graph: CompactGraph, method: str) -> list[int]:
+    """
+    This function returns the node order of one of the methods in ORDERS.
+    """
+    if method == "hilbert":
+        return hilbert_order(graph)
+    if method == "zorder":
+        return zorder_order(graph)
+    if method == "bfs":
+        return bfs_order(graph)
+    if method == "rcm":
+        return rcm_order(graph)
+    if method == "partition":
+        return partition_order(graph)
+    raise ValueError(f"Unknown node order {method}, use one of {ORDERS}")
+
+
+def reorder(graph: CompactGraph, order: list[int]) -> CompactGraph:
+    """
+    This function returns a copy of the graph in which node order[k] has index k. The arcs of
+    every node keep their order, and names and coordinates move with their nodes, so node_index()
+    finds every node by name. A node index i of the original graph is the index
+    rank[i] of the new one for rank = inverse(order).
+    """
+    node_count = graph.node_count
+    if len(order) != node_count or set(order) != set(range(node_count)):
+        raise ValueError("The order must contain every node index exactly once")
+    rank = inverse(order)
+    adjacency = []
+    for offsets, targets, weights in (
+        (graph.f_offsets, graph.f_targets, graph.f_weights),
+        (graph.b_offsets, graph.b_targets, graph.b_weights)
+    ):
+        new_offsets, new_targets, new_weights = array("q", [0]), array("q"), array("d")
+        for i_old in order:
+            start, end = offsets[i_old], offsets[i_old + 1]
+            new_targets.extend(rank[i_target] for i_target in targets[start:end])
+            new_weights.extend(weights[start:end])
+            new_offsets.append(len(new_targets))
+        adjacency.append((new_offsets, new_targets, new_weights))
+    names = [graph.names[i_old] for i_old in order] if graph.names is not None else None
+    coords = None
+    if graph.coords is not None:
+        coords = tuple(array("d", (values[i_old] for i_old in order)) for values in graph.coords)
+    return CompactGraph(node_count, graph.edge_count, adjacency[0], adjacency[1], names, coords)
+
+
+def inverse(order: list[int]) -> array:
+    """
+    This function returns the inverse permutation, the position of every node index in order.
+    """
+    rank = array("q", bytes(8 * len(order)))
+    for position, i_node in enumerate(order):
+        rank[i_node] = position
+    return rank
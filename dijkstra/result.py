@@ -0,0 +1,131 @@
+"""
+This module contains a compact result of a shortest path search, which keeps the predecessors of
+the reached nodes only and rebuilds paths on demand.
+"""
+from array import array
+from bisect import bisect_left
+
+try:
+    from .compact import CompactGraph
+except ImportError:
+    from compact import CompactGraph
+
+
+class SearchResult:
+    """
+    This class holds the distance, the iteration count and the predecessors of the nodes reached by
+    a search from source to target. The predecessors are two sorted arrays of node indices and
+    their parents, 16 bytes per reached node instead of a list over all nodes. The path is rebuilt
+    when it is asked for, as list, as generator or as edges with their weights.
+    """
+    def __init__(
+        self,
+        graph: CompactGraph,
+        i_source: int,
+        i_target: int,
+        distance: float,
+        nodes: array,
+        parents: array,
+        iterations: int = None
+    ):
+        self.graph = graph
+        self.source = i_source
+        self.target = i_target
+        self.distance = distance
+        self.nodes = nodes
+        self.parents = parents
+        self.iterations = iterations
+
+    @classmethod
+    def from_predecessors(
+        cls,
+        graph: CompactGraph,
+        i_source: int,
+        i_target: int,
+        distance: float,
+        predecessors,
+        iterations: int = None
+    ) -> "SearchResult":
+        """
+        This method builds a result from a predecessors list (None for nodes not reached) or from
+        a sparse Predecessors mapping of a search with workspace.
+        """
+        if isinstance(predecessors, dict):
+            pairs = sorted(
+                (i_node, i_parent) for i_node, i_parent in predecessors.items()
+                if i_parent is not None
+            )
+        else:
+            pairs = [
+                (i_node, i_parent) for i_node, i_parent in enumerate(predecessors)
+                if i_parent is not None
+            ]
+        nodes = array("q", (i_node for i_node, _ in pairs))
+        parents = array("q", (i_parent for _, i_parent in pairs))
+        return cls(graph, i_source, i_target, distance, nodes, parents, iterations)
+
+    @property
+    def reachable(self) -> bool:
+        """
+        This property tells whether the search reached the target.
+        """
+        return self.distance != float("inf")
+
+    def predecessor(self, i_node: int) -> int:
+        """
+        This method returns the predecessor of a node or None if the search did not reach it.
+        """
+        position = bisect_left(self.nodes, i_node)
+        if position < len(self.nodes) and self.nodes[position] == i_node:
+            return self.parents[position]
+        return None
+
+    def iter_path(self, reverse: bool = False):
+        """
+        This method yields the node indices of the path. With reverse set they are yielded from the
+        target to the source one at a time, otherwise from the source to the target.
+        """
+        if not self.reachable:
+            return
+        if not reverse:
+            yield from reversed(array("q", self.iter_path(reverse=True)))
+            return
+        i_node = self.target
+        while True:
+            yield i_node
+            i_parent = self.predecessor(i_node)
+            if i_parent is None or i_parent == i_node:
+                return
+            i_node = i_parent
+
+    def path(self) -> list[int]:
+        """
+        This method returns the node indices of the path from source to target or None if the
+        target was not reached, like helpers.track_path().
+        """
+        return list(self.iter_path()) if self.reachable else None
+
+    def edges(self):
+        """
+        This method yields the edges of the path as (tail, head, weight) of node indices, where the
+        weight is the one of the lightest arc from tail to head.
+        """
+        offsets, targets, weights = self.graph.f_offsets, self.graph.f_targets, self.graph.f_weights
+        path = self.iter_path()
+        i_tail = next(path, None)
+        for i_head in path:
+            weight = min(
+                weights[pos] for pos in range(offsets[i_tail], offsets[i_tail + 1])
+                if targets[pos] == i_head
+            )
+            yield i_tail, i_head, weight
+            i_tail = i_head
+
+    def nbytes(self) -> int:
+        """
+        This method returns the bytes of the predecessor arrays.
+        """
+        return len(self.nodes) * self.nodes.itemsize + len(self.parents) * self.parents.itemsize
+
+    def __len__(self) -> int:
+        return len(self.nodes)
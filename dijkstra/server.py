@@ -0,0 +1,188 @@
+"""
+This module contains a query server that keeps a graph in memory and answers requests given as JSON
+lines on stdin or on a Unix domain socket.
+"""
+import json
+import os
+import socketserver
+import stat
+import sys
+import threading
+import time
+from collections import deque
+
+try:
+    from .compact import CompactGraph
+    from .core import Dijkstra
+    from .helpers import track_path
+    from .parallel import MODES, ParallelExecutor, shortest_path
+    from .potentials import PotentialCache
+except ImportError:
+    from compact import CompactGraph
+    from core import Dijkstra
+    from helpers import track_path
+    from parallel import MODES, ParallelExecutor, shortest_path
+    from potentials import PotentialCache
+
+
+OPERATIONS = ("path", "distance", "stats")
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """
+    This function returns the value of the given fraction (nearest rank) of sorted values, or None
+    if there are none.
+    """
+    if not values:
+        return None
+    return values[min(len(values) - 1, max(0, round(fraction * len(values)) - 1))]
+
+
+class QueryServer:
+    """
+    This class answers requests like
+    {"op": "path", "source": "A", "target": "B", "mode": "modified"} with
+    {"distance": 3.0, "path": ["A", "C", "B"]}. "distance" requests return only the distance,
+    "stats" requests the number of queries, the throughput and the p50/p99 latency of the last
+    window queries. Nodes are given by name, the mode is one of MODES and an "id" of the request is
+    returned unchanged. Unreachable targets give a distance and path of null, invalid requests an
+    "error".
+
+    With workers > 0 the queries run on a ParallelExecutor, so concurrent clients are answered in
+    parallel; given the path of the .gra-file the workers memory-map its binary cache. Otherwise
+    the queries run in the server process one at a time.
+    """
+    def __init__(
+        self,
+        graph: CompactGraph,
+        path: str = None,
+        workers: int = 0,
+        window: int = 10000
+    ):
+        self.graph = graph
+        self.dijkstra = Dijkstra(graph)
+        self.potentials = PotentialCache()
+        self.executor = ParallelExecutor(path or graph, workers) if workers else None
+        self.latencies = deque(maxlen=window)
+        self.queries = 0
+        self.started = time.perf_counter()
+        self.lock = threading.Lock()
+        self.socket_server = None
+
+    def handle(self, request: dict) -> dict:
+        """
+        This method answers a single request.
+        """
+        operation = request.get("op", "path")
+        response = {"id": request["id"]} if "id" in request else {}
+        if operation == "stats":
+            response.update(self.stats())
+            return response
+        if operation not in OPERATIONS:
+            raise ValueError(f"Unknown operation {operation}, use one of {OPERATIONS}")
+        mode = request.get("mode", "unmodified")
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode {mode}, use one of {MODES}")
+        i_source = self.graph.node_index(str(request["source"]))
+        i_target = self.graph.node_index(str(request["target"]))
+        start = time.perf_counter()
+        if self.executor is not None:
+            dist, path = self.executor.submit(("path", i_source, i_target, mode)).get()
+        else:
+            with self.lock:
+                dist, pred = shortest_path(
+                    self.dijkstra, i_source, i_target, mode, self.potentials
+                )
+            path = track_path(pred, i_source, i_target)
+        elapsed = time.perf_counter() - start
+        with self.lock:
+            self.latencies.append(elapsed)
+            self.queries += 1
+        reachable = dist != float("inf")
+        response["distance"] = dist if reachable else None
+        if operation == "path":
+            response["path"] = [self.graph.names[i_node] for i_node in path] if reachable else None
+        return response
+
+    def handle_line(self, line: str) -> str:
+        """
+        This method answers a request given as JSON line and returns the JSON response.
+        """
+        try:
+            response = self.handle(json.loads(line))
+        except (ValueError, KeyError, TypeError, AttributeError) as error:
+            response = {"error": str(error)}
+        return json.dumps(response)
+
+    def stats(self) -> dict:
+        """
+        This method returns the number of queries, the queries per second since the start and the
+        p50 and p99 latency in milliseconds over the latency window.
+        """
+        with self.lock:
+            latencies = sorted(self.latencies)
+            queries = self.queries
+        uptime = time.perf_counter() - self.started
+        p50, p99 = percentile(latencies, 0.5), percentile(latencies, 0.99)
+        return {
+            "queries": queries,
+            "uptime": uptime,
+            "throughput": queries / uptime if uptime else 0.0,
+            "p50_ms": None if p50 is None else 1000 * p50,
+            "p99_ms": None if p99 is None else 1000 * p99,
+        }
+
+    def serve_lines(self, stdin=None, stdout=None):
+        """
+        This method answers one request per line of stdin until it is closed.
+        """
+        stdin = stdin or sys.stdin
+        stdout = stdout or sys.stdout
+        for line in stdin:
+            if line.strip():
+                stdout.write(self.handle_line(line) + "\n")
+                stdout.flush()
+
+    def serve_socket(self, path: str):
+        """
+        This method answers requests on a Unix domain socket at path, each client connection in its
+        own thread, until it is interrupted or shutdown() is called. A socket left at path by an
+        earlier server is replaced, any other file raises a FileExistsError.
+        """
+        server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            """
+            This class answers the requests of one client connection.
+            """
+            def handle(self):
+                for line in self.rfile:
+                    if line.strip():
+                        response = server.handle_line(line.decode("utf-8"))
+                        self.wfile.write(response.encode("utf-8") + b"\n")
+
+        if os.path.exists(path):
+            if not stat.S_ISSOCK(os.stat(path).st_mode):
+                raise FileExistsError(f"{path} exists and is not a socket")
+            os.unlink(path)
+        with socketserver.ThreadingUnixStreamServer(path, Handler) as unix_server:
+            self.socket_server = unix_server
+            try:
+                unix_server.serve_forever()
+            finally:
+                self.socket_server = None
+                os.unlink(path)
+
+    def shutdown(self):
+        """
+        This method stops serve_socket() from another thread.
+        """
+        if self.socket_server is not None:
+            self.socket_server.shutdown()
+
+    def close(self):
+        """
+        This method stops the worker processes.
+        """
+        if self.executor is not None:
+            self.executor.close()
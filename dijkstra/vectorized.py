@@ -0,0 +1,99 @@
+"""
+This module contains an optional backend that computes full distance vectors with the compiled
+Dijkstra implementation of SciPy on the adjacency of a CompactGraph as sparse matrices. It needs
+SciPy, which is imported only when the backend is used.
+"""
+import numpy as np
+
+try:
+    from .compact import CompactGraph
+except ImportError:
+    from compact import CompactGraph
+
+
+def to_csr(graph: CompactGraph):
+    """
+    This function returns the forward adjacency of a graph as scipy.sparse.csr_matrix, where entry
+    (u, v) is the weight of the lightest arc from u to v. Parallel arcs are reduced to their
+    minimum as the sparse matrix would otherwise add them up.
+    """
+    from scipy.sparse import csr_matrix  # pylint: disable=import-outside-toplevel
+
+    offsets = np.asarray(graph.f_offsets, dtype=np.int64)
+    heads = np.repeat(np.arange(graph.node_count, dtype=np.int64), np.diff(offsets))
+    tails = np.asarray(graph.f_targets, dtype=np.int64)
+    weights = np.asarray(graph.f_weights, dtype=np.float64)
+    # sort by head, tail and weight and keep the first, lightest arc of every pair
+    order = np.lexsort((weights, tails, heads))
+    heads, tails, weights = heads[order], tails[order], weights[order]
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = (heads[1:] != heads[:-1]) | (tails[1:] != tails[:-1])
+    return csr_matrix(
+        (weights[first], (heads[first], tails[first])),
+        shape=(graph.node_count, graph.node_count)
+    )
+
+
+class VectorizedDijkstra:
+    """
+    This class computes distance vectors of a graph with scipy.sparse.csgraph.dijkstra and returns
+    them as NumPy arrays with inf for unreachable nodes. distances() gives the distances from
+    source nodes like a forward search, dijkstra_dist() the distances to a target node like
+    Dijkstra.dijkstra_dist(). Arcs of weight zero are not supported, as sparse matrices do not
+    distinguish them from missing arcs.
+    """
+    def __init__(self, graph):
+        if not isinstance(graph, CompactGraph):
+            graph = CompactGraph.from_graph(graph)
+        self.graph = graph
+        self.forward = to_csr(graph)
+        # the transposed matrix holds the backward arcs
+        self.backward = self.forward.transpose().tocsr()
+
+    def distances(
+        self,
+        i_sources,
+        backward: bool = False,
+        min_only: bool = False,
+        predecessors: bool = False
+    ):
+        """
+        This method returns the distances from one source index (a vector) or several (one row per
+        source). With backward set, the distances to the given nodes are returned instead. With
+        min_only set, the distances from the nearest of the sources are returned as one vector.
+        With predecessors set, the predecessor indices (-1 if none) are returned as well.
+        """
+        from scipy.sparse.csgraph import dijkstra  # pylint: disable=import-outside-toplevel
+
+        result = dijkstra(
+            self.backward if backward else self.forward,
+            directed=True,
+            indices=i_sources,
+            min_only=min_only,
+            return_predecessors=predecessors
+        )
+        if not predecessors:
+            return result
+        distances, preds = result[0], result[1]
+        # SciPy marks missing predecessors with -9999
+        preds[preds < 0] = -1
+        return distances, preds
+
+    def dijkstra_dist(self, i_target: int) -> np.ndarray:
+        """
+        This method returns the distances from all nodes to the target node.
+        """
+        return self.distances(i_target, backward=True)
+
+    def many_dist(self, i_targets: list[int]) -> np.ndarray:
+        """
+        This method returns the distances from all nodes to several targets, one row per target.
+        """
+        return self.distances(np.asarray(i_targets, dtype=np.int64), backward=True)
+
+    def nearest(self, i_sources: list[int], backward: bool = False) -> np.ndarray:
+        """
+        This method returns the distance of every node from the nearest source (to the nearest
+        target if backward is set).
+        """
+        return self.distances(np.asarray(i_sources, dtype=np.int64), backward, min_only=True)
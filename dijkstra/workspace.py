@@ -0,0 +1,68 @@
+"""
+This module contains a reusable workspace for the searches of the Dijkstra class, so that a query
+does not have to allocate and initialize arrays of the size of the graph.
+"""
+
+
+class SearchWorkspace:
+    """
+    This class holds the distances and predecessors vectors of a search together with the list of
+    node indices whose entries were changed. reset() restores only these entries, so the cost of
+    preparing the next search grows with the region explored by the last one, not with the graph.
+    """
+    def __init__(self, node_count: int):
+        self.distances = [float("inf")] * node_count
+        self.predecessors = [None] * node_count
+        self.touched = []
+
+    def reset(self):
+        """
+        This method restores the entries touched by the last search.
+        """
+        distances = self.distances
+        predecessors = self.predecessors
+        inf = float("inf")
+        for i_node in self.touched:
+            distances[i_node] = inf
+            predecessors[i_node] = None
+        self.touched = []
+
+    def touched_distances(self, bound: float = None) -> "Distances":
+        """
+        This method returns a copy of the distances of the touched nodes. If a bound is given, it
+        caps the distances and is the distance of all other nodes.
+        """
+        distances = self.distances
+        if bound is None:
+            return Distances((i_node, distances[i_node]) for i_node in self.touched)
+        return Distances(
+            ((i_node, min(distances[i_node], bound)) for i_node in self.touched), bound
+        )
+
+    def touched_predecessors(self) -> "Predecessors":
+        """
+        This method returns a copy of the predecessors of the touched nodes.
+        """
+        predecessors = self.predecessors
+        return Predecessors((i_node, predecessors[i_node]) for i_node in self.touched)
+
+
+class Distances(dict):
+    """
+    This class is a sparse distances vector: nodes that were not reached have distance inf, or the
+    given default if the search stopped early.
+    """
+    def __init__(self, items=(), default: float = float("inf")):
+        super().__init__(items)
+        self.default = default
+
+    def __missing__(self, i_node: int) -> float:
+        return self.default
+
+
+class Predecessors(dict):
+    """
+    This class is a sparse predecessors vector: nodes that were not reached have predecessor None.
+    """
+    def __missing__(self, i_node: int):
+        return None
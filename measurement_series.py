@@ -3,9 +3,10 @@ This module is used to fullfill the task 5 of the first assignment in the course
 "Operations Research" at Berliner Hochschule fuer Technik (BHT), Department II.
 """
 from prettytable import PrettyTable
-from oellrich_graph import GraphReader
 
 from dijkstra.core import Dijkstra
+from dijkstra.landmarks import Landmarks
+from dijkstra.reader import CompactGraphReader
 
 
 def main(
@@ -19,20 +20,23 @@ def main(
     This function is the main function of this module. It takes the graph's file path, the start
     node name and main target node name and the corresponding source and target dictionaries as
     arguments and returns a PrettyTable with the results of the iteration measurement series for
-    unmodified and modified edge weights derived from the main target's backward distances.
+    unmodified and modified edge weights derived from the main target's backward distances and for
+    A* with the coordinate heuristic and with 8 landmarks.
     """
-    graph = GraphReader(graph_string, True).read()
-    source_idx = graph.node_by_name(sources_dict[start]).index
-    main_target_idx = graph.node_by_name(targets_dict[main_target]).index
+    graph = CompactGraphReader(graph_string).read()
+    source_idx = graph.node_index(sources_dict[start])
+    main_target_idx = graph.node_index(targets_dict[main_target])
     # initialize table
     title = f"Starknoten {start}"
-    table = [["Zielknoten", "Längen c", "Längen c'"]]
+    table = [["Zielknoten", "Längen c", "Längen c'", "A*", "ALT"]]
     # get backward distances of main target
     dijkstra = Dijkstra(graph)
     back_dist = dijkstra.dijkstra_dist(main_target_idx)
+    # select landmarks once for all targets
+    landmarks = Landmarks.select(graph, 8)
     # iterate over all target nodes and write to row
     for key in targets:
-        target_idx = graph.node_by_name(targets[key]).index
+        target_idx = graph.node_index(targets[key])
         # without backward distances
         _, _, iter_1 = dijkstra.dijkstra(
             source_idx,
@@ -46,8 +50,21 @@ def main(
             back_dist,
             True
         )
+        # with coordinate heuristic
+        _, _, iter_3 = dijkstra.astar(
+            source_idx,
+            target_idx,
+            count=True
+        )
+        # with landmark lower bounds
+        _, _, iter_4 = dijkstra.astar(
+            source_idx,
+            target_idx,
+            landmarks,
+            True
+        )
         # write row
-        table.append([key, iter_1, iter_2])
+        table.append([key, iter_1, iter_2, iter_3, iter_4])
     # print table
     tab = PrettyTable(table[0])
     tab.title = title
@@ -84,33 +101,33 @@ if __name__ == "__main__":
 
     # output:
     # measurement series for deutschland1.gra
-    # +-------------------------------------+
-    # |         Starknoten Stuttgart        |
-    # +--------------+----------+-----------+
-    # |  Zielknoten  | Längen c | Längen c' |
-    # +--------------+----------+-----------+
-    # |    Berlin    |   183    |     17    |
-    # |   Potsdam    |   178    |     16    |
-    # |    Nauen     |   184    |     31    |
-    # | Oranienburg  |   202    |     55    |
-    # |  Strausberg  |   209    |     57    |
-    # | Fürstenwalde |   201    |     78    |
-    # |   Zeuthen    |   182    |     29    |
-    # |  Michendorf  |   175    |     15    |
-    # +--------------+----------+-----------+
+    # +-------------------------------------------------+
+    # |               Starknoten Stuttgart              |
+    # +--------------+----------+-----------+-----+-----+
+    # |  Zielknoten  | Längen c | Längen c' |  A* | ALT |
+    # +--------------+----------+-----------+-----+-----+
+    # |    Berlin    |   183    |     17    | 138 |  17 |
+    # |   Potsdam    |   178    |     16    | 136 |  16 |
+    # |    Nauen     |   184    |     31    | 141 |  17 |
+    # | Oranienburg  |   202    |     55    | 150 |  18 |
+    # |  Strausberg  |   209    |     57    | 152 |  28 |
+    # | Fürstenwalde |   201    |     78    | 149 |  25 |
+    # |   Zeuthen    |   182    |     29    | 137 |  16 |
+    # |  Michendorf  |   175    |     15    | 133 |  15 |
+    # +--------------+----------+-----------+-----+-----+
 
     # measurement series for deutschland2.gra
-    # +-------------------------------------+
-    # |         Starknoten Stuttgart        |
-    # +--------------+----------+-----------+
-    # |  Zielknoten  | Längen c | Längen c' |
-    # +--------------+----------+-----------+
-    # |    Berlin    |   649    |     14    |
-    # |   Potsdam    |   629    |     13    |
-    # |    Nauen     |   653    |     87    |
-    # | Oranienburg  |   677    |    144    |
-    # |  Strausberg  |   681    |    191    |
-    # | Fürstenwalde |   684    |    248    |
-    # |   Zeuthen    |   657    |     74    |
-    # |  Michendorf  |   639    |     32    |
-    # +--------------+----------+-----------+
+    # +-------------------------------------------------+
+    # |               Starknoten Stuttgart              |
+    # +--------------+----------+-----------+-----+-----+
+    # |  Zielknoten  | Längen c | Längen c' |  A* | ALT |
+    # +--------------+----------+-----------+-----+-----+
+    # |    Berlin    |   649    |     14    | 343 |  14 |
+    # |   Potsdam    |   629    |     13    | 323 |  13 |
+    # |    Nauen     |   653    |     87    | 362 |  42 |
+    # | Oranienburg  |   677    |    144    | 397 |  71 |
+    # |  Strausberg  |   681    |    191    | 387 |  17 |
+    # | Fürstenwalde |   684    |    248    | 400 |  58 |
+    # |   Zeuthen    |   657    |     74    | 363 |  45 |
+    # |  Michendorf  |   639    |     32    | 343 |  22 |
+    # +--------------+----------+-----------+-----+-----+
@@ -0,0 +1,64 @@
+"""
+This module contains the unit tests for the asyncio interface of the Dijkstra class.
+"""
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from dijkstra.aio import AsyncDijkstra, Overloaded
+from dijkstra.core import Dijkstra
+from dijkstra.reader import CompactGraphReader
+
+
+class TestAsyncDijkstra(IsolatedAsyncioTestCase):
+    """
+    This class is the TestCase for the AsyncDijkstra class.
+    """
+    graph = CompactGraphReader("./graphs/deutschland2.gra").read()
+
+    async def test_results_of_all_modes(self):
+        """
+        Test that queries give the (dist, pred, iter) results of the synchronous methods.
+        """
+        dijkstra = Dijkstra(self.graph)
+        facade = AsyncDijkstra(dijkstra)
+        back_dist = dijkstra.dijkstra_dist(500)
+        expected = {
+            "unmodified": dijkstra.dijkstra(3, 500, count=True),
+            "modified": dijkstra.dijkstra(3, 500, back_dist, count=True),
+            "bidirectional": dijkstra.bidirectional(3, 500, count=True),
+            "astar": dijkstra.astar(3, 500, count=True),
+        }
+        for mode, result in expected.items():
+            self.assertEqual(await facade.query(3, 500, mode), result)
+        with self.assertRaises(ValueError):
+            await facade.query(3, 500, "fastest")
+
+    async def test_coalescing(self):
+        """
+        Test that concurrent identical queries share one search and distinct ones do not.
+        """
+        facade = AsyncDijkstra(Dijkstra(self.graph))
+        results = await asyncio.gather(
+            *[facade.query(3, 500) for _ in range(10)], facade.query(4, 500)
+        )
+        self.assertEqual(facade.stats(), {"searches": 2, "coalesced": 9, "pending": 0})
+        for result in results[1:10]:
+            self.assertIs(result, results[0])
+        # a later query starts a new search
+        await facade.query(3, 500)
+        self.assertEqual(facade.searches, 3)
+
+    async def test_back_pressure(self):
+        """
+        Test that new searches beyond max_pending are refused while identical ones still coalesce.
+        """
+        facade = AsyncDijkstra(Dijkstra(self.graph), max_concurrent=1, max_pending=2)
+        first = asyncio.ensure_future(facade.query(0, 500))
+        second = asyncio.ensure_future(facade.query(1, 500))
+        await asyncio.sleep(0)
+        with self.assertRaises(Overloaded):
+            await facade.query(2, 500)
+        same = await facade.query(0, 500)
+        self.assertEqual(same, await first)
+        await second
+        self.assertEqual(facade.stats()["pending"], 0)
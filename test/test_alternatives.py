@@ -0,0 +1,111 @@
+"""
+This module contains the unit tests for the k_shortest_paths generator.
+"""
+import random
+from itertools import islice
+from unittest import TestCase
+
+from dijkstra.alternatives import k_shortest_paths
+from dijkstra.core import Dijkstra
+from dijkstra.reader import CompactGraphReader
+
+
+class TestKShortestPaths(TestCase):
+    """
+    This class is the TestCase for the k_shortest_paths generator.
+    """
+    test_graphs = {
+        "test10": CompactGraphReader("./graphs/test10.gra").read(),
+        "deutschland2": CompactGraphReader("./graphs/deutschland2.gra").read(),
+    }
+
+    def all_paths(self, graph, i_source: int, i_target: int) -> list[float]:
+        """
+        This method returns the sorted lengths of all loopless paths by depth-first search.
+        """
+        lengths = {}
+
+        def visit(path: list[int], length: float):
+            if path[-1] == i_target:
+                lengths[tuple(path)] = min(length, lengths.get(tuple(path), length))
+                return
+            for i_head, weight in graph.forward(path[-1]):
+                if i_head not in path:
+                    visit(path + [i_head], length + weight)
+        visit([i_source], 0.0)
+        return sorted(lengths.values())
+
+    def path_length(self, graph, path: list[int]) -> float:
+        """
+        This method returns the length of a path using the shortest of parallel arcs.
+        """
+        return sum(
+            min(weight for i_head, weight in graph.forward(i_node) if i_head == i_next)
+            for i_node, i_next in zip(path, path[1:])
+        )
+
+    def test_test10_all_pairs(self):
+        """
+        Test that k_shortest_paths() yields the lengths of all loopless paths for all pairs of
+        test10.gra.
+        """
+        graph = self.test_graphs["test10"]
+        dijkstra = Dijkstra(graph)
+        for i_source in range(graph.node_count):
+            for i_target in range(graph.node_count):
+                lengths = [dist for dist, _ in k_shortest_paths(dijkstra, i_source, i_target)]
+                expected = self.all_paths(graph, i_source, i_target)
+                self.assertEqual(len(lengths), len(expected))
+                for dist, dist_expected in zip(lengths, expected):
+                    self.assertAlmostEqual(dist, dist_expected)
+
+    def test_test10_node_a_node_f(self):
+        """
+        Test k_shortest_paths() for test10.gra for node A to node F, which is not reachable.
+        """
+        dijkstra = Dijkstra(self.test_graphs["test10"])
+        self.assertEqual(list(k_shortest_paths(dijkstra, 0, 5)), [])
+
+    def test_deutschland2(self):
+        """
+        Test that the first ten paths of random queries on deutschland2.gra start with the shortest
+        path, are distinct, loopless, sorted and as long as their distance.
+        """
+        graph = self.test_graphs["deutschland2"]
+        dijkstra = Dijkstra(graph, compact=True)
+        rng = random.Random(0)
+        for _ in range(10):
+            source_idx = rng.randrange(graph.node_count)
+            target_idx = rng.randrange(graph.node_count)
+            back_dist = dijkstra.dijkstra_dist(target_idx)
+            paths = list(islice(
+                k_shortest_paths(dijkstra, source_idx, target_idx, back_dist, count=True), 10
+            ))
+            self.assertEqual(len(paths), 10)
+            self.assertEqual(paths[0][0], back_dist[source_idx])
+            self.assertEqual([dist for dist, _, _ in paths], sorted(dist for dist, _, _ in paths))
+            self.assertEqual(len({tuple(path) for _, path, _ in paths}), 10)
+            for dist, path, settled in paths:
+                self.assertEqual((path[0], path[-1]), (source_idx, target_idx))
+                self.assertEqual(len(set(path)), len(path))
+                self.assertAlmostEqual(self.path_length(graph, path), dist)
+                self.assertGreater(settled, 0)
+
+    def test_avoid(self):
+        """
+        Test that masked nodes and arcs do not appear on the paths of deutschland2.gra and that the
+        shortest path gets longer when its first arc is masked.
+        """
+        graph = self.test_graphs["deutschland2"]
+        dijkstra = Dijkstra(graph, compact=True)
+        dist, path = next(k_shortest_paths(dijkstra, 3, 600))
+        avoid_node = path[len(path) // 2]
+        avoid_arc = (path[0], path[1])
+        paths = list(islice(
+            k_shortest_paths(dijkstra, 3, 600, avoid_nodes=[avoid_node], avoid_arcs=[avoid_arc]), 5
+        ))
+        self.assertGreater(paths[0][0], dist)
+        for _, other in paths:
+            self.assertNotIn(avoid_node, other)
+            self.assertNotIn(avoid_arc, list(zip(other, other[1:])))
+        self.assertEqual(list(k_shortest_paths(dijkstra, 3, 600, avoid_nodes=[600])), [])
@@ -0,0 +1,79 @@
+"""
+This module contains the unit tests for the A* search and the coordinate heuristics.
+"""
+from unittest import TestCase
+
+from dijkstra.core import Dijkstra
+from dijkstra.helpers import track_path
+from dijkstra.heuristics import CoordinateHeuristic, euclidean, haversine
+from dijkstra.reader import CompactGraphReader
+
+
+class TestAStar(TestCase):
+    """
+    This class is the TestCase for Dijkstra.astar() and the CoordinateHeuristic class.
+    """
+    test_graphs = {
+        "test10": CompactGraphReader("./graphs/test10.gra").read(),
+        "deutschland2": CompactGraphReader("./graphs/deutschland2.gra").read(),
+        "berlin": CompactGraphReader("./graphs/berlin.gra").read(),
+    }
+
+    def test_metrics(self):
+        """
+        Test the euclidean and haversine metric.
+        """
+        self.assertEqual(euclidean(0, 0, 3, 4), 5)
+        # Berlin - Stuttgart, roughly 511 km
+        self.assertAlmostEqual(haversine(13.405, 52.52, 9.18, 48.78), 511, delta=2)
+
+    def test_heuristic_selection(self):
+        """
+        Test that haversine is used for longitude/latitude and euclidean for projected coordinates.
+        """
+        self.assertIs(CoordinateHeuristic(self.test_graphs["deutschland2"]).metric, haversine)
+        self.assertIs(CoordinateHeuristic(self.test_graphs["berlin"]).metric, euclidean)
+
+    def test_heuristic_consistent(self):
+        """
+        Test that the calibrated heuristic never overestimates an arc of berlin.gra.
+        """
+        graph = self.test_graphs["berlin"]
+        estimate = CoordinateHeuristic(graph).bind(0)
+        for i_node in range(graph.node_count):
+            for i_head, weight in graph.forward(i_node):
+                self.assertLessEqual(estimate(i_node), weight + estimate(i_head))
+
+    def test_astar_test10_node_f_node_c(self):
+        """
+        Test astar() for test10.gra for node F to node C.
+        """
+        dijkstra = Dijkstra(self.test_graphs["test10"])
+        dist, pred = dijkstra.astar(5, 2)
+        self.assertEqual(round(dist, 2), 5.89)
+        self.assertEqual(track_path(pred, 5, 2), [5, 8, 3, 2])
+
+    def test_astar_test10_node_a_node_f(self):
+        """
+        Test astar() for test10.gra for node A to node F.
+        """
+        dijkstra = Dijkstra(self.test_graphs["test10"])
+        dist, pred = dijkstra.astar(0, 5)
+        self.assertEqual(dist, float("inf"))
+        self.assertEqual(track_path(pred, 0, 5), None)
+
+    def test_astar_deutschland2(self):
+        """
+        Test that astar() finds the shortest distances of dijkstra() with fewer iterations on
+        deutschland2.gra.
+        """
+        graph = self.test_graphs["deutschland2"]
+        dijkstra = Dijkstra(graph)
+        source_idx = graph.node_index("711000")
+        for name in ["300000", "331000", "332100", "336100"]:
+            target_idx = graph.node_index(name)
+            dist, _, iter_dijkstra = dijkstra.dijkstra(source_idx, target_idx, count=True)
+            dist_astar, pred, iter_astar = dijkstra.astar(source_idx, target_idx, count=True)
+            self.assertEqual(dist_astar, dist)
+            self.assertEqual(track_path(pred, source_idx, target_idx)[-1], target_idx)
+            self.assertLess(iter_astar, iter_dijkstra)
@@ -0,0 +1,74 @@
+"""
+This module contains the unit tests for the one-to-many and many-to-many distance API.
+"""
+import random
+from unittest import TestCase
+
+import numpy as np
+
+from dijkstra.core import Dijkstra
+from dijkstra.hierarchy import ContractionHierarchy
+from dijkstra.reader import CompactGraphReader
+
+
+class TestBatch(TestCase):
+    """
+    This class is the TestCase for Dijkstra.one_to_many() and Dijkstra.many_to_many().
+    """
+    test_graphs = {
+        "test10": CompactGraphReader("./graphs/test10.gra").read(),
+        "deutschland2": CompactGraphReader("./graphs/deutschland2.gra").read(),
+    }
+
+    def reference(self, graph, i_sources, i_targets) -> np.ndarray:
+        """
+        This method returns the distance matrix computed with one dijkstra() run per pair.
+        """
+        dijkstra = Dijkstra(graph)
+        return np.array([
+            [dijkstra.dijkstra(i_source, i_target)[0] for i_target in i_targets]
+            for i_source in i_sources
+        ])
+
+    def test_one_to_many_test10(self):
+        """
+        Test one_to_many() for test10.gra from node A, including unreachable node F.
+        """
+        dijkstra = Dijkstra(self.test_graphs["test10"])
+        dist, pred = dijkstra.one_to_many(0, [1, 5, 7], predecessors=True)
+        self.assertEqual(list(np.round(dist, 2)), [5.4, np.inf, 3.82])
+        self.assertEqual(pred[0], 0)
+        self.assertEqual(pred[5], -1)
+        self.assertEqual(pred[7], 6)
+
+    def test_many_to_many_test10(self):
+        """
+        Test many_to_many() for all pairs of test10.gra.
+        """
+        graph = self.test_graphs["test10"]
+        nodes = list(range(graph.node_count))
+        matrix = Dijkstra(graph).many_to_many(nodes, nodes)
+        np.testing.assert_allclose(matrix, self.reference(graph, nodes, nodes))
+
+    def test_many_to_many_deutschland2(self):
+        """
+        Test the forward, backward and bucket-based many_to_many() on deutschland2.gra.
+        """
+        graph = self.test_graphs["deutschland2"]
+        dijkstra = Dijkstra(graph)
+        rng = random.Random(0)
+        i_sources = [rng.randrange(graph.node_count) for _ in range(12)]
+        i_targets = [rng.randrange(graph.node_count) for _ in range(8)]
+        reference = self.reference(graph, i_sources, i_targets)
+        # fewer targets than sources: one backward search per target
+        np.testing.assert_allclose(dijkstra.many_to_many(i_sources, i_targets), reference)
+        matrix, pred = dijkstra.many_to_many(i_sources, i_targets, predecessors=True)
+        np.testing.assert_allclose(matrix, reference)
+        self.assertEqual(pred.shape, (12, graph.node_count))
+        self.assertEqual(pred[0, i_sources[0]], i_sources[0])
+        hierarchy = ContractionHierarchy.build(graph)
+        np.testing.assert_allclose(
+            dijkstra.many_to_many(i_sources, i_targets, hierarchy=hierarchy), reference
+        )
+        with self.assertRaises(ValueError):
+            dijkstra.many_to_many(i_sources, i_targets, True, hierarchy)
@@ -0,0 +1,84 @@
+"""
+This module contains the unit tests for the bidirectional Dijkstra search.
+"""
+import random
+from unittest import TestCase
+
+from dijkstra.core import Dijkstra
+from dijkstra.helpers import track_path
+from dijkstra.reader import CompactGraphReader
+
+
+class TestBidirectional(TestCase):
+    """
+    This class is the TestCase for Dijkstra.bidirectional().
+    """
+    test_graphs = {
+        "test10": CompactGraphReader("./graphs/test10.gra").read(),
+        "berlin": CompactGraphReader("./graphs/berlin.gra").read(),
+    }
+
+    def test_bidirectional_test10_node_a_node_a(self):
+        """
+        Test bidirectional() for test10.gra for node A to node A.
+        """
+        dijkstra = Dijkstra(self.test_graphs["test10"])
+        dist, pred = dijkstra.bidirectional(0, 0)
+        self.assertEqual(dist, 0)
+        self.assertEqual(track_path(pred, 0, 0), [0])
+
+    def test_bidirectional_test10_node_a_node_f(self):
+        """
+        Test bidirectional() for test10.gra for node A to node F.
+        """
+        dijkstra = Dijkstra(self.test_graphs["test10"])
+        dist, pred = dijkstra.bidirectional(0, 5)
+        self.assertEqual(dist, float("inf"))
+        self.assertEqual(track_path(pred, 0, 5), None)
+
+    def test_bidirectional_test10_node_f_node_c(self):
+        """
+        Test bidirectional() for test10.gra for node F to node C.
+        """
+        dijkstra = Dijkstra(self.test_graphs["test10"])
+        dist, pred = dijkstra.bidirectional(5, 2)
+        self.assertEqual(round(dist, 2), 5.89)
+        self.assertEqual(track_path(pred, 5, 2), [5, 8, 3, 2])
+
+    def test_bidirectional_test10_node_f_node_e(self):
+        """
+        Test bidirectional() for test10.gra for node F to node E.
+        """
+        dijkstra = Dijkstra(self.test_graphs["test10"])
+        dist, pred = dijkstra.bidirectional(5, 4)
+        self.assertEqual(round(dist, 2), 4.65)
+        self.assertEqual(track_path(pred, 5, 4), [5, 6, 0, 4])
+
+    def test_bidirectional_berlin(self):
+        """
+        Test that bidirectional() finds the distances of dijkstra() on random connected queries of
+        berlin.gra, returns valid paths and settles fewer nodes.
+        """
+        graph = self.test_graphs["berlin"]
+        dijkstra = Dijkstra(graph)
+        rng = random.Random(0)
+        iter_dijkstra, iter_bidirectional = 0, 0
+        queries = 0
+        while queries < 20:
+            source_idx = rng.randrange(graph.node_count)
+            target_idx = rng.randrange(graph.node_count)
+            dist, _, iterations = dijkstra.dijkstra(source_idx, target_idx, count=True)
+            if dist == float("inf"):
+                continue
+            queries += 1
+            iter_dijkstra += iterations
+            dist_bidir, pred, iterations = dijkstra.bidirectional(source_idx, target_idx, True)
+            iter_bidirectional += iterations
+            self.assertAlmostEqual(dist_bidir, dist)
+            path = track_path(pred, source_idx, target_idx)
+            length = sum(
+                min(weight for i_head, weight in graph.forward(i_node) if i_head == i_next)
+                for i_node, i_next in zip(path, path[1:])
+            )
+            self.assertAlmostEqual(length, dist)
+        self.assertLess(iter_bidirectional, iter_dijkstra)
@@ -0,0 +1,128 @@
+"""
+This module contains the unit tests for the binary graph cache.
+"""
+import os
+import shutil
+import tempfile
+from unittest import TestCase, mock
+
+from dijkstra.cache import HEADER, CachedGraphReader, cache_path, is_valid, read_header
+from dijkstra.core import Dijkstra
+from dijkstra.reader import CompactGraphReader
+
+
+class TestCachedGraphReader(TestCase):
+    """
+    This class is the TestCase for the CachedGraphReader class.
+    """
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "deutschland2.gra")
+        shutil.copy("./graphs/deutschland2.gra", self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_cache_miss_then_hit(self):
+        """
+        Test that the first read writes the cache and the second read uses it.
+        """
+        reader = CachedGraphReader(self.path)
+        reader.read()
+        self.assertFalse(reader.cache_hit)
+        self.assertTrue(os.path.exists(cache_path(self.path)))
+        reader = CachedGraphReader(self.path)
+        reader.read()
+        self.assertTrue(reader.cache_hit)
+
+    def test_cached_graph_equals_parsed_graph(self):
+        """
+        Test that the memory-mapped graph has the same content as the parsed graph.
+        """
+        CachedGraphReader(self.path).read()
+        graph = CachedGraphReader(self.path).read()
+        reference = CompactGraphReader(self.path).read()
+        self.assertEqual(graph.node_count, reference.node_count)
+        self.assertEqual(graph.edge_count, reference.edge_count)
+        self.assertEqual(graph.names, reference.names)
+        self.assertEqual(graph.f_offsets, reference.f_offsets)
+        self.assertEqual(graph.b_targets, reference.b_targets)
+        self.assertEqual(graph.f_weights, reference.f_weights)
+        self.assertEqual(graph.coords[0], reference.coords[0])
+        source_idx = reference.node_index("711000")
+        target_idx = reference.node_index("300000")
+        self.assertEqual(
+            Dijkstra(graph).dijkstra(source_idx, target_idx, count=True),
+            Dijkstra(reference).dijkstra(source_idx, target_idx, count=True)
+        )
+
+    def test_touched_source_keeps_cache(self):
+        """
+        Test that a new modification time with unchanged content keeps the cache valid.
+        """
+        CachedGraphReader(self.path).read()
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        reader = CachedGraphReader(self.path)
+        reader.read()
+        self.assertTrue(reader.cache_hit)
+        self.assertEqual(read_header(cache_path(self.path))[6], stat.st_mtime_ns + 10 ** 9)
+
+    def test_changed_source_invalidates_cache(self):
+        """
+        Test that a changed source file rebuilds the cache.
+        """
+        CachedGraphReader(self.path).read()
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write("# new comment\n")
+        reader = CachedGraphReader(self.path)
+        graph = reader.read()
+        self.assertFalse(reader.cache_hit)
+        self.assertEqual(graph.node_count, 676)
+
+    def test_no_cache(self):
+        """
+        Test that use_cache=False neither reads nor writes the cache.
+        """
+        reader = CachedGraphReader(self.path, use_cache=False)
+        reader.read()
+        self.assertFalse(reader.cache_hit)
+        self.assertFalse(os.path.exists(cache_path(self.path)))
+
+    def test_header_alignment(self):
+        """
+        Test that the header keeps the arrays behind it 8-byte aligned.
+        """
+        self.assertEqual(HEADER.size % 8, 0)
+
+    def test_truncated_cache_is_rebuilt(self):
+        """
+        Test that a truncated cache file is a miss and is written again.
+        """
+        CachedGraphReader(self.path).read()
+        size = os.path.getsize(cache_path(self.path))
+        for length in (size - 1, HEADER.size + 8):
+            with open(cache_path(self.path), "r+b") as file:
+                file.truncate(length)
+            reader = CachedGraphReader(self.path)
+            graph = reader.read()
+            self.assertFalse(reader.cache_hit)
+            self.assertEqual(graph.node_count, 676)
+            self.assertEqual(os.path.getsize(cache_path(self.path)), size)
+
+    def test_unwritable_cache_is_outdated(self):
+        """
+        Test that a touched source file makes the cache outdated if its header cannot be refreshed.
+        """
+        CachedGraphReader(self.path).read()
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+        # the cache is only opened in binary mode
+        def read_only(path, mode="rb"):
+            if mode == "r+b":
+                raise PermissionError(path)
+            return open(path, mode)
+
+        with mock.patch("dijkstra.cache.open", side_effect=read_only, create=True):
+            self.assertFalse(is_valid(cache_path(self.path), self.path))
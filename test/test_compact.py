@@ -0,0 +1,77 @@
+"""
+This module contains the unit tests for the CompactGraph class and the array-backed Dijkstra engine.
+"""
+from unittest import TestCase
+from oellrich_graph import GraphReader
+
+from dijkstra.compact import CompactGraph
+from dijkstra.core import Dijkstra
+
+
+class TestCompactGraph(TestCase):
+    """
+    This class is the TestCase for the CompactGraph class.
+    """
+    test_graphs = {
+        "test10": GraphReader("./graphs/test10.gra", True).read(),
+        "deutschland2": GraphReader("./graphs/deutschland2.gra", True).read(),
+    }
+
+    def test_setup_test10(self):
+        """
+        Test CompactGraph.from_graph() for test10.gra.
+        """
+        compact = CompactGraph.from_graph(self.test_graphs["test10"])
+        self.assertEqual(compact.node_count, 10)
+        self.assertEqual(compact.edge_count, 32)
+        self.assertEqual(compact.arc_count, 32)
+        self.assertEqual(len(compact.f_offsets), 11)
+        self.assertEqual(len(compact.b_targets), 32)
+        self.assertEqual(compact.node_index("F"), 5)
+
+    def test_adjacency_test10(self):
+        """
+        Test that the compact adjacency matches the f_edges and b_edges of test10.gra.
+        """
+        graph = self.test_graphs["test10"]
+        compact = CompactGraph.from_graph(graph)
+        for node in graph.nodes:
+            self.assertEqual(
+                list(compact.forward(node.index)),
+                [(edge.tail.index, edge.weight) for edge in node.f_edges]
+            )
+            self.assertEqual(
+                list(compact.backward(node.index)),
+                [(edge.head.index, edge.weight) for edge in node.b_edges]
+            )
+
+    def test_dijkstra_dist_deutschland2(self):
+        """
+        Test that dijkstra_dist() returns the same distances on both engines for deutschland2.gra.
+        """
+        graph = self.test_graphs["deutschland2"]
+        dijkstra = Dijkstra(graph)
+        compact = Dijkstra(graph, compact=True)
+        for i_target in range(0, graph.node_count, 97):
+            self.assertEqual(dijkstra.dijkstra_dist(i_target), compact.dijkstra_dist(i_target))
+
+    def test_dijkstra_deutschland2(self):
+        """
+        Test that dijkstra() returns the same results on both engines for deutschland2.gra with and
+        without backward distances.
+        """
+        graph = self.test_graphs["deutschland2"]
+        dijkstra = Dijkstra(graph)
+        compact = Dijkstra(graph, compact=True)
+        source_idx = graph.node_by_name("711000").index
+        for name in ["300000", "331000", "332100", "337620"]:
+            target_idx = graph.node_by_name(name).index
+            back_dist = dijkstra.dijkstra_dist(target_idx)
+            self.assertEqual(
+                dijkstra.dijkstra(source_idx, target_idx, count=True),
+                compact.dijkstra(source_idx, target_idx, count=True)
+            )
+            self.assertEqual(
+                dijkstra.dijkstra(source_idx, target_idx, back_dist, True),
+                compact.dijkstra(source_idx, target_idx, back_dist, True)
+            )
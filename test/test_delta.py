@@ -0,0 +1,73 @@
+"""
+This module contains the unit tests for the DeltaStepping class.
+"""
+import random
+from unittest import TestCase
+
+from dijkstra.core import Dijkstra
+from dijkstra.delta import DeltaStepping, auto_delta
+from dijkstra.reader import CompactGraphReader
+
+
+class TestDeltaStepping(TestCase):
+    """
+    This class is the TestCase for the DeltaStepping class.
+    """
+    test_graphs = {
+        "test10": CompactGraphReader("./graphs/test10.gra").read(),
+        "deutschland2": CompactGraphReader("./graphs/deutschland2.gra").read(),
+    }
+
+    def test_auto_delta(self):
+        """
+        Test auto_delta() for some weights.
+        """
+        self.assertEqual(auto_delta([0.0, 1.0, 3.0], 1.0), 2.0)
+        self.assertEqual(auto_delta([0.0, 1.0, 3.0]), 16.0)
+        self.assertEqual(auto_delta([2.0, 100.0], 0.01), 2.0)
+        self.assertEqual(auto_delta([0.0]), 1.0)
+
+    def test_dijkstra_dist_test10(self):
+        """
+        Test that dijkstra_dist() returns the distances of Dijkstra.dijkstra_dist() for all targets
+        of test10.gra with narrow, automatic and wide buckets.
+        """
+        graph = self.test_graphs["test10"]
+        dijkstra = Dijkstra(graph)
+        for delta in (0.5, None, 100.0):
+            engine = DeltaStepping(graph, delta)
+            for i_target in range(graph.node_count):
+                self.assertEqual(
+                    list(engine.dijkstra_dist(i_target)), dijkstra.dijkstra_dist(i_target)
+                )
+
+    def test_distances_deutschland2(self):
+        """
+        Test that the backward and forward distances of random nodes of deutschland2.gra equal the
+        distances of Dijkstra.dijkstra_dist() and Dijkstra.multi_source().
+        """
+        graph = self.test_graphs["deutschland2"]
+        dijkstra = Dijkstra(graph, compact=True)
+        rng = random.Random(0)
+        for delta in (10.0, None):
+            engine = DeltaStepping(graph, delta)
+            for _ in range(10):
+                i_node = rng.randrange(graph.node_count)
+                self.assertEqual(
+                    list(engine.dijkstra_dist(i_node)), dijkstra.dijkstra_dist(i_node)
+                )
+                self.assertEqual(
+                    list(engine.distances(i_node)), dijkstra.multi_source([i_node])[0]
+                )
+                self.assertGreater(engine.buckets, 0)
+                self.assertGreaterEqual(engine.phases, engine.buckets)
+
+    def test_many_dist(self):
+        """
+        Test that many_dist() returns one row per target of test10.gra.
+        """
+        graph = self.test_graphs["test10"]
+        engine = DeltaStepping(graph)
+        matrix = engine.many_dist([2, 7])
+        self.assertEqual(matrix.shape, (2, graph.node_count))
+        self.assertEqual(list(matrix[1]), list(engine.dijkstra_dist(7)))
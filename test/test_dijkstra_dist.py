@@ -0,0 +1,91 @@
+"""
+This module contains the unit tests for the stop conditions and counters of dijkstra_dist().
+"""
+import random
+from unittest import TestCase
+
+from dijkstra.core import Dijkstra
+from dijkstra.reader import CompactGraphReader
+
+
+class TestDijkstraDist(TestCase):
+    """
+    This class is the TestCase for the early exit of Dijkstra.dijkstra_dist().
+    """
+    test_graphs = {
+        "test10": CompactGraphReader("./graphs/test10.gra").read(),
+        "berlin": CompactGraphReader("./graphs/berlin.gra").read(),
+    }
+
+    def test_counts_berlin(self):
+        """
+        Test that a full search on berlin.gra settles every reachable node once and counts every
+        other pop as stale.
+        """
+        dijkstra = Dijkstra(self.test_graphs["berlin"])
+        distances, stats = dijkstra.dijkstra_dist(0, count=True)
+        reachable = sum(dist < float("inf") for dist in distances)
+        self.assertEqual(stats["settled"], reachable)
+        self.assertEqual(stats["pops"], stats["settled"] + stats["stale"])
+        self.assertGreater(stats["relaxations"], 0)
+
+    def test_radius_berlin(self):
+        """
+        Test that nodes within the radius get exact distances and all other nodes a lower bound
+        beyond the radius for berlin.gra.
+        """
+        dijkstra = Dijkstra(self.test_graphs["berlin"])
+        full = dijkstra.dijkstra_dist(0)
+        radius = sorted(full)[len(full) // 10]
+        partial, stats = dijkstra.dijkstra_dist(0, radius=radius, count=True)
+        for dist, bound in zip(full, partial):
+            if dist <= radius:
+                self.assertEqual(bound, dist)
+            else:
+                self.assertGreater(bound, radius)
+                self.assertLessEqual(bound, dist)
+        self.assertLess(stats["settled"], len(full))
+
+    def test_settle_and_max_settled_berlin(self):
+        """
+        Test that the search stops after the requested nodes or number of nodes are settled for
+        berlin.gra.
+        """
+        dijkstra = Dijkstra(self.test_graphs["berlin"])
+        full = dijkstra.dijkstra_dist(0)
+        wanted = [1, 2, 3]
+        partial = dijkstra.dijkstra_dist(0, settle=wanted)
+        for i_node in wanted:
+            self.assertEqual(partial[i_node], full[i_node])
+        _, stats = dijkstra.dijkstra_dist(0, max_settled=50, count=True)
+        self.assertEqual(stats["settled"], 50)
+
+    def test_partial_potential_berlin(self):
+        """
+        Test that dijkstra() with the distances of a search stopped at the source as potential finds
+        the shortest paths for random queries on berlin.gra, with and without workspace.
+        """
+        graph = self.test_graphs["berlin"]
+        rng = random.Random(0)
+        for dijkstra in (Dijkstra(graph), Dijkstra(graph, workspace=True)):
+            for _ in range(10):
+                i_source = rng.randrange(graph.node_count)
+                i_target = rng.randrange(graph.node_count)
+                dist = dijkstra.dijkstra(i_source, i_target)[0]
+                potential = dijkstra.dijkstra_dist(i_target, settle=[i_source])
+                self.assertAlmostEqual(
+                    dijkstra.dijkstra(i_source, i_target, potential)[0], dist, places=6
+                )
+
+    def test_settle_test10_all_pairs(self):
+        """
+        Test that the settled nodes of an early exit get the distances of a full search for all
+        pairs of test10.gra.
+        """
+        graph = self.test_graphs["test10"]
+        dijkstra = Dijkstra(graph)
+        for i_target in range(graph.node_count):
+            full = dijkstra.dijkstra_dist(i_target)
+            for i_node in range(graph.node_count):
+                partial = dijkstra.dijkstra_dist(i_target, settle=[i_node])
+                self.assertEqual(partial[i_node], full[i_node])
@@ -0,0 +1,157 @@
+"""
+This module contains the unit tests for the incremental repair of shortest path trees.
+"""
+import random
+from array import array
+from unittest import TestCase
+
+from dijkstra.core import Dijkstra
+from dijkstra.dynamic import DynamicDistances, set_arc_weights
+from dijkstra.potentials import PotentialCache
+from dijkstra.reader import CompactGraphReader
+
+
+class TestDynamicDistances(TestCase):
+    """
+    This class is the TestCase for the DynamicDistances class.
+    """
+    def random_changes(self, graph, rng: random.Random, count: int) -> list[tuple]:
+        """
+        This method returns weight changes of random arcs that make them lighter or heavier.
+        """
+        changes = []
+        while len(changes) < count:
+            i_tail = rng.randrange(graph.node_count)
+            start, end = graph.f_offsets[i_tail], graph.f_offsets[i_tail + 1]
+            if start == end:
+                continue
+            pos = rng.randrange(start, end)
+            factor = rng.choice((0.2, 0.5, 2, 10))
+            weight = max(1, int(graph.f_weights[pos] * factor))
+            changes.append((i_tail, graph.f_targets[pos], weight))
+        return changes
+
+    def check_tree(self, graph, dynamic: DynamicDistances, i_root: int):
+        """
+        This method checks that every parent is a node from which the tree distance is reached.
+        """
+        distances, parents = dynamic.distances(i_root), dynamic.parents(i_root)
+        for i_node in range(graph.node_count):
+            i_parent = parents[i_node]
+            if i_node == i_root or i_parent < 0:
+                continue
+            if dynamic.backward:
+                arcs = graph.forward(i_node)
+                self.assertIn(
+                    distances[i_node],
+                    [weight + distances[i_parent] for i_head, weight in arcs if i_head == i_parent]
+                )
+            else:
+                arcs = graph.forward(i_parent)
+                self.assertIn(
+                    distances[i_node],
+                    [distances[i_parent] + weight for i_head, weight in arcs if i_head == i_node]
+                )
+
+    def test_repair_berlin(self):
+        """
+        Test that repaired trees give the distances of new searches after batches of random weight
+        changes on berlin.gra, in both directions.
+        """
+        graph = CompactGraphReader("./graphs/berlin.gra").read()
+        rng = random.Random(0)
+        for backward in (True, False):
+            dynamic = DynamicDistances(graph, backward)
+            roots = [rng.randrange(graph.node_count) for _ in range(2)]
+            for i_root in roots:
+                dynamic.add(i_root)
+            for count in (1, 10, 100):
+                changed = dynamic.update(self.random_changes(graph, rng, count))
+                dijkstra = Dijkstra(graph)
+                for i_root in roots:
+                    if backward:
+                        expected = dijkstra.dijkstra_dist(i_root)
+                    else:
+                        expected = list(dijkstra.one_to_many(i_root, range(graph.node_count)))
+                    self.assertEqual(list(dynamic.distances(i_root)), expected)
+                    self.check_tree(graph, dynamic, i_root)
+                    self.assertLessEqual(changed[i_root], graph.node_count)
+
+    def test_set_arc_weights_test10(self):
+        """
+        Test that set_arc_weights() changes forward and backward arcs, copies read-only arrays and
+        refuses missing arcs.
+        """
+        graph = CompactGraphReader("./graphs/test10.gra").read()
+        i_tail, weight = next(iter(graph.forward(0)))
+        graph.f_weights = memoryview(bytes(memoryview(graph.f_weights).cast("B"))).cast("d")
+        applied = set_arc_weights(graph, [(0, i_tail, weight + 5)])
+        self.assertEqual(applied, [(0, i_tail, weight, weight + 5)])
+        self.assertIsInstance(graph.f_weights, array)
+        self.assertIn((0, weight + 5), list(graph.backward(i_tail)))
+        with self.assertRaises(ValueError):
+            set_arc_weights(graph, [(0, 0, 1.0)])
+
+    def test_potentials_after_update_berlin(self):
+        """
+        Test that dijkstra() with modified weights gives the distance of a new search after a
+        weight decrease, with the potential from a PotentialCache filled before the change and
+        with the repaired potential stored by update().
+        """
+        graph = CompactGraphReader("./graphs/berlin.gra").read()
+        rng = random.Random(1)
+        i_target = rng.randrange(graph.node_count)
+        sources = [rng.randrange(graph.node_count) for _ in range(10)]
+        cache = PotentialCache()
+        dijkstra = Dijkstra(graph)
+        cache.get(dijkstra, i_target)
+        reference = Dijkstra(graph)
+        self.assertLess(reference.dijkstra(sources[0], i_target)[0], float("inf"))
+        # make the arcs along a shortest path much lighter
+        predecessors = reference.dijkstra(sources[0], i_target)[1]
+        path = [i_target]
+        while path[-1] != sources[0]:
+            path.append(predecessors[path[-1]])
+        path.reverse()
+        weights = [
+            min(weight for i_next, weight in graph.forward(i_tail) if i_next == i_head)
+            for i_tail, i_head in zip(path, path[1:])
+        ]
+        set_arc_weights(graph, [
+            (i_tail, i_head, max(1, weight // 10))
+            for i_tail, i_head, weight in zip(path, path[1:], weights)
+        ])
+        for i_source in sources:
+            expected = Dijkstra(graph).dijkstra(i_source, i_target)[0]
+            potential = cache.get(dijkstra, i_target)
+            self.assertEqual(dijkstra.dijkstra(i_source, i_target, potential)[0], expected)
+        dynamic = DynamicDistances(graph, potentials=cache)
+        dynamic.add(i_target)
+        dynamic.update([
+            (i_tail, i_head, max(1, weight // 100))
+            for i_tail, i_head, weight in zip(path, path[1:], weights)
+        ])
+        misses = cache.misses
+        potential = cache.get(dijkstra, i_target)
+        self.assertEqual(cache.misses, misses)
+        self.assertEqual(list(potential), Dijkstra(graph).dijkstra_dist(i_target))
+        for i_source in sources:
+            expected = Dijkstra(graph).dijkstra(i_source, i_target)[0]
+            self.assertEqual(dijkstra.dijkstra(i_source, i_target, potential)[0], expected)
+
+    def test_queue_after_update_berlin(self):
+        """
+        Test that the integer queues of an existing Dijkstra object follow new weights beyond
+        the largest old one and refuse fractional ones.
+        """
+        graph = CompactGraphReader("./graphs/berlin.gra").read()
+        bucket = Dijkstra(graph, queue="bucket")
+        i_head, weight = next(iter(graph.forward(0)))
+        heavy = int(max(graph.f_weights)) * 10
+        set_arc_weights(graph, [(0, i_head, heavy)])
+        for i_target in (i_head, 100, 2000):
+            expected = Dijkstra(graph).dijkstra(0, i_target)[0]
+            self.assertEqual(bucket.dijkstra(0, i_target)[0], expected)
+        set_arc_weights(graph, [(0, i_head, weight + 0.5)])
+        with self.assertRaises(ValueError):
+            bucket.dijkstra(0, 100)
@@ -0,0 +1,116 @@
+"""
+This module contains the unit tests for the ContractionHierarchy class.
+"""
+import os
+import random
+import tempfile
+from unittest import TestCase
+
+from dijkstra.core import Dijkstra
+from dijkstra.helpers import track_path
+from dijkstra.hierarchy import ContractionHierarchy
+from dijkstra.reader import CompactGraphReader
+
+
+class TestContractionHierarchy(TestCase):
+    """
+    This class is the TestCase for the ContractionHierarchy class.
+    """
+    test_graphs = {
+        "test10": CompactGraphReader("./graphs/test10.gra").read(),
+        "deutschland2": CompactGraphReader("./graphs/deutschland2.gra").read(),
+    }
+    hierarchies = {name: ContractionHierarchy.build(graph) for name, graph in test_graphs.items()}
+
+    def test_query_test10_node_f_node_c(self):
+        """
+        Test query() for test10.gra for node F to node C.
+        """
+        dist, path = self.hierarchies["test10"].query(5, 2)
+        self.assertEqual(round(dist, 2), 5.89)
+        self.assertEqual(path, [5, 8, 3, 2])
+
+    def test_query_test10_node_a_node_f(self):
+        """
+        Test query() for test10.gra for node A to node F.
+        """
+        dist, path = self.hierarchies["test10"].query(0, 5)
+        self.assertEqual(dist, float("inf"))
+        self.assertIsNone(path)
+
+    def test_query_test10_node_a_node_a(self):
+        """
+        Test query() for test10.gra for node A to node A.
+        """
+        dist, path = self.hierarchies["test10"].query(0, 0)
+        self.assertEqual(dist, 0)
+        self.assertEqual(path, [0])
+
+    def test_query_test10_all_pairs(self):
+        """
+        Test that query() returns the distances of dijkstra() for all pairs of test10.gra and the
+        same path wherever it has no equally short alternative.
+        """
+        graph = self.test_graphs["test10"]
+        dijkstra = Dijkstra(graph)
+        for i_source in range(graph.node_count):
+            for i_target in range(graph.node_count):
+                dist, pred = dijkstra.dijkstra(i_source, i_target)
+                dist_ch, path = self.hierarchies["test10"].query(i_source, i_target)
+                self.assertAlmostEqual(dist_ch, dist)
+                if (i_source, i_target) not in [(2, 6), (4, 6)]:
+                    self.assertEqual(path, track_path(pred, i_source, i_target))
+
+    def test_query_deutschland2(self):
+        """
+        Test that query() finds the distances of dijkstra() on random queries of deutschland2.gra
+        and that the unpacked paths have this length.
+        """
+        graph = self.test_graphs["deutschland2"]
+        dijkstra = Dijkstra(graph)
+        hierarchy = self.hierarchies["deutschland2"]
+        rng = random.Random(0)
+        for _ in range(50):
+            source_idx = rng.randrange(graph.node_count)
+            target_idx = rng.randrange(graph.node_count)
+            dist, _ = dijkstra.dijkstra(source_idx, target_idx)
+            dist_ch, path, iterations = hierarchy.query(source_idx, target_idx, count=True)
+            self.assertEqual(dist_ch, dist)
+            self.assertEqual(hierarchy.distance(source_idx, target_idx), dist)
+            self.assertEqual((path[0], path[-1]), (source_idx, target_idx))
+            length = sum(
+                min(weight for i_head, weight in graph.forward(i_node) if i_head == i_next)
+                for i_node, i_next in zip(path, path[1:])
+            )
+            self.assertEqual(length, dist)
+            self.assertLess(iterations, graph.node_count / 4)
+
+    def test_save_load(self):
+        """
+        Test that a saved hierarchy is read back and rejected for another graph.
+        """
+        hierarchy = self.hierarchies["deutschland2"]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "deutschland2.gra.ch")
+            hierarchy.save(path)
+            loaded = ContractionHierarchy.load(path, self.test_graphs["deutschland2"])
+            self.assertEqual(loaded.rank, hierarchy.rank)
+            self.assertEqual(loaded.up_middles, hierarchy.up_middles)
+            self.assertEqual(loaded.down_weights, hierarchy.down_weights)
+            self.assertEqual(loaded.query(3, 600), hierarchy.query(3, 600))
+            with self.assertRaises(ValueError):
+                ContractionHierarchy.load(path, self.test_graphs["test10"])
+
+    def test_load_truncated(self):
+        """
+        Test that truncated contraction hierarchy files are rejected with a ValueError.
+        """
+        hierarchy = self.hierarchies["deutschland2"]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "deutschland2.gra.ch")
+            hierarchy.save(path)
+            for length in (os.path.getsize(path) - 8, 10):
+                with open(path, "r+b") as file:
+                    file.truncate(length)
+                with self.assertRaises(ValueError):
+                    ContractionHierarchy.load(path, self.test_graphs["deutschland2"])
@@ -0,0 +1,70 @@
+"""
+This module contains the unit tests for the instrumentation of the search loops.
+"""
+from unittest import TestCase
+
+from dijkstra.core import Dijkstra
+from dijkstra.instrumentation import SearchProfile
+from dijkstra.reader import CompactGraphReader
+
+
+class TestSearchProfile(TestCase):
+    """
+    This class is the TestCase for searches with a SearchProfile.
+    """
+    test_graphs = {
+        "test10": CompactGraphReader("./graphs/test10.gra").read(),
+        "deutschland2": CompactGraphReader("./graphs/deutschland2.gra").read(),
+    }
+
+    def test_same_results_deutschland2(self):
+        """
+        Test that profiled searches give the results and iteration counts of unprofiled ones on
+        all queues for deutschland2.gra.
+        """
+        for queue in ("binary", "dary", "radix"):
+            dijkstra = Dijkstra(self.test_graphs["deutschland2"], queue=queue)
+            for i_source, i_target in ((3, 500), (100, 7), (42, 42)):
+                back_dist = dijkstra.dijkstra_dist(i_target, count=True)
+                self.assertEqual(
+                    dijkstra.dijkstra_dist(i_target, count=True, profile=SearchProfile()), back_dist
+                )
+                for dist in (None, back_dist[0]):
+                    self.assertEqual(
+                        dijkstra.dijkstra(
+                            i_source, i_target, dist, count=True, profile=SearchProfile()
+                        ),
+                        dijkstra.dijkstra(i_source, i_target, dist, count=True)
+                    )
+
+    def test_counters_deutschland2(self):
+        """
+        Test the relations of the counters of a full backward search on deutschland2.gra.
+        """
+        graph = self.test_graphs["deutschland2"]
+        profile = SearchProfile()
+        distances, stats = Dijkstra(graph).dijkstra_dist(0, count=True, profile=profile)
+        self.assertEqual(profile.pushes, profile.improved + 1)
+        self.assertEqual(profile.pops, profile.pushes)
+        self.assertEqual(profile.pops - profile.stale, stats["settled"])
+        self.assertEqual(profile.relaxations, stats["relaxations"])
+        self.assertEqual(stats["settled"], sum(dist < float("inf") for dist in distances))
+        self.assertGreater(profile.max_heap, 0)
+        self.assertEqual(set(profile.as_dict()) >= {"pushes", "init_time", "search_time"}, True)
+
+    def test_hook_and_accumulation_test10(self):
+        """
+        Test that the hook sees every push, including those of the seeds, and every pop and that
+        counters add up over searches on test10.gra.
+        """
+        events = []
+        profile = SearchProfile(hook=lambda event, i_node, dist: events.append(event))
+        dijkstra = Dijkstra(self.test_graphs["test10"])
+        dijkstra.dijkstra(0, 9, profile=profile)
+        self.assertEqual(events.count("pop"), profile.pops)
+        self.assertEqual(events.count("push"), profile.pushes)
+        self.assertEqual(profile.pushes, profile.improved + 1)
+        self.assertEqual(events.count("stale"), profile.stale)
+        pops = profile.pops
+        dijkstra.dijkstra(0, 9, profile=profile)
+        self.assertEqual(profile.pops, 2 * pops)
@@ -0,0 +1,129 @@
+"""
+This module contains the unit tests for the HubLabels class.
+"""
+import os
+import random
+import tempfile
+from unittest import TestCase
+
+from dijkstra.core import Dijkstra
+from dijkstra.labels import HubLabels, degree_order
+from dijkstra.reader import CompactGraphReader
+
+
+class TestHubLabels(TestCase):
+    """
+    This class is the TestCase for the HubLabels class.
+    """
+    test_graphs = {
+        "test10": CompactGraphReader("./graphs/test10.gra").read(),
+        "deutschland2": CompactGraphReader("./graphs/deutschland2.gra").read(),
+    }
+    labels = {name: HubLabels.build(graph) for name, graph in test_graphs.items()}
+
+    def path_length(self, graph, path: list[int]) -> float:
+        """
+        This method returns the length of a path using the shortest of parallel arcs.
+        """
+        return sum(
+            min(weight for i_head, weight in graph.forward(i_node) if i_head == i_next)
+            for i_node, i_next in zip(path, path[1:])
+        )
+
+    def test_query_test10_node_f_node_c(self):
+        """
+        Test query() for test10.gra for node F to node C.
+        """
+        dist, path = self.labels["test10"].query(5, 2)
+        self.assertEqual(round(dist, 2), 5.89)
+        self.assertEqual(path, [5, 8, 3, 2])
+
+    def test_query_test10_node_a_node_f(self):
+        """
+        Test query() for test10.gra for node A to node F.
+        """
+        dist, path = self.labels["test10"].query(0, 5)
+        self.assertEqual(dist, float("inf"))
+        self.assertIsNone(path)
+
+    def test_query_test10_node_a_node_a(self):
+        """
+        Test query() for test10.gra for node A to node A.
+        """
+        dist, path = self.labels["test10"].query(0, 0)
+        self.assertEqual(dist, 0)
+        self.assertEqual(path, [0])
+
+    def test_distance_test10_all_pairs(self):
+        """
+        Test that distance() returns the distances of dijkstra() for all pairs of test10.gra, also
+        for labels built in the order of the node degrees.
+        """
+        graph = self.test_graphs["test10"]
+        dijkstra = Dijkstra(graph)
+        by_degree = HubLabels.build(graph, degree_order(graph))
+        for i_source in range(graph.node_count):
+            for i_target in range(graph.node_count):
+                dist, _ = dijkstra.dijkstra(i_source, i_target)
+                self.assertAlmostEqual(self.labels["test10"].distance(i_source, i_target), dist)
+                self.assertAlmostEqual(by_degree.distance(i_source, i_target), dist)
+
+    def test_query_deutschland2(self):
+        """
+        Test that query() finds the distances of dijkstra() on random queries of deutschland2.gra
+        and that the paths have this length.
+        """
+        graph = self.test_graphs["deutschland2"]
+        dijkstra = Dijkstra(graph)
+        labels = self.labels["deutschland2"]
+        rng = random.Random(0)
+        for _ in range(100):
+            source_idx = rng.randrange(graph.node_count)
+            target_idx = rng.randrange(graph.node_count)
+            dist, _ = dijkstra.dijkstra(source_idx, target_idx)
+            dist_hl, path, entries = labels.query(source_idx, target_idx, count=True)
+            self.assertEqual(dist_hl, dist)
+            self.assertEqual((path[0], path[-1]), (source_idx, target_idx))
+            self.assertAlmostEqual(self.path_length(graph, path), dist)
+            self.assertLess(entries, graph.node_count / 4)
+
+    def test_stats(self):
+        """
+        Test the label statistics of deutschland2.gra.
+        """
+        labels = self.labels["deutschland2"]
+        stats = labels.stats()
+        self.assertEqual(stats["entries"], len(labels.out_hubs) + len(labels.in_hubs))
+        self.assertLessEqual(stats["mean_label"], stats["max_label"])
+        self.assertGreater(stats["bytes"], 0)
+        self.assertGreater(stats["build_time"], 0)
+
+    def test_save_load(self):
+        """
+        Test that saved labels are read back and rejected for another graph.
+        """
+        labels = self.labels["deutschland2"]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "deutschland2.gra.hl")
+            labels.save(path)
+            loaded = HubLabels.load(path, self.test_graphs["deutschland2"])
+            self.assertEqual(loaded.order, labels.order)
+            self.assertEqual(loaded.out_dists, labels.out_dists)
+            self.assertEqual(loaded.in_next, labels.in_next)
+            self.assertEqual(loaded.query(3, 600), labels.query(3, 600))
+            with self.assertRaises(ValueError):
+                HubLabels.load(path, self.test_graphs["test10"])
+
+    def test_load_truncated(self):
+        """
+        Test that truncated hub label files are rejected with a ValueError.
+        """
+        labels = self.labels["deutschland2"]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "deutschland2.gra.hl")
+            labels.save(path)
+            for length in (os.path.getsize(path) - 8, 10):
+                with open(path, "r+b") as file:
+                    file.truncate(length)
+                with self.assertRaises(ValueError):
+                    HubLabels.load(path, self.test_graphs["deutschland2"])
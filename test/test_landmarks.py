@@ -0,0 +1,104 @@
+"""
+This module contains the unit tests for the Landmarks class.
+"""
+import os
+import random
+import tempfile
+from unittest import TestCase
+
+from dijkstra.core import Dijkstra
+from dijkstra.landmarks import Landmarks
+from dijkstra.reader import CompactGraphReader
+
+
+class TestLandmarks(TestCase):
+    """
+    This class is the TestCase for the Landmarks class.
+    """
+    test_graphs = {
+        "test10": CompactGraphReader("./graphs/test10.gra").read(),
+        "deutschland1": CompactGraphReader("./graphs/deutschland1.gra").read(),
+        "deutschland2": CompactGraphReader("./graphs/deutschland2.gra").read(),
+    }
+
+    def assert_lower_bounds(self, graph, landmarks):
+        """
+        This method checks the bounds of landmarks against the exact backward distances.
+        """
+        dijkstra = Dijkstra(graph)
+        for i_target in range(0, graph.node_count, max(1, graph.node_count // 10)):
+            back_dist = dijkstra.dijkstra_dist(i_target)
+            estimate = landmarks.bind(i_target)
+            for i_node in range(graph.node_count):
+                self.assertLessEqual(estimate(i_node), back_dist[i_node] + 1e-9)
+
+    def test_lower_bounds(self):
+        """
+        Test that all strategies give lower bounds on test10.gra and deutschland1.gra.
+        """
+        for name in ["test10", "deutschland1"]:
+            for strategy in ["farthest", "avoid", "planar"]:
+                graph = self.test_graphs[name]
+                landmarks = Landmarks.select(graph, 4, strategy)
+                self.assertEqual(len(set(landmarks.landmarks)), len(landmarks.landmarks))
+                self.assertGreater(len(landmarks.landmarks), 0)
+                self.assert_lower_bounds(graph, landmarks)
+
+    def test_unknown_strategy(self):
+        """
+        Test that an unknown strategy raises a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            Landmarks.select(self.test_graphs["test10"], 2, "random")
+
+    def test_astar_deutschland2(self):
+        """
+        Test that astar() with landmarks finds the shortest distances with fewer iterations than
+        dijkstra() on random queries of deutschland2.gra.
+        """
+        graph = self.test_graphs["deutschland2"]
+        dijkstra = Dijkstra(graph)
+        landmarks = Landmarks.select(graph, 8)
+        rng = random.Random(0)
+        iter_dijkstra, iter_alt = 0, 0
+        for _ in range(20):
+            source_idx = rng.randrange(graph.node_count)
+            target_idx = rng.randrange(graph.node_count)
+            dist, _, iterations = dijkstra.dijkstra(source_idx, target_idx, count=True)
+            iter_dijkstra += iterations
+            dist_alt, _, iterations = dijkstra.astar(source_idx, target_idx, landmarks, True)
+            iter_alt += iterations
+            self.assertEqual(dist_alt, dist)
+        self.assertLess(iter_alt, iter_dijkstra / 2)
+
+    def test_save_load(self):
+        """
+        Test that saved landmarks are read back and rejected for another graph.
+        """
+        graph = self.test_graphs["deutschland1"]
+        landmarks = Landmarks.select(graph, 3, "avoid")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "deutschland1.gra.alt")
+            landmarks.save(path)
+            loaded = Landmarks.load(path, graph)
+            self.assertEqual(loaded.landmarks, landmarks.landmarks)
+            self.assertEqual(loaded.strategy, "avoid")
+            self.assertEqual(loaded.forward, landmarks.forward)
+            self.assertEqual(loaded.backward, landmarks.backward)
+            with self.assertRaises(ValueError):
+                Landmarks.load(path, self.test_graphs["deutschland2"])
+
+    def test_load_truncated(self):
+        """
+        Test that truncated landmark files are rejected with a ValueError.
+        """
+        graph = self.test_graphs["deutschland1"]
+        landmarks = Landmarks.select(graph, 3, "avoid")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "deutschland1.gra.alt")
+            landmarks.save(path)
+            for length in (os.path.getsize(path) - 8, 10):
+                with open(path, "r+b") as file:
+                    file.truncate(length)
+                with self.assertRaises(ValueError):
+                    Landmarks.load(path, graph)
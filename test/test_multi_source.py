@@ -0,0 +1,107 @@
+"""
+This module contains the unit tests for searches from several seed nodes.
+"""
+import random
+from unittest import TestCase
+
+from dijkstra.core import Dijkstra
+from dijkstra.helpers import track_path
+from dijkstra.reader import CompactGraphReader
+
+
+class TestMultiSource(TestCase):
+    """
+    This class is the TestCase for Dijkstra.multi_source() and the seed lists of dijkstra_dist()
+    and dijkstra().
+    """
+    test_graphs = {
+        "test10": CompactGraphReader("./graphs/test10.gra").read(),
+        "berlin": CompactGraphReader("./graphs/berlin.gra").read(),
+    }
+
+    def nearest(self, dijkstra: Dijkstra, seeds: list[int], seed_dist: list[float]) -> list:
+        """
+        This method returns the distances to the nearest seed from one search per seed.
+        """
+        vectors = [
+            [dist + start for dist in dijkstra.dijkstra_dist(i_seed)]
+            for i_seed, start in zip(seeds, seed_dist)
+        ]
+        return [min(column) for column in zip(*vectors)]
+
+    def test_multi_source_berlin(self):
+        """
+        Test that multi_source() gives the distances to the nearest depot, consistent owners and
+        predecessors for random depots with offsets on berlin.gra.
+        """
+        graph = self.test_graphs["berlin"]
+        dijkstra = Dijkstra(graph)
+        rng = random.Random(0)
+        seeds = [rng.randrange(graph.node_count) for _ in range(5)]
+        seed_dist = [rng.randrange(0, 1000) for _ in seeds]
+        expected = self.nearest(dijkstra, seeds, seed_dist)
+        distances, owners, successors = dijkstra.multi_source(seeds, seed_dist, backward=True)
+        self.assertEqual(distances, expected)
+        self.assertEqual(dijkstra.dijkstra_dist(seeds, seed_dist=seed_dist), expected)
+        own = {i_seed: dijkstra.dijkstra_dist(i_seed) for i_seed in seeds}
+        for i_node in range(graph.node_count):
+            owner = owners[i_node]
+            if owner < 0:
+                self.assertEqual(distances[i_node], float("inf"))
+                continue
+            start = seed_dist[seeds.index(owner)]
+            self.assertEqual(distances[i_node], own[owner][i_node] + start)
+            self.assertEqual(track_path(successors, owner, i_node)[0], owner)
+
+    def test_dijkstra_seeds_test10(self):
+        """
+        Test that dijkstra() from a list of sources finds the path from the nearest source for all
+        targets of test10.gra.
+        """
+        graph = self.test_graphs["test10"]
+        dijkstra = Dijkstra(graph)
+        sources = [0, 3]
+        for i_target in range(graph.node_count):
+            expected = min(dijkstra.dijkstra(i_source, i_target)[0] for i_source in sources)
+            dist, pred = dijkstra.dijkstra(sources, i_target)
+            self.assertEqual(dist, expected)
+            _, owners, _ = dijkstra.multi_source(sources)
+            if dist < float("inf"):
+                path = track_path(pred, owners[i_target], i_target)
+                self.assertIn(path[0], sources)
+                self.assertEqual(path[-1], i_target)
+
+    def test_track_path_other_seed_berlin(self):
+        """
+        Test that track_path() with the predecessors of dijkstra() from several sources of
+        berlin.gra ends at the source the target was reached from, also if another source is given.
+        """
+        graph = self.test_graphs["berlin"]
+        dijkstra = Dijkstra(graph)
+        rng = random.Random(1)
+        sources = [rng.randrange(graph.node_count) for _ in range(3)]
+        _, owners, _ = dijkstra.multi_source(sources)
+        targets = [
+            i_node for i_node in range(graph.node_count)
+            if owners[i_node] >= 0 and owners[i_node] != sources[0]
+        ]
+        self.assertTrue(targets)
+        for i_target in rng.sample(targets, 20):
+            dist, pred = dijkstra.dijkstra(sources, i_target)
+            path = track_path(pred, sources[0], i_target)
+            self.assertEqual((path[0], path[-1]), (owners[i_target], i_target))
+            self.assertEqual(
+                dist, sum(
+                    min(weight for i_head, weight in graph.forward(i_tail) if i_head == i_next)
+                    for i_tail, i_next in zip(path, path[1:])
+                )
+            )
+
+    def test_single_seed_berlin(self):
+        """
+        Test that multi_source() from one seed gives the distances of dijkstra_dist() on berlin.gra.
+        """
+        dijkstra = Dijkstra(self.test_graphs["berlin"])
+        distances, owners, _ = dijkstra.multi_source([7], backward=True)
+        self.assertEqual(distances, dijkstra.dijkstra_dist(7))
+        self.assertEqual(set(owners) - {-1}, {7})
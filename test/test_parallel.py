@@ -0,0 +1,84 @@
+"""
+This module contains the unit tests for the ParallelExecutor class.
+"""
+import os
+import random
+import shutil
+import tempfile
+from unittest import TestCase
+
+from dijkstra.core import Dijkstra
+from dijkstra.helpers import track_path
+from dijkstra.parallel import ParallelExecutor
+from dijkstra.reader import CompactGraphReader
+
+
+class TestParallelExecutor(TestCase):
+    """
+    This class is the TestCase for the ParallelExecutor class.
+    """
+    graph = CompactGraphReader("./graphs/deutschland2.gra").read()
+
+    def queries(self) -> list[tuple]:
+        """
+        This method returns random queries of all types.
+        """
+        rng = random.Random(0)
+        queries = []
+        for _ in range(10):
+            i_source = rng.randrange(self.graph.node_count)
+            i_target = rng.randrange(self.graph.node_count)
+            queries.append(("dijkstra", i_source, i_target, None, True))
+            queries.append(("dijkstra_dist", i_target))
+            queries.append(("path", i_source, i_target))
+        return queries
+
+    def expected(self, queries: list[tuple]) -> list:
+        """
+        This method runs the queries one after another.
+        """
+        dijkstra = Dijkstra(self.graph)
+        results = []
+        for query in queries:
+            if query[0] == "dijkstra":
+                results.append(dijkstra.dijkstra(*query[1:]))
+            elif query[0] == "dijkstra_dist":
+                results.append(dijkstra.dijkstra_dist(*query[1:]))
+            else:
+                dist, pred = dijkstra.dijkstra(*query[1:])
+                results.append((dist, track_path(pred, *query[1:])))
+        return results
+
+    def test_map_forked_graph(self):
+        """
+        Test that a graph shared by forking gives the serial results in query order.
+        """
+        queries = self.queries()
+        with ParallelExecutor(self.graph, workers=2) as executor:
+            self.assertEqual(executor.map(queries, chunk_size=4), self.expected(queries))
+            self.assertEqual(
+                sum(worker["queries"] for worker in executor.stats.values()), len(queries)
+            )
+            self.assertTrue(all(value > 0 for value in executor.throughput().values()))
+
+    def test_map_cached_graph(self):
+        """
+        Test that workers memory-mapping the graph cache give the serial results.
+        """
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, "deutschland2.gra")
+            shutil.copy("./graphs/deutschland2.gra", path)
+            queries = self.queries()
+            with ParallelExecutor(path, workers=2) as executor:
+                self.assertEqual(executor.map(queries), self.expected(queries))
+        finally:
+            shutil.rmtree(directory)
+
+    def test_unknown_query(self):
+        """
+        Test that an unknown query type raises a ValueError.
+        """
+        with ParallelExecutor(self.graph, workers=1) as executor:
+            with self.assertRaises(ValueError):
+                executor.map([("astar", 0, 1)])
@@ -0,0 +1,93 @@
+"""
+This module contains the unit tests for the cache of backward distance potentials.
+"""
+import os
+import tempfile
+from unittest import TestCase
+
+from dijkstra.core import Dijkstra
+from dijkstra.potentials import PotentialCache
+from dijkstra.reader import CompactGraphReader
+
+
+class TestPotentialCache(TestCase):
+    """
+    This class is the TestCase for the PotentialCache class.
+    """
+    test_graphs = {
+        "test10": CompactGraphReader("./graphs/test10.gra").read(),
+        "deutschland2": CompactGraphReader("./graphs/deutschland2.gra").read(),
+    }
+
+    def test_hits_and_misses_test10(self):
+        """
+        Test that repeated targets of test10.gra are served from memory with the distances of
+        dijkstra_dist().
+        """
+        dijkstra = Dijkstra(self.test_graphs["test10"])
+        cache = PotentialCache()
+        for i_target in (0, 1, 0, 0, 1):
+            self.assertEqual(list(cache.get(dijkstra, i_target)), dijkstra.dijkstra_dist(i_target))
+        self.assertEqual((cache.hits, cache.misses), (3, 2))
+        self.assertEqual(cache.stats()["bytes"], 2 * 10 * 8)
+
+    def test_lru_eviction_deutschland2(self):
+        """
+        Test that the least recently used vector is evicted when the byte limit is exceeded.
+        """
+        graph = self.test_graphs["deutschland2"]
+        dijkstra = Dijkstra(graph)
+        cache = PotentialCache(max_bytes=2 * graph.node_count * 8)
+        cache.get(dijkstra, 0)
+        cache.get(dijkstra, 1)
+        cache.get(dijkstra, 0)
+        cache.get(dijkstra, 2)
+        self.assertEqual([key[1] for key in cache.entries], [0, 2])
+        self.assertEqual(cache.evictions, 1)
+        self.assertLessEqual(cache.nbytes, cache.max_bytes)
+
+    def test_oversized_vector_deutschland2(self):
+        """
+        Test that a vector larger than the byte limit is spilled without evicting the vectors in
+        memory.
+        """
+        graph = self.test_graphs["deutschland2"]
+        dijkstra = Dijkstra(graph)
+        with tempfile.TemporaryDirectory() as directory:
+            cache = PotentialCache(max_bytes=2 * graph.node_count * 8, spill_dir=directory)
+            cache.get(dijkstra, 0)
+            cache.get(dijkstra, 1)
+            vector = cache.entries[cache.key(graph, 0)]
+            cache.put(cache.key(graph, 2), vector * 3)
+            self.assertEqual([key[1] for key in cache.entries], [0, 1])
+            self.assertEqual((cache.evictions, cache.nbytes), (0, 2 * graph.node_count * 8))
+            self.assertEqual(len(os.listdir(directory)), 1)
+
+    def test_spill_to_disk_deutschland2(self):
+        """
+        Test that evicted vectors are written to the spill directory and read back on a miss.
+        """
+        graph = self.test_graphs["deutschland2"]
+        dijkstra = Dijkstra(graph)
+        with tempfile.TemporaryDirectory() as directory:
+            cache = PotentialCache(max_bytes=graph.node_count * 8, spill_dir=directory)
+            first = cache.get(dijkstra, 5)
+            cache.get(dijkstra, 6)
+            self.assertEqual(len(os.listdir(directory)), 1)
+            self.assertEqual(cache.get(dijkstra, 5), first)
+            self.assertEqual(cache.disk_hits, 1)
+            # a second cache finds the spilled vectors of the first one
+            other = PotentialCache(spill_dir=directory)
+            self.assertEqual(other.get(dijkstra, 5), first)
+            self.assertEqual(other.disk_hits, 1)
+
+    def test_potential_for_modified_weights_deutschland2(self):
+        """
+        Test that dijkstra() with a cached potential gives the result of an uncached one.
+        """
+        dijkstra = Dijkstra(self.test_graphs["deutschland2"])
+        cache = PotentialCache()
+        expected = dijkstra.dijkstra(3, 500, dijkstra.dijkstra_dist(500), count=True)
+        result = dijkstra.dijkstra(3, 500, cache.get(dijkstra, 500), count=True)
+        self.assertEqual(result[0], expected[0])
+        self.assertEqual(result[2], expected[2])
@@ -0,0 +1,144 @@
+"""
+This module contains the unit tests for the priority queues of the Dijkstra class.
+"""
+import random
+from unittest import TestCase
+
+from dijkstra.core import Dijkstra
+from dijkstra.instrumentation import SearchProfile
+from dijkstra.queues import QUEUES, BucketQueue, DaryHeap, make_queue
+from dijkstra.reader import CompactGraphReader
+
+
+class TestQueues(TestCase):
+    """
+    This class is the TestCase for the queues module and its use by the Dijkstra class.
+    """
+    test_graphs = {
+        "test10": CompactGraphReader("./graphs/test10.gra").read(),
+        "deutschland2": CompactGraphReader("./graphs/deutschland2.gra").read(),
+        "berlin": CompactGraphReader("./graphs/berlin.gra").read(),
+    }
+
+    def test_monotone_pops(self):
+        """
+        Test that all queues pop pairs in the order of their keys if pushed keys never fall below
+        the last popped key.
+        """
+        for name in QUEUES:
+            rng = random.Random(0)
+            queue = make_queue(name, 100, 10)
+            popped = []
+            last = 0
+            for i_item in range(100):
+                queue.push(last + rng.randrange(10), i_item)
+                if rng.random() < 0.3:
+                    last = queue.pop()[0]
+                    popped.append(last)
+            while queue:
+                popped.append(queue.pop()[0])
+            self.assertEqual(popped, sorted(popped), name)
+            self.assertEqual(len(popped), 100, name)
+
+    def test_bucket_queue_start(self):
+        """
+        Test that the ring of the bucket queue starts at the first pushed key and moves down for a
+        smaller key pushed before the first pop.
+        """
+        queue = BucketQueue(10)
+        queue.push(10 ** 6, 0)
+        self.assertEqual((queue.current, len(queue.buckets)), (10 ** 6, 11))
+        queue.push(10 ** 6 - 3, 1)
+        queue.push(10 ** 6 + 25, 2)
+        self.assertEqual(queue.current, 10 ** 6 - 3)
+        self.assertEqual(
+            [queue.pop(), queue.pop(), queue.pop()],
+            [(10 ** 6 - 3, 1), (10 ** 6, 0), (10 ** 6 + 25, 2)]
+        )
+
+    def test_dary_decrease_key(self):
+        """
+        Test that pushing an item of the d-ary heap again only decreases its key.
+        """
+        heap = DaryHeap(3)
+        heap.push(5, 0)
+        heap.push(3, 1)
+        heap.push(4, 2)
+        heap.push(1, 0)
+        heap.push(9, 2)
+        self.assertEqual(len(heap), 3)
+        self.assertEqual([heap.pop(), heap.pop(), heap.pop()], [(1, 0), (3, 1), (4, 2)])
+
+    def test_integer_queue_test10(self):
+        """
+        Test that the bucket queue and the radix heap are refused for test10.gra, whose edge weights
+        are not all integers.
+        """
+        for name in ("bucket", "radix"):
+            with self.assertRaises(ValueError):
+                Dijkstra(self.test_graphs["test10"], queue=name)
+        with self.assertRaises(ValueError):
+            Dijkstra(self.test_graphs["test10"], queue="fibonacci")
+
+    def test_queues_random_queries(self):
+        """
+        Test that all queues give the distances of the binary heap for random queries on
+        deutschland2.gra and berlin.gra, with unmodified and modified weights.
+        """
+        for graph_name in ("deutschland2", "berlin"):
+            graph = self.test_graphs[graph_name]
+            reference = Dijkstra(graph)
+            rng = random.Random(0)
+            queries = [
+                (rng.randrange(graph.node_count), rng.randrange(graph.node_count))
+                for _ in range(5)
+            ]
+            for name in QUEUES:
+                dijkstra = Dijkstra(graph, queue=name)
+                for i_source, i_target in queries:
+                    back_dist = reference.dijkstra_dist(i_target)
+                    self.assertEqual(dijkstra.dijkstra_dist(i_target), back_dist)
+                    self.assertEqual(
+                        dijkstra.dijkstra(i_source, i_target)[0],
+                        reference.dijkstra(i_source, i_target)[0]
+                    )
+                    self.assertEqual(
+                        dijkstra.dijkstra(i_source, i_target, back_dist)[0],
+                        reference.dijkstra(i_source, i_target, back_dist)[0]
+                    )
+
+    def test_queues_unreachable_modified(self):
+        """
+        Test that all queues return inf for a source of berlin.gra that cannot reach the target
+        with modified weights, whose start key is infinite, also with a search profile.
+        """
+        graph = self.test_graphs["berlin"]
+        reference = Dijkstra(graph)
+        i_target = 0
+        back_dist = reference.dijkstra_dist(i_target)
+        i_source = back_dist.index(float("inf"))
+        for name in QUEUES:
+            dijkstra = Dijkstra(graph, queue=name)
+            self.assertEqual(dijkstra.dijkstra(i_source, i_target, back_dist)[0], float("inf"))
+            self.assertEqual(
+                dijkstra.dijkstra(i_source, i_target, back_dist, profile=SearchProfile())[0],
+                float("inf")
+            )
+
+    def test_integer_queue_seed_dist_deutschland2(self):
+        """
+        Test that the bucket queue and the radix heap refuse seed distances that are not integers
+        and give the distances of the binary heap for integer ones.
+        """
+        graph = self.test_graphs["deutschland2"]
+        reference = Dijkstra(graph)
+        for name in ("bucket", "radix"):
+            dijkstra = Dijkstra(graph, queue=name)
+            with self.assertRaises(ValueError):
+                dijkstra.dijkstra_dist([0, 300], seed_dist=[0.5, 10.25])
+            with self.assertRaises(ValueError):
+                dijkstra.dijkstra([0, 300], 100, seed_dist=[0.5, 10.25])
+            self.assertEqual(
+                dijkstra.dijkstra_dist([0, 300], seed_dist=[1, 10]),
+                reference.dijkstra_dist([0, 300], seed_dist=[1, 10])
+            )
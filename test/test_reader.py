@@ -0,0 +1,115 @@
+"""
+This module contains the unit tests for the CompactGraphReader class.
+"""
+from unittest import TestCase
+
+from dijkstra.core import Dijkstra
+from dijkstra.helpers import track_path
+from dijkstra.reader import CompactGraphReader
+
+
+class TestCompactGraphReader(TestCase):
+    """
+    This class is the TestCase for the CompactGraphReader class.
+    """
+    test_graphs = {
+        "test10": CompactGraphReader("./graphs/test10.gra").read(),
+        "deutschland1": CompactGraphReader("./graphs/deutschland1.gra").read(),
+        "deutschland2": CompactGraphReader("./graphs/deutschland2.gra").read(),
+        "berlin": CompactGraphReader("./graphs/berlin.gra").read(),
+    }
+
+    def test_setup_test10(self):
+        """
+        Test reading test10.gra (directed).
+        """
+        graph = self.test_graphs["test10"]
+        self.assertEqual(graph.node_count, 10)
+        self.assertEqual(graph.edge_count, 32)
+        self.assertEqual(graph.arc_count, 32)
+        self.assertEqual(graph.names[:3], ["A", "B", "C"])
+        self.assertEqual(graph.node_index("J"), 9)
+        self.assertEqual((graph.coords[0][5], graph.coords[1][5]), (0, 4))
+        self.assertEqual(list(graph.forward(5)), [(1, 3), (7, 2), (6, 1.41), (8, 2.24)])
+
+    def test_setup_deutschland1(self):
+        """
+        Test reading deutschland1.gra (undirected).
+        """
+        graph = self.test_graphs["deutschland1"]
+        self.assertEqual(graph.node_count, 185)
+        self.assertEqual(graph.edge_count, 354)
+        self.assertEqual(graph.arc_count, 708)
+
+    def test_setup_deutschland2(self):
+        """
+        Test reading deutschland2.gra (undirected).
+        """
+        graph = self.test_graphs["deutschland2"]
+        self.assertEqual(graph.node_count, 676)
+        self.assertEqual(graph.edge_count, 1107)
+        self.assertEqual(graph.arc_count, 2214)
+        self.assertEqual(graph.node_index("711000"), graph.names.index("711000"))
+
+    def test_setup_berlin(self):
+        """
+        Test reading berlin.gra (directed, additional edge columns).
+        """
+        graph = self.test_graphs["berlin"]
+        self.assertEqual(graph.node_count, 9844)
+        self.assertEqual(graph.edge_count, 14362)
+        self.assertEqual(graph.names[:3], ["1", "10", "100"])
+
+    def test_unknown_node(self):
+        """
+        Test that an unknown node name raises a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            self.test_graphs["test10"].node_index("Z")
+
+    def test_small_chunks(self):
+        """
+        Test that the chunk size does not change the result.
+        """
+        graph = CompactGraphReader("./graphs/deutschland1.gra", chunk_size=7).read()
+        reference = self.test_graphs["deutschland1"]
+        self.assertEqual(graph.names, reference.names)
+        self.assertEqual(graph.f_targets, reference.f_targets)
+        self.assertEqual(graph.b_weights, reference.b_weights)
+
+    def test_load_stats(self):
+        """
+        Test that load time and peak memory are reported.
+        """
+        reader = CompactGraphReader("./graphs/test10.gra", trace_memory=True)
+        reader.read()
+        self.assertGreater(reader.load_time, 0)
+        self.assertGreater(reader.peak_memory, 0)
+
+    def test_dijkstra_dist_test10_node_a(self):
+        """
+        Test dijkstra_dist() on the read test10.gra for node A.
+        """
+        dijkstra = Dijkstra(self.test_graphs["test10"])
+        dist_a = dijkstra.dijkstra_dist(0)
+        self.assertEqual(
+            [round(element, 2) for element in dist_a],
+            [0, 3.65, 4.24, 2.24, 2.24, 2.41, 1, 1, 1.41, 3.24]
+        )
+
+    def test_dijkstra_deutschland2(self):
+        """
+        Test dijkstra() on the read deutschland2.gra for Stuttgart to Berlin, with and without
+        backward distances.
+        """
+        graph = self.test_graphs["deutschland2"]
+        dijkstra = Dijkstra(graph)
+        source_idx = graph.node_index("711000")
+        target_idx = graph.node_index("300000")
+        dist, pred, iterations = dijkstra.dijkstra(source_idx, target_idx, count=True)
+        self.assertEqual(dist, 789)
+        self.assertEqual(iterations, 649)
+        self.assertEqual(track_path(pred, source_idx, target_idx)[0], source_idx)
+        back_dist = dijkstra.dijkstra_dist(target_idx)
+        _, _, iterations = dijkstra.dijkstra(source_idx, target_idx, back_dist, True)
+        self.assertEqual(iterations, 14)
@@ -0,0 +1,92 @@
+"""
+This module contains the unit tests for the node orders and the renumbering of graphs.
+"""
+import random
+from unittest import TestCase
+
+from dijkstra.core import Dijkstra
+from dijkstra.reader import CompactGraphReader
+from dijkstra.reorder import (
+    ORDERS, hilbert_index, inverse, node_order, reorder, zorder_index
+)
+
+
+class TestReorder(TestCase):
+    """
+    This class is the TestCase for the node orders and the reorder function.
+    """
+    test_graphs = {
+        "test10": CompactGraphReader("./graphs/test10.gra").read(),
+        "deutschland2": CompactGraphReader("./graphs/deutschland2.gra").read(),
+    }
+
+    def test_curves(self):
+        """
+        Test that both curves visit every cell of a 8 x 8 grid once and that consecutive cells of
+        the Hilbert curve are adjacent.
+        """
+        cells = {hilbert_index(x, y, 3): (x, y) for x in range(8) for y in range(8)}
+        self.assertEqual(sorted(cells), list(range(64)))
+        for index in range(63):
+            (x_1, y_1), (x_2, y_2) = cells[index], cells[index + 1]
+            self.assertEqual(abs(x_1 - x_2) + abs(y_1 - y_2), 1)
+        self.assertEqual(
+            sorted(zorder_index(x, y, 3) for x in range(8) for y in range(8)), list(range(64))
+        )
+        self.assertEqual(zorder_index(1, 0, 3), 1)
+        self.assertEqual(zorder_index(0, 1, 3), 2)
+
+    def test_orders_are_permutations(self):
+        """
+        Test that every order of deutschland2.gra contains every node index once.
+        """
+        graph = self.test_graphs["deutschland2"]
+        for method in ORDERS:
+            self.assertEqual(sorted(node_order(graph, method)), list(range(graph.node_count)))
+        with self.assertRaises(ValueError):
+            node_order(graph, "random")
+
+    def test_reorder_keeps_names_and_distances(self):
+        """
+        Test that a reordered deutschland2.gra finds the nodes by name and gives the distances and
+        paths of the original graph under the mapping of the node indices.
+        """
+        graph = self.test_graphs["deutschland2"]
+        dijkstra = Dijkstra(graph, compact=True)
+        rng = random.Random(0)
+        for method in ORDERS:
+            order = node_order(graph, method)
+            reordered = reorder(graph, order)
+            rank = inverse(order)
+            self.assertEqual(reordered.arc_count, graph.arc_count)
+            reordered_dijkstra = Dijkstra(reordered, compact=True)
+            for _ in range(5):
+                i_source = rng.randrange(graph.node_count)
+                i_target = rng.randrange(graph.node_count)
+                name = graph.names[i_source]
+                self.assertEqual(reordered.node_index(name), rank[i_source])
+                self.assertEqual(
+                    reordered.coords[0][rank[i_source]], graph.coords[0][i_source]
+                )
+                dist, _ = dijkstra.dijkstra(i_source, i_target)
+                dist_reordered, _ = reordered_dijkstra.dijkstra(rank[i_source], rank[i_target])
+                self.assertEqual(dist_reordered, dist)
+                back_dist = dijkstra.dijkstra_dist(i_target)
+                back_reordered = reordered_dijkstra.dijkstra_dist(rank[i_target])
+                self.assertEqual(
+                    [back_reordered[rank[i_node]] for i_node in range(graph.node_count)], back_dist
+                )
+
+    def test_reorder_test10(self):
+        """
+        Test reorder() for test10.gra reversed and for an order that is no permutation.
+        """
+        graph = self.test_graphs["test10"]
+        reordered = reorder(graph, list(range(graph.node_count))[::-1])
+        self.assertEqual(reordered.names, graph.names[::-1])
+        self.assertEqual(
+            sorted(reordered.forward(graph.node_count - 1 - 5)),
+            sorted((graph.node_count - 1 - i_head, weight) for i_head, weight in graph.forward(5))
+        )
+        with self.assertRaises(ValueError):
+            reorder(graph, [0] * graph.node_count)
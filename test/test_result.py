@@ -0,0 +1,62 @@
+"""
+This module contains the unit tests for the SearchResult class.
+"""
+import random
+from unittest import TestCase
+
+from dijkstra.core import Dijkstra
+from dijkstra.helpers import track_path
+from dijkstra.reader import CompactGraphReader
+
+
+class TestSearchResult(TestCase):
+    """
+    This class is the TestCase for Dijkstra.search() and the SearchResult class.
+    """
+    test_graphs = {
+        "test10": CompactGraphReader("./graphs/test10.gra").read(),
+        "berlin": CompactGraphReader("./graphs/berlin.gra").read(),
+    }
+
+    def test_paths_test10_all_pairs(self):
+        """
+        Test that the paths of search() are those of track_path() for all pairs of test10.gra.
+        """
+        graph = self.test_graphs["test10"]
+        dijkstra = Dijkstra(graph)
+        for i_source in range(graph.node_count):
+            for i_target in range(graph.node_count):
+                dist, pred, counter = dijkstra.dijkstra(i_source, i_target, count=True)
+                result = dijkstra.search(i_source, i_target)
+                self.assertEqual(result.distance, dist)
+                self.assertEqual(result.iterations, counter)
+                self.assertEqual(result.path(), track_path(pred, i_source, i_target))
+                if result.reachable:
+                    self.assertEqual(
+                        list(result.iter_path(reverse=True)), result.path()[::-1]
+                    )
+                else:
+                    self.assertEqual(list(result.iter_path()), [])
+
+    def test_edges_berlin(self):
+        """
+        Test that the edge weights of random paths on berlin.gra add up to their distance and that
+        only reached nodes are stored, with and without workspace.
+        """
+        graph = self.test_graphs["berlin"]
+        rng = random.Random(0)
+        for dijkstra in (Dijkstra(graph), Dijkstra(graph, workspace=True)):
+            for _ in range(5):
+                i_source = rng.randrange(graph.node_count)
+                i_target = rng.randrange(graph.node_count)
+                result = dijkstra.search(i_source, i_target)
+                pred = dijkstra.dijkstra(i_source, i_target)[1]
+                for i_node in (i_source, i_target, 0, graph.node_count - 1):
+                    self.assertEqual(result.predecessor(i_node), pred[i_node])
+                self.assertLess(len(result), graph.node_count)
+                self.assertEqual(result.nbytes(), 16 * len(result))
+                if not result.reachable:
+                    continue
+                edges = list(result.edges())
+                self.assertEqual(len(edges), len(result.path()) - 1)
+                self.assertAlmostEqual(sum(weight for _, _, weight in edges), result.distance)
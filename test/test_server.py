@@ -0,0 +1,126 @@
+"""
+This module contains the unit tests for the QueryServer class.
+"""
+import io
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+from unittest import TestCase
+
+from dijkstra.core import Dijkstra
+from dijkstra.reader import CompactGraphReader
+from dijkstra.server import QueryServer, percentile
+
+
+class TestQueryServer(TestCase):
+    """
+    This class is the TestCase for the QueryServer class.
+    """
+    graph = CompactGraphReader("./graphs/deutschland2.gra").read()
+
+    def request(self, i_source: int, i_target: int, **fields) -> dict:
+        """
+        This method returns a request for two node indices.
+        """
+        names = self.graph.names
+        return dict(source=names[i_source], target=names[i_target], **fields)
+
+    def test_percentile(self):
+        """
+        Test the nearest rank percentiles.
+        """
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 0.5), 50)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile([7], 0.99), 7)
+        self.assertIsNone(percentile([], 0.5))
+
+    def test_handle_modes(self):
+        """
+        Test that all modes answer path and distance requests with the distance of dijkstra().
+        """
+        server = QueryServer(self.graph)
+        expected = Dijkstra(self.graph).dijkstra(3, 500)[0]
+        for mode in ("unmodified", "modified", "bidirectional", "astar"):
+            response = server.handle(self.request(3, 500, mode=mode, id=mode))
+            self.assertEqual(response["id"], mode)
+            self.assertEqual(response["distance"], expected)
+            self.assertEqual(response["path"][0], self.graph.names[3])
+            self.assertEqual(response["path"][-1], self.graph.names[500])
+        response = server.handle(self.request(3, 500, op="distance"))
+        self.assertEqual(response, {"distance": expected})
+        stats = server.handle({"op": "stats"})
+        self.assertEqual(stats["queries"], 5)
+        self.assertLessEqual(stats["p50_ms"], stats["p99_ms"])
+
+    def test_serve_lines(self):
+        """
+        Test the JSON line protocol on streams including invalid requests.
+        """
+        server = QueryServer(self.graph)
+        lines = [
+            json.dumps(self.request(0, 1)),
+            "not json",
+            json.dumps({"source": "unknown", "target": self.graph.names[1]}),
+            json.dumps(self.request(0, 1, mode="fastest")),
+            "",
+            json.dumps({"op": "stats"}),
+        ]
+        output = io.StringIO()
+        server.serve_lines(io.StringIO("\n".join(lines) + "\n"), output)
+        responses = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(len(responses), 5)
+        self.assertIn("path", responses[0])
+        for response in responses[1:4]:
+            self.assertIn("error", response)
+        self.assertEqual(responses[4]["queries"], 1)
+
+    def test_serve_socket(self):
+        """
+        Test concurrent clients on a Unix domain socket.
+        """
+        server = QueryServer(self.graph)
+        expected = Dijkstra(self.graph).dijkstra(3, 500)[0]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "dijkstra.sock")
+            thread = threading.Thread(target=server.serve_socket, args=(path,))
+            thread.start()
+            while server.socket_server is None:
+                time.sleep(0.01)
+            results = []
+
+            def client():
+                with socket.socket(socket.AF_UNIX) as connection:
+                    connection.connect(path)
+                    stream = connection.makefile("rw")
+                    for _ in range(3):
+                        stream.write(json.dumps(self.request(3, 500, op="distance")) + "\n")
+                        stream.flush()
+                        results.append(json.loads(stream.readline())["distance"])
+
+            clients = [threading.Thread(target=client) for _ in range(4)]
+            for thread_client in clients:
+                thread_client.start()
+            for thread_client in clients:
+                thread_client.join()
+            server.shutdown()
+            thread.join()
+        self.assertEqual(results, [expected] * 12)
+        self.assertEqual(server.stats()["queries"], 12)
+
+    def test_serve_socket_existing_file(self):
+        """
+        Test that serve_socket() refuses a path that holds a regular file and keeps the file.
+        """
+        server = QueryServer(self.graph)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "graph.gra")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write("keep\n")
+            with self.assertRaises(FileExistsError):
+                server.serve_socket(path)
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual(file.read(), "keep\n")
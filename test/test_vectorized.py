@@ -0,0 +1,72 @@
+"""
+This module contains the unit tests for the vectorized SciPy backend.
+"""
+import importlib.util
+import random
+from unittest import TestCase, skipUnless
+
+import numpy as np
+
+from dijkstra.core import Dijkstra
+from dijkstra.reader import CompactGraphReader
+from dijkstra.vectorized import VectorizedDijkstra
+
+
+@skipUnless(importlib.util.find_spec("scipy"), "SciPy is not installed")
+class TestVectorized(TestCase):
+    """
+    This class is the TestCase for the VectorizedDijkstra class.
+    """
+    test_graphs = {
+        "test10": CompactGraphReader("./graphs/test10.gra").read(),
+        "deutschland2": CompactGraphReader("./graphs/deutschland2.gra").read(),
+        "berlin": CompactGraphReader("./graphs/berlin.gra").read(),
+    }
+
+    def test_dijkstra_dist_test10_all_nodes(self):
+        """
+        Test that dijkstra_dist() gives the distances of Dijkstra.dijkstra_dist() for all targets of
+        test10.gra.
+        """
+        graph = self.test_graphs["test10"]
+        dijkstra = Dijkstra(graph)
+        vectorized = VectorizedDijkstra(graph)
+        for i_target in range(graph.node_count):
+            np.testing.assert_allclose(
+                vectorized.dijkstra_dist(i_target), dijkstra.dijkstra_dist(i_target)
+            )
+
+    def test_many_dist_berlin(self):
+        """
+        Test that many_dist() gives the distances of Dijkstra.dijkstra_dist() for random targets of
+        berlin.gra.
+        """
+        graph = self.test_graphs["berlin"]
+        dijkstra = Dijkstra(graph)
+        vectorized = VectorizedDijkstra(graph)
+        rng = random.Random(0)
+        targets = [rng.randrange(graph.node_count) for _ in range(5)]
+        matrix = vectorized.many_dist(targets)
+        self.assertEqual(matrix.shape, (5, graph.node_count))
+        for row, i_target in zip(matrix, targets):
+            np.testing.assert_allclose(row, dijkstra.dijkstra_dist(i_target))
+
+    def test_forward_and_nearest_deutschland2(self):
+        """
+        Test the forward distances and the distances from the nearest of several sources for
+        deutschland2.gra against Dijkstra.one_to_many().
+        """
+        graph = self.test_graphs["deutschland2"]
+        dijkstra = Dijkstra(graph)
+        vectorized = VectorizedDijkstra(graph)
+        everything = list(range(graph.node_count))
+        sources = [0, 100, 200]
+        rows = [dijkstra.one_to_many(i_source, everything) for i_source in sources]
+        for row, i_source in zip(rows, sources):
+            np.testing.assert_allclose(vectorized.distances(i_source), row)
+        np.testing.assert_allclose(vectorized.nearest(sources), np.min(rows, axis=0))
+        distances, predecessors = vectorized.distances(0, predecessors=True)
+        self.assertEqual(predecessors[0], -1)
+        for i_node in range(graph.node_count):
+            if predecessors[i_node] >= 0:
+                self.assertLessEqual(distances[predecessors[i_node]], distances[i_node])
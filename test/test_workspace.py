@@ -0,0 +1,75 @@
+"""
+This module contains the unit tests for the reusable search workspace.
+"""
+import random
+from unittest import TestCase
+
+from dijkstra.core import Dijkstra
+from dijkstra.helpers import track_path
+from dijkstra.reader import CompactGraphReader
+from dijkstra.workspace import SearchWorkspace
+
+
+class TestWorkspace(TestCase):
+    """
+    This class is the TestCase for the SearchWorkspace and its use by the Dijkstra class.
+    """
+    test_graphs = {
+        "test10": CompactGraphReader("./graphs/test10.gra").read(),
+        "berlin": CompactGraphReader("./graphs/berlin.gra").read(),
+    }
+
+    def test_reset_restores_touched_entries(self):
+        """
+        Test that reset() restores only the touched entries to their initial values.
+        """
+        workspace = SearchWorkspace(4)
+        workspace.distances[1] = 2.0
+        workspace.predecessors[1] = 0
+        workspace.touched.append(1)
+        self.assertEqual(workspace.touched_distances(), {1: 2.0})
+        workspace.reset()
+        self.assertEqual(workspace.distances, [float("inf")] * 4)
+        self.assertEqual(workspace.predecessors, [None] * 4)
+        self.assertEqual(workspace.touched, [])
+
+    def test_workspace_test10_all_pairs(self):
+        """
+        Test that repeated queries with a workspace give the results of queries without one for
+        test10.gra.
+        """
+        graph = self.test_graphs["test10"]
+        fresh = Dijkstra(graph)
+        reused = Dijkstra(graph, workspace=True)
+        for i_source in range(graph.node_count):
+            for i_target in range(graph.node_count):
+                dist, pred, counter = fresh.dijkstra(i_source, i_target, count=True)
+                result = reused.dijkstra(i_source, i_target, count=True)
+                self.assertEqual(result[0], dist)
+                self.assertEqual(result[2], counter)
+                self.assertEqual(
+                    track_path(result[1], i_source, i_target), track_path(pred, i_source, i_target)
+                )
+
+    def test_workspace_berlin_random_queries(self):
+        """
+        Test that repeated queries with a workspace give the results of queries without one for
+        random queries on berlin.gra, including the modified weights of dijkstra_dist().
+        """
+        graph = self.test_graphs["berlin"]
+        fresh = Dijkstra(graph)
+        reused = Dijkstra(graph, workspace=True)
+        rng = random.Random(0)
+        for _ in range(10):
+            i_source = rng.randrange(graph.node_count)
+            i_target = rng.randrange(graph.node_count)
+            dist_all = fresh.dijkstra_dist(i_target)
+            dist_sparse = reused.dijkstra_dist(i_target)
+            for i_node in range(graph.node_count):
+                self.assertEqual(dist_sparse[i_node], dist_all[i_node])
+            dist, pred = fresh.dijkstra(i_source, i_target, dist_all)
+            result = reused.dijkstra(i_source, i_target, dist_all)
+            self.assertEqual(result[0], dist)
+            self.assertEqual(
+                track_path(result[1], i_source, i_target), track_path(pred, i_source, i_target)
+            )